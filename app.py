@@ -1458,7 +1458,7 @@ def show_matches():
                 # Use V1 matcher for reciprocal scoring
                 if os.getenv("OPENAI_API_KEY"):
                     generator = V1MatchGenerator()
-                    result = generator.generate_matches_for_user(user_profile['id'], top_n=10)
+                    result = generator.generate_matches_for_user(user_profile['id'], top_n=10, include_matches=False)
                 else:
                     # Fallback to hybrid if no OpenAI key
                     generator = HybridMatchGenerator()
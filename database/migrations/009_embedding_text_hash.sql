@@ -0,0 +1,13 @@
+-- Embedding Text Hash
+-- Run this in Supabase SQL Editor
+-- Date: 2026-10-16
+
+-- ============================================
+-- PROFILES: hash of the text each embedding was made from
+-- Lets generate_all_embeddings skip unchanged profiles, re-embed profiles
+-- whose text changed, and copy embeddings between profiles with identical text
+-- ============================================
+
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS embedding_text_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_embedding_text_hash ON profiles(embedding_text_hash);
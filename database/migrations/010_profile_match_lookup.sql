@@ -0,0 +1,32 @@
+-- Profile Match Lookup
+-- Run this in Supabase SQL Editor
+-- Date: 2026-10-16
+
+-- ============================================
+-- PROFILES: expression indexes for transcript-to-profile matching
+-- The name index uses the same normalization as
+-- AIProfileExtractor._normalize_name (lowercase, whitespace collapsed)
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_profiles_lower_email ON profiles (lower(email));
+
+CREATE INDEX IF NOT EXISTS idx_profiles_normalized_name
+    ON profiles (btrim(regexp_replace(lower(name), '\s+', ' ', 'g')));
+
+-- ============================================
+-- HELPER FUNCTION: Profiles sharing an email or normalized name
+-- Called by DirectoryService.find_profiles_for_matching; p_name must
+-- already be normalized
+-- ============================================
+
+CREATE OR REPLACE FUNCTION find_profiles_for_matching(
+    p_name TEXT,
+    p_email TEXT DEFAULT ''
+)
+RETURNS SETOF profiles AS $$
+    SELECT *
+    FROM profiles p
+    WHERE (p_email <> '' AND lower(p.email) = lower(p_email))
+       OR btrim(regexp_replace(lower(p.name), '\s+', ' ', 'g')) = p_name
+    ORDER BY p.name;
+$$ LANGUAGE sql STABLE;
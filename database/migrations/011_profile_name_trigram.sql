@@ -0,0 +1,51 @@
+-- Profile Name Trigram Search
+-- Run this in Supabase SQL Editor
+-- Date: 2026-10-16
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================
+-- PROFILES: trigram index on the normalized name
+-- Same expression as idx_profiles_normalized_name (migration 010)
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_profiles_name_trgm
+    ON profiles USING gin (btrim(regexp_replace(lower(name), '\s+', ' ', 'g')) gin_trgm_ops);
+
+-- ============================================
+-- HELPER FUNCTION: Fuzzy name candidates
+-- Called by DirectoryService.match_profiles_by_name; p_name must already be
+-- normalized. The % operator uses the index, with p_min_similarity as its
+-- cutoff for this transaction only. Trigram similarity runs lower than the
+-- edit-distance ratio callers score with ("jon" vs "john": 0.29 vs 0.86), so
+-- the cutoff is kept loose and the limit generous
+-- ============================================
+
+CREATE OR REPLACE FUNCTION match_profiles_by_name(
+    p_name TEXT,
+    p_min_similarity REAL DEFAULT 0.2,
+    p_limit INTEGER DEFAULT 50
+)
+RETURNS TABLE (
+    id UUID,
+    name TEXT,
+    company TEXT,
+    email TEXT,
+    similarity REAL
+) AS $$
+BEGIN
+    PERFORM set_config('pg_trgm.similarity_threshold', p_min_similarity::TEXT, true);
+
+    RETURN QUERY
+    SELECT
+        p.id,
+        p.name::TEXT,
+        p.company::TEXT,
+        p.email::TEXT,
+        similarity(btrim(regexp_replace(lower(p.name), '\s+', ' ', 'g')), p_name)
+    FROM profiles p
+    WHERE btrim(regexp_replace(lower(p.name), '\s+', ' ', 'g')) % p_name
+    ORDER BY 5 DESC, 2
+    LIMIT p_limit;
+END;
+$$ LANGUAGE plpgsql;
@@ -4,7 +4,7 @@ Handles all profile/directory database operations
 Schema v2: contacts = profiles (unified)
 """
 import pandas as pd
-from typing import List, Dict, Any, Optional, Set, Union
+from typing import List, Dict, Any, Optional, Set, Union, Iterator
 from supabase_client import get_client, get_admin_client
 
 class DirectoryService:
@@ -286,6 +286,43 @@ class DirectoryService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def create_match_suggestions(self, rows: List[Dict[str, Any]], batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Bulk create or update match suggestions, one upsert per batch.
+        Rows use create_match_suggestion's fields; a failed batch falls back
+        to per-row upserts so one bad row does not drop the rest.
+        """
+        # Postgres rejects an upsert touching the same key twice; keep the last row per pair
+        unique_rows = {}
+        for row in rows:
+            unique_rows[(row["profile_id"], row["suggested_profile_id"])] = row
+        rows = list(unique_rows.values())
+
+        created = 0
+        errors = []
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i:i + batch_size]
+            try:
+                self.client.table("match_suggestions").upsert(
+                    batch,
+                    on_conflict="profile_id,suggested_profile_id"
+                ).execute()
+                created += len(batch)
+            except Exception:
+                for row in batch:
+                    try:
+                        self.client.table("match_suggestions").upsert(
+                            row,
+                            on_conflict="profile_id,suggested_profile_id"
+                        ).execute()
+                        created += 1
+                    except Exception as e:
+                        errors.append(str(e))
+
+        if errors and not created:
+            return {"success": False, "created": 0, "error": errors[0]}
+        return {"success": True, "created": created, "errors": len(errors)}
+
     def update_match_status(self, match_id: str, status: str) -> Dict[str, Any]:
         """Update match suggestion status"""
         try:
@@ -379,6 +416,38 @@ class DirectoryService:
         except Exception:
             return set()
 
+    def get_dismissed_profile_ids_bulk(self, profile_ids: List[str], batch_size: int = 200) -> Dict[str, Set[str]]:
+        """
+        get_dismissed_profile_ids for many users at once: one paginated in_()
+        query per batch of ids instead of one query per user. Every requested
+        id gets an entry (an empty set if it has no dismissals or its batch failed).
+        """
+        dismissed = {profile_id: set() for profile_id in profile_ids}
+        ids = list(dismissed)
+        page_size = 1000  # Supabase default row limit
+
+        for i in range(0, len(ids), batch_size):
+            batch = ids[i:i + batch_size]
+            try:
+                offset = 0
+                while True:
+                    response = self.client.table("match_suggestions") \
+                        .select("profile_id, suggested_profile_id") \
+                        .in_("profile_id", batch) \
+                        .eq("status", "dismissed") \
+                        .order("id") \
+                        .range(offset, offset + page_size - 1) \
+                        .execute()
+                    for r in response.data or []:
+                        dismissed[r['profile_id']].add(r['suggested_profile_id'])
+                    if not response.data or len(response.data) < page_size:
+                        break
+                    offset += page_size
+            except Exception:
+                continue
+
+        return dismissed
+
     def dismiss_match(self, profile_id: str, suggested_profile_id: str) -> Dict[str, Any]:
         """Mark a match as dismissed (won't appear again)"""
         try:
@@ -524,12 +593,23 @@ class DirectoryService:
     # EMBEDDING OPERATIONS
     # ==========================================
 
-    def update_profile_embedding(self, profile_id: str, embedding: List[float]) -> Dict[str, Any]:
-        """Store embedding vector for a profile"""
+    def update_profile_embedding(
+        self,
+        profile_id: str,
+        embedding: List[float],
+        text_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store embedding vector for a profile, and the hash of the text it was
+        made from (see EmbeddingService.text_hash) when given
+        """
         try:
             import json
+            data = {"embedding": json.dumps(embedding)}
+            if text_hash:
+                data["embedding_text_hash"] = text_hash
             self.client.table("profiles") \
-                .update({"embedding": json.dumps(embedding)}) \
+                .update(data) \
                 .eq("id", profile_id) \
                 .execute()
             return {"success": True}
@@ -562,14 +642,122 @@ class DirectoryService:
         except Exception:
             return []
 
-    def get_all_profiles_for_matching(self, limit: int = 10000) -> List[Dict[str, Any]]:
-        """Get all profiles with their embeddings for matching"""
+    def iter_profiles(self, batch_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield every profile (all columns), batch_size at a time in id order,
+        so the directory can be processed without one huge response. A page
+        that fails raises, so callers never mistake a partial read for all of it.
+        """
+        return self._iter_profile_pages("*", lambda query: query, batch_size, raise_errors=True)
+
+    # Columns EmbeddingService.profile_to_text reads
+    EMBEDDING_TEXT_FIELDS = "id, name, company, business_focus, service_provided, status"
+
+    def iter_profiles_without_embeddings(self, chunk_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield every profile that needs an embedding, chunk_size at a time,
+        with only the columns profile_to_text uses. Pages are keyed on id
+        (id > last id seen), so profiles embedded while iterating don't shift
+        later pages. Stops early if a page fails.
+        """
+        return self._iter_profile_pages(
+            self.EMBEDDING_TEXT_FIELDS,
+            lambda query: query.is_("embedding", "null"),
+            chunk_size
+        )
+
+    def iter_profiles_with_embedding_hashes(self, chunk_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Like iter_profiles_without_embeddings, for profiles that have an
+        embedding and the hash of the text it was made from, so callers can
+        spot profiles whose text has changed since
+        """
+        return self._iter_profile_pages(
+            self.EMBEDDING_TEXT_FIELDS + ", embedding_text_hash",
+            lambda query: query.not_.is_("embedding", "null").not_.is_("embedding_text_hash", "null"),
+            chunk_size
+        )
+
+    def get_embeddings_by_text_hash(self, text_hashes: List[str], batch_size: int = 200) -> Dict[str, List[float]]:
+        """
+        Stored embeddings keyed by the hash of the text they were made from,
+        for whichever of text_hashes any profile already has. Batches that fail
+        are left out.
+        """
+        import json
+        embeddings = {}
+        hashes = list(dict.fromkeys(text_hashes))
+        page_size = 1000  # Supabase default row limit
+
+        for i in range(0, len(hashes), batch_size):
+            batch = hashes[i:i + batch_size]
+            try:
+                offset = 0
+                while True:
+                    response = self.client.table("profiles") \
+                        .select("embedding_text_hash, embedding") \
+                        .in_("embedding_text_hash", batch) \
+                        .not_.is_("embedding", "null") \
+                        .order("id") \
+                        .range(offset, offset + page_size - 1) \
+                        .execute()
+                    for r in response.data or []:
+                        if r['embedding_text_hash'] not in embeddings:
+                            try:
+                                embeddings[r['embedding_text_hash']] = json.loads(r['embedding'])
+                            except (json.JSONDecodeError, TypeError):
+                                pass
+                    if not response.data or len(response.data) < page_size:
+                        break
+                    offset += page_size
+            except Exception:
+                continue
+
+        return embeddings
+
+    def _iter_profile_pages(
+        self,
+        select_fields: str,
+        apply_filters,
+        chunk_size: int,
+        raise_errors: bool = False
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Keyset-paginated profiles (ordered by id) matching apply_filters(query).
+        A failed page ends the iteration, or is re-raised with raise_errors.
+        """
+        last_id = None
+        while True:
+            try:
+                query = apply_filters(self.client.table("profiles").select(select_fields))
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                response = query.order("id").limit(chunk_size).execute()
+            except Exception:
+                if raise_errors:
+                    raise
+                return
+            if not response.data:
+                return
+            yield response.data
+            if len(response.data) < chunk_size:
+                return
+            last_id = response.data[-1]["id"]
+
+    def get_all_profiles_for_matching(self, limit: int = 10000, parse_embeddings: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get all profiles with their embeddings for matching. Without
+        parse_embeddings, the stored JSON is left for the caller to decode
+        (no embedding_vector is set).
+        """
         try:
             response = self.client.table("profiles") \
                 .select("*") \
                 .order("name") \
                 .limit(limit) \
                 .execute()
+            if not parse_embeddings:
+                return response.data
 
             # Parse embeddings from JSON
             import json
@@ -927,6 +1115,45 @@ class DirectoryService:
         except Exception:
             return None
 
+    def find_profiles_for_matching(self, normalized_name: str, email: str = "") -> Dict[str, Any]:
+        """
+        Profiles whose email matches case-insensitively or whose normalized
+        name (lowercased, whitespace collapsed) equals normalized_name, ordered
+        by name. Served by the find_profiles_for_matching function and its
+        expression indexes (migration 010).
+        """
+        try:
+            response = self.client.rpc("find_profiles_for_matching", {
+                "p_name": normalized_name,
+                "p_email": email or ""
+            }).execute()
+            return {"success": True, "data": response.data or []}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": []}
+
+    def match_profiles_by_name(
+        self,
+        normalized_name: str,
+        min_similarity: float = 0.2,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Profiles whose normalized name is trigram-similar to normalized_name,
+        most similar first (pg_trgm similarity in "similarity"). Served by the
+        match_profiles_by_name function and its GIN index (migration 011).
+        Meant as a candidate filter: names 80% alike by edit-distance ratio
+        can score well under 0.3 on trigrams.
+        """
+        try:
+            response = self.client.rpc("match_profiles_by_name", {
+                "p_name": normalized_name,
+                "p_min_similarity": min_similarity,
+                "p_limit": limit
+            }).execute()
+            return {"success": True, "data": response.data or []}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": []}
+
     def search_profiles_fuzzy(self, name: str, company: str = None) -> List[Dict[str, Any]]:
         """Returns profiles with similarity scores for fuzzy matching"""
         try:
@@ -4,12 +4,17 @@ Converts profile text to vectors for similarity matching
 """
 import os
 import json
-from typing import List, Dict, Optional, Tuple
+import time
+import heapq
+import hashlib
+import threading
+from typing import List, Dict, Optional, Tuple, Union
 from functools import lru_cache
+import numpy as np
 
 # Optional OpenAI import
 try:
-    from openai import OpenAI
+    from openai import OpenAI, APIConnectionError
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -23,6 +28,13 @@ class EmbeddingService:
 
     MODEL = "text-embedding-3-small"  # 1536 dimensions, cheap and fast
     DIMENSIONS = 1536
+    CACHE_SIZE = 4096  # Embeddings kept per service, keyed by text hash
+    MAX_BATCH_SIZE = 2048  # Inputs per embeddings request (OpenAI limit)
+    MAX_TOKENS_PER_BATCH = 250000  # Estimated tokens per request, under OpenAI's 300k cap
+    RETRY_SPLIT_STATUSES = {400, 413}  # Request too large: retry in halves
+    RETRY_STATUSES = {429, 500, 502, 503, 504}  # Rate limited or transient: retry the same batch after a backoff
+    MAX_RETRIES = 5  # Batch retries, in place of the SDK's own
+    RETRY_BASE_DELAY = 1.0  # Seconds, doubled on each retry
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with OpenAI API key"""
@@ -34,6 +46,23 @@ class EmbeddingService:
             raise ValueError("OPENAI_API_KEY not set")
 
         self.client = OpenAI(api_key=self.api_key)
+        self._embedding_cache: Dict[bytes, List[float]] = {}  # text hash -> embedding
+        self._cache_lock = threading.Lock()  # Batches may be embedded from several threads
+
+    def _cache_key(self, text: str) -> bytes:
+        """Content hash of an (already stripped) embedding input"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def text_hash(self, text: str) -> str:
+        """Hex content hash of an embedding input, as stored next to its embedding"""
+        return self._cache_key(text.strip()).hex()
+
+    def _cache_embedding(self, key: bytes, embedding: List[float]) -> None:
+        """Remember an API embedding, evicting the oldest entry when full"""
+        with self._cache_lock:
+            if len(self._embedding_cache) >= self.CACHE_SIZE:
+                self._embedding_cache.pop(next(iter(self._embedding_cache)))
+            self._embedding_cache[key] = embedding
 
     def profile_to_text(self, profile: Dict) -> str:
         """Convert profile data to text for embedding"""
@@ -62,59 +91,138 @@ class EmbeddingService:
         if not text or not text.strip():
             return [0.0] * self.DIMENSIONS
 
+        text = text.strip()
+        key = self._cache_key(text)
+        cached = self._embedding_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.embeddings.create(
                 model=self.MODEL,
-                input=text.strip()
+                input=text
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            self._cache_embedding(key, embedding)
+            return embedding
         except Exception as e:
             print(f"Embedding error: {e}")
             return [0.0] * self.DIMENSIONS
 
-    def get_embeddings_batch(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
-        """Get embeddings for multiple texts in batches"""
-        all_embeddings = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            # Filter empty strings
-            batch = [t.strip() if t else "" for t in batch]
+    def estimate_tokens(self, text: str) -> int:
+        """Rough token count (about 4 characters per token; 3 leaves headroom)"""
+        return len(text) // 3 + 1
 
+    def pack_batches(self, texts: List[str], max_batch_size: Optional[int] = None) -> List[List[int]]:
+        """
+        Greedily pack texts, in order, into as few requests as the provider
+        limits allow. Returns each batch as a list of indexes into texts.
+        """
+        max_size = min(max_batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = self.estimate_tokens(text)
+            if batch and (len(batch) >= max_size or batch_tokens + tokens > self.MAX_TOKENS_PER_BATCH):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(i)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        One embeddings request, split in half and retried if the provider
+        rejects its size, and retried whole with exponential backoff if rate
+        limited or on a transient error. The SDK's own retries are turned off
+        here, so a batch is sent at most MAX_RETRIES + 1 times.
+        """
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(self.MAX_RETRIES + 1):
             try:
-                response = self.client.embeddings.create(
+                response = client.embeddings.create(
                     model=self.MODEL,
-                    input=batch
+                    input=texts
                 )
                 # Extract embeddings in order
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
+                return [item.embedding for item in response.data]
             except Exception as e:
+                status = getattr(e, 'status_code', None)
+                transient = status in self.RETRY_STATUSES or isinstance(e, APIConnectionError)
+                if transient and attempt < self.MAX_RETRIES:
+                    time.sleep(self.RETRY_BASE_DELAY * (2 ** attempt))
+                    continue
+                if len(texts) > 1 and status in self.RETRY_SPLIT_STATUSES:
+                    mid = len(texts) // 2
+                    return self._request_embeddings(texts[:mid]) + self._request_embeddings(texts[mid:])
                 print(f"Batch embedding error: {e}")
                 # Return zero vectors for failed batch
-                all_embeddings.extend([[0.0] * self.DIMENSIONS] * len(batch))
+                return [[0.0] * self.DIMENSIONS for _ in texts]
 
-        return all_embeddings
-
-    def get_profile_embedding(self, profile: Dict) -> List[float]:
-        """Get embedding for a profile"""
+    def get_embeddings_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        return_numpy: bool = False
+    ) -> Union[List[List[float]], np.ndarray]:
+        """
+        Get embeddings for multiple texts in batches (pack_batches sizes them
+        to the provider limits; batch_size optionally caps them further).
+        Texts embedded before (by content hash) are served from the cache, and
+        each distinct uncached text is sent to the API once. With return_numpy,
+        returns one (len(texts), DIMENSIONS) float32 array instead of lists.
+        """
+        # Filter empty strings
+        texts = [t.strip() if t else "" for t in texts]
+        keys = [self._cache_key(t) for t in texts]
+        resolved = {}
+        for key in keys:
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                resolved[key] = cached
+        missing = list({k: t for k, t in zip(keys, texts) if k not in resolved}.items())
+
+        for batch in self.pack_batches([t for _, t in missing], batch_size):
+            batch_keys = [missing[i][0] for i in batch]
+            embeddings = self._request_embeddings([missing[i][1] for i in batch])
+            for key, embedding in zip(batch_keys, embeddings):
+                resolved[key] = embedding
+                if any(embedding):
+                    self._cache_embedding(key, embedding)
+
+        if return_numpy:
+            if not keys:
+                return np.zeros((0, self.DIMENSIONS), dtype=np.float32)
+            return np.array([resolved[k] for k in keys], dtype=np.float32)
+        return [resolved[k] for k in keys]
+
+    def get_profile_embedding(self, profile: Dict, return_numpy: bool = False) -> Union[List[float], np.ndarray]:
+        """Get embedding for a profile (as a float32 array with return_numpy)"""
         text = self.profile_to_text(profile)
-        return self.get_embedding(text)
+        embedding = self.get_embedding(text)
+        return np.asarray(embedding, dtype=np.float32) if return_numpy else embedding
 
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        if not vec1 or not vec2:
+        """Calculate cosine similarity between two vectors (lists or arrays)"""
+        if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec2) == 0:
             return 0.0
 
-        # Manual calculation to avoid numpy dependency
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
+        # float64 whether given lists or float32 arrays
+        vec1 = np.asarray(vec1, dtype=np.float64)
+        vec2 = np.asarray(vec2, dtype=np.float64)
+        norm1 = np.linalg.norm(vec1)
+        norm2 = np.linalg.norm(vec2)
 
         if norm1 == 0 or norm2 == 0:
             return 0.0
 
-        return dot_product / (norm1 * norm2)
+        # Vectors of different dimensions are compared over their common prefix
+        n = min(len(vec1), len(vec2))
+        return float(np.dot(vec1[:n], vec2[:n]) / (norm1 * norm2))
 
     def calculate_semantic_similarity(
         self,
@@ -128,8 +236,12 @@ class EmbeddingService:
         Returns value between 0 and 1.
         """
         # Use provided embeddings or generate new ones
-        emb1 = profile1_embedding or self.get_profile_embedding(profile1)
-        emb2 = profile2_embedding or self.get_profile_embedding(profile2)
+        emb1 = profile1_embedding
+        if emb1 is None or len(emb1) == 0:
+            emb1 = self.get_profile_embedding(profile1)
+        emb2 = profile2_embedding
+        if emb2 is None or len(emb2) == 0:
+            emb2 = self.get_profile_embedding(profile2)
 
         similarity = self.cosine_similarity(emb1, emb2)
 
@@ -168,10 +280,8 @@ class EmbeddingService:
             score = max(0.0, min(100.0, similarity * 100))
             similarities.append((candidate, score))
 
-        # Sort by similarity (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        return similarities[:top_n]
+        # Top n by similarity (highest first, ties in candidate order)
+        return heapq.nlargest(top_n, similarities, key=lambda x: x[1])
 
 
 def embedding_to_json(embedding: List[float]) -> str:
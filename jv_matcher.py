@@ -6,7 +6,7 @@ Extracts profiles from meeting transcripts and matches people for joint ventures
 import os
 import json
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Set
 from datetime import datetime
 import zipfile
 from pathlib import Path
@@ -139,20 +139,29 @@ class JVMatcher:
         sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
         return [word for word, freq in sorted_words]
     
-    def find_matches(self, target_profile: Dict, all_profiles: List[Dict], top_n: int = 10) -> List[Dict]:
+    def find_matches(
+        self,
+        target_profile: Dict,
+        all_profiles: List[Dict],
+        top_n: int = 10,
+        keyword_sets: Optional[List[Set[str]]] = None
+    ) -> List[Dict]:
         """
         Find best JV partner matches for a target profile
         Returns list of matched profiles with match scores and reasons
+
+        keyword_sets, if given, holds each profile's keywords as a set (aligned
+        with all_profiles) so callers matching many targets build them once.
         """
         matches = []
         target_keywords = set(target_profile.get('keywords', []))
+        if keyword_sets is None:
+            keyword_sets = [set(profile.get('keywords', [])) for profile in all_profiles]
         
-        for profile in all_profiles:
+        for profile, profile_keywords in zip(all_profiles, keyword_sets):
             if profile['name'] == target_profile['name']:
                 continue  # Skip self
-            
-            profile_keywords = set(profile.get('keywords', []))
-            
+
             # Calculate similarity score (simple keyword overlap)
             # In production, use semantic similarity (embeddings, etc.)
             common_keywords = target_keywords.intersection(profile_keywords)
@@ -242,8 +251,12 @@ class JVMatcher:
         reports_dir = self.output_dir / f"reports_{timestamp}"
         reports_dir.mkdir(exist_ok=True)
         
+        # Keyword sets are built once for all targets, not once per pair
+        keyword_sets = [set(summary.get('keywords', [])) for summary in profile_summaries]
         for profile_summary in profile_summaries:
-            matches = self.find_matches(profile_summary, profile_summaries, top_n=matches_per_person)
+            matches = self.find_matches(
+                profile_summary, profile_summaries, top_n=matches_per_person, keyword_sets=keyword_sets
+            )
             
             # Generate report
             safe_name = re.sub(r'[^\w\s-]', '', profile_summary['name']).strip().replace(' ', '_')
@@ -8,8 +8,17 @@ Supports three modes:
 import os
 import json
 import re
-from typing import List, Dict, Set, Tuple, Optional, Any, Union
+import heapq
+import time
+import hashlib
+import logging
+import functools
+from collections import defaultdict
+from itertools import islice
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional, Any, Union, Iterator
+import numpy as np
 from directory_service import DirectoryService
+from supabase_client import execute_with_retry
 
 # Import rich match service for AI-powered analysis
 try:
@@ -25,26 +34,59 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Optional Numba import for the compiled keyword pre-scoring kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns for the keyword and AI-response hot paths
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_JSON_FENCE_RE = re.compile(r'```json\s*')
+_PLAIN_FENCE_RE = re.compile(r'```\s*')
+_TRAILING_COMMA_RE = re.compile(r',\s*([\]}])')
+_MULTI_SPACE_RE = re.compile(r'  +')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Control characters other than tab, LF and CR, deleted by str.translate
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20)])
+
 
 def clean_json_string(text):
     """Clean common JSON formatting issues from AI responses"""
-    text = re.sub(r'```json\s*', '', text)
-    text = re.sub(r'```\s*', '', text)
-    text = re.sub(r',\s*]', ']', text)
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
-    lines = text.split('\n')
-    text = ' '.join(lines)
-    text = re.sub(r'  +', ' ', text)
+    # Most responses have no code fence, so the fence patterns only run
+    # when one is present; control characters go in one translate pass
+    if '```' in text:
+        text = _JSON_FENCE_RE.sub('', text)
+        text = _PLAIN_FENCE_RE.sub('', text)
+    text = _TRAILING_COMMA_RE.sub(r'\1', text)
+    text = text.translate(_CTRL_TABLE)
+    text = text.replace('\n', ' ')
+    text = _MULTI_SPACE_RE.sub(' ', text)
     return text
 
 
-def extract_json_array(text):
-    """Extract JSON array from AI response text"""
-    start = text.find('[')
-    end = text.rfind(']')
+def _extract_json(text, open_char, close_char):
+    """Extract the JSON value opened by the first open_char from AI response text"""
+    start = text.find(open_char)
+    if start == -1:
+        return None
 
-    if start != -1 and end != -1 and end > start:
+    # Well-formed output decodes straight from the first opener in one pass;
+    # anything else goes through the cleanup passes below
+    try:
+        return _JSON_DECODER.raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        pass
+
+    end = text.rfind(close_char)
+
+    if end > start:
         json_str = text[start:end + 1]
         json_str = clean_json_string(json_str)
         try:
@@ -53,9 +95,9 @@ def extract_json_array(text):
             pass
 
     # Try more aggressive cleaning
-    if start != -1 and end != -1:
+    if end > start:
         json_str = text[start:end + 1]
-        json_str = re.sub(r'\s+', ' ', json_str)
+        json_str = _WHITESPACE_RE.sub(' ', json_str)
         json_str = clean_json_string(json_str)
         try:
             return json.loads(json_str)
@@ -65,21 +107,308 @@ def extract_json_array(text):
     return None
 
 
+def extract_json_array(text):
+    """Extract JSON array from AI response text"""
+    return _extract_json(text, '[', ']')
+
+
+def extract_json_object(text):
+    """Extract JSON object from AI response text"""
+    return _extract_json(text, '{', '}')
+
+
+class _ProgressPrinter:
+    """
+    Prints a progress line at most once per interval seconds (and always on
+    the last item when total is known), so long runs don't spend their time
+    writing to stdout. template is formatted with done and total.
+    """
+
+    def __init__(self, template: str, total: Optional[int], interval: float = 1.0):
+        self.template = template
+        self.total = total
+        self.interval = interval
+        self._last = time.monotonic()
+
+    def update(self, done: int) -> None:
+        now = time.monotonic()
+        if (self.total is not None and done >= self.total) or now - self._last >= self.interval:
+            self._last = now
+            print(self.template.format(done=done, total=self.total))
+
+
+def _has_embedding(vector: Optional[Union[List[float], np.ndarray]]) -> bool:
+    """True for a non-empty embedding list or array (arrays have no truth value)"""
+    return vector is not None and len(vector) > 0
+
+
+# Set bits in each byte value, for popcounts on NumPy < 2.0
+_BYTE_POPCOUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits in each element of an unsigned integer array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    byte_view = values.view(np.uint8).reshape(values.shape + (values.itemsize,))
+    return _BYTE_POPCOUNTS[byte_view].sum(axis=-1)
+
+
+def _prescore_survivors_kernel(
+    posting_ptr, posting_ids, target_terms, target_keyword_count, target_category_mask,
+    target_category_count, keyword_counts, category_masks, category_counts, byte_popcounts, threshold
+):
+    """
+    MatchGenerator._prescore_candidates >= threshold as one fused loop (no
+    per-target temporaries): counts the target's keyword posting lists (CSR
+    rows of posting_ids), then scores each candidate and keeps its position
+    and score if it reaches threshold. Compiled with Numba when it is installed.
+    """
+    size = keyword_counts.shape[0]
+    common = np.zeros(size, dtype=np.float64)
+    for term in target_terms:
+        for p in range(posting_ptr[term], posting_ptr[term + 1]):
+            common[posting_ids[p]] += 1.0
+
+    survivors = np.empty(size, dtype=np.int64)
+    scores = np.empty(size, dtype=np.float64)
+    found = 0
+    for i in range(size):
+        common_categories = float(byte_popcounts[category_masks[i] & target_category_mask])
+        keyword_union = max(target_keyword_count + keyword_counts[i] - common[i], 1.0)
+        category_union = max(target_category_count + category_counts[i] - common_categories, 1.0)
+        score = (common_categories / category_union * 0.6 + common[i] / keyword_union * 0.4) * 100
+        if score >= threshold:
+            survivors[found] = i
+            scores[found] = score
+            found += 1
+    return survivors[:found], scores[:found]
+
+
+# Serial on purpose: generate_all_matches already runs one worker process per core
+if NUMBA_AVAILABLE:
+    _prescore_survivors_kernel = njit(cache=True, nogil=True)(_prescore_survivors_kernel)
+
+
+def _build_word_categories(category_keywords: Dict[str, FrozenSet[str]], category_bits: Dict[str, int]) -> Dict[str, int]:
+    """Map each category keyword to the mask of every category it belongs to"""
+    word_categories = {}
+    for category, cat_keywords in category_keywords.items():
+        for kw in cat_keywords:
+            word_categories[kw] = word_categories.get(kw, 0) | category_bits[category]
+    return word_categories
+
+
+def _build_category_sets(category_bits: Dict[str, int]) -> Tuple[FrozenSet[str], ...]:
+    """Category name set for every category mask, indexed by the mask"""
+    return tuple(
+        frozenset(category for category, bit in category_bits.items() if mask & bit)
+        for mask in range(1 << len(category_bits))
+    )
+
+
+def _collaboration_matrix(
+    templates: Dict[Tuple[str, str], str], category_bits: Dict[str, int]
+) -> List[List[Optional[str]]]:
+    """
+    (category, category) collaboration templates as a symmetric matrix indexed
+    by the categories' bit positions (None where no template applies). A pair
+    listed in both orders keeps the (target, match) template.
+    """
+    size = len(category_bits)
+    matrix: List[List[Optional[str]]] = [[None] * size for _ in range(size)]
+    for (first, second), text in templates.items():
+        matrix[category_bits[first].bit_length() - 1][category_bits[second].bit_length() - 1] = text
+    for (first, second), text in templates.items():
+        row = category_bits[second].bit_length() - 1
+        col = category_bits[first].bit_length() - 1
+        if matrix[row][col] is None:
+            matrix[row][col] = text
+    return matrix
+
+
+# MatchGenerator.generate_all_matches run state inside a forked pool worker.
+# Only ever set in the child, by _init_keyword_worker; never read in-process.
+_KEYWORD_POOL_STATE: Dict[str, Any] = {}
+
+
+def _init_keyword_worker(run: Tuple) -> None:
+    """ProcessPoolExecutor initializer: keep the run state in the worker"""
+    _KEYWORD_POOL_STATE['run'] = run
+
+
+def _score_keyword_worker_chunk(target_indexes: List[int]) -> List[List[Tuple[str, float, str]]]:
+    """_score_keyword_targets in a pool worker, on the run set by its initializer"""
+    return _score_keyword_targets(_KEYWORD_POOL_STATE['run'], target_indexes)
+
+
+def _score_keyword_targets(run: Tuple, target_indexes: List[int]) -> List[List[Tuple[str, float, str]]]:
+    """
+    Score a chunk of generate_all_matches targets. run is (matcher,
+    target_profiles, candidate_signals, signal_index, top_n, min_score).
+    Returns, per target, (suggested_profile_id, score, reason).
+    """
+    matcher, target_profiles, candidate_signals, signal_index, top_n, min_score = run
+    results = []
+    for i in target_indexes:
+        target = target_profiles[i]
+        target_keywords, target_categories = matcher._compute_profile_signals(target)
+        matches = matcher._generate_matches_from_signals(
+            target, target_keywords, target_categories, candidate_signals,
+            top_n=top_n, min_score=min_score, signal_index=signal_index
+        )
+        results.append([(m['profile']['id'], m['score'], m['reason']) for m in matches])
+    return results
+
+
+# HybridMatchGenerator.generate_all_matches run state inside a forked pool
+# worker. Only ever set in the child, by _init_hybrid_worker; never read in-process.
+_HYBRID_POOL_STATE: Dict[str, Any] = {}
+
+
+def _init_hybrid_worker(
+    run: Tuple,
+    positions: Optional[Dict[str, int]] = None,
+    similarities: Optional[List[Any]] = None
+) -> None:
+    """
+    ProcessPoolExecutor initializer: keep the run state in the worker, plus
+    candidate positions and per-target similarities for candidate-slice runs
+    """
+    _HYBRID_POOL_STATE['run'] = run
+    _HYBRID_POOL_STATE['positions'] = positions
+    _HYBRID_POOL_STATE['similarities'] = similarities
+
+
+def _score_hybrid_worker_chunk(target_indexes: List[int]) -> List[List[Tuple[str, float, str]]]:
+    """_score_hybrid_targets in a pool worker, on the run set by its initializer"""
+    return _score_hybrid_targets(_HYBRID_POOL_STATE['run'], target_indexes)
+
+
+def _score_hybrid_targets(run: Tuple, target_indexes: List[int]) -> List[List[Tuple[str, float, str]]]:
+    """
+    Score a chunk of hybrid generate_all_matches targets. run is (generator,
+    target_profiles, all_profiles, embedding_matrix, dismissed_by_target,
+    top_n, min_score). Returns, per target, (suggested_profile_id, score, reason).
+    """
+    generator, target_profiles, all_profiles, embedding_matrix, dismissed_by_target, top_n, min_score = run
+    targets = [target_profiles[i] for i in target_indexes]
+    results = []
+    for target, similarities in zip(targets, generator._iter_block_similarities(targets, embedding_matrix)):
+        matches = generator.generate_matches_for_profile(
+            target, all_profiles, top_n=top_n, min_score=min_score,
+            dismissed_ids=dismissed_by_target.get(target['id']),
+            embedding_matrix=embedding_matrix, similarities=similarities
+        )
+        results.append([(m['profile']['id'], m['score'], m['reason']) for m in matches])
+    return results
+
+
+def _score_hybrid_candidate_chunk(task: Tuple[int, int, int]) -> List[Tuple[float, int, str, str]]:
+    """
+    Score one hybrid generate_all_matches target against the candidate slice
+    all_profiles[start:end], in a pool worker set up by _init_hybrid_worker.
+    Returns that slice's top matches as (score, candidate position,
+    suggested_profile_id, reason).
+    """
+    target_index, start, end = task
+    generator, target_profiles, all_profiles, embedding_matrix, dismissed_by_target, top_n, min_score = \
+        _HYBRID_POOL_STATE['run']
+    positions = _HYBRID_POOL_STATE['positions']
+    target = target_profiles[target_index]
+    matches = generator.generate_matches_for_profile(
+        target, all_profiles[start:end], top_n=top_n, min_score=min_score,
+        dismissed_ids=dismissed_by_target.get(target['id']),
+        embedding_matrix=embedding_matrix,
+        similarities=_HYBRID_POOL_STATE['similarities'][target_index]
+    )
+    return [(m['score'], positions[m['profile']['id']], m['profile']['id'], m['reason']) for m in matches]
+
+
+# Profiles are mostly static, so the same texts are tokenized across targets,
+# runs and generators; both helpers are pure and return immutable sets.
+@functools.lru_cache(maxsize=50_000)
+def _keywords_for_text(text: str) -> FrozenSet[str]:
+    """Keywords in already-lowercased text, minus MatchGenerator.STOP_WORDS"""
+    # Dedupe first, then drop stop words with one C-level set difference
+    return frozenset(_WORD_RE.findall(text)) - MatchGenerator.STOP_WORDS
+
+
+@functools.lru_cache(maxsize=50_000)
+def _categories_for_keywords(keywords: FrozenSet[str]) -> FrozenSet[str]:
+    """MatchGenerator.CATEGORY_KEYWORDS categories matched by a keyword set"""
+    # One dict lookup per keyword ORs together the categories it implies;
+    # the mask then indexes the prebuilt category sets
+    word_categories = MatchGenerator._WORD_CATEGORY_BITS
+    mask = 0
+    for kw in keywords:
+        mask |= word_categories.get(kw, 0)
+    return MatchGenerator._CATEGORY_SETS[mask]
+
+
+# Set bits in a non-negative int (int.bit_count before Python 3.10)
+_bit_count = getattr(int, 'bit_count', None) or (lambda value: bin(value).count('1'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _category_mask(categories: FrozenSet[str]) -> int:
+    """MatchGenerator._CATEGORY_BITS mask of a category set (unknown names ignored)"""
+    category_bits = MatchGenerator._CATEGORY_BITS
+    mask = 0
+    for category in categories:
+        mask |= category_bits.get(category, 0)
+    return mask
+
+
+def _category_jaccard(categories1: Set[str], categories2: Set[str]) -> float:
+    """|A ∩ B| / |A ∪ B| of two category sets, intersecting their bitmasks"""
+    if not isinstance(categories1, frozenset):
+        categories1 = frozenset(categories1)
+    if not isinstance(categories2, frozenset):
+        categories2 = frozenset(categories2)
+    common = _bit_count(_category_mask(categories1) & _category_mask(categories2))
+    return common / max(len(categories1) + len(categories2) - common, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _collaboration_idea_for_masks(target_mask: int, match_mask: int) -> str:
+    """
+    MatchGenerator.generate_collaboration_idea on category bitmasks: set bits
+    are visited lowest first (CATEGORY_KEYWORDS order), so the first template
+    found is the same on every run. At most 256 x 256 mask pairs exist.
+    """
+    matrix = MatchGenerator._COLLABORATION_MATRIX
+    remaining = target_mask
+    while remaining:
+        t_bit = remaining & -remaining
+        row = matrix[t_bit.bit_length() - 1]
+        others = match_mask
+        while others:
+            m_bit = others & -others
+            idea = row[m_bit.bit_length() - 1]
+            if idea:
+                return idea
+            others ^= m_bit
+        remaining ^= t_bit
+    return "Cross-promotion to complementary audiences"
+
+
 class MatchGenerator:
     """Generate JV partner matches from database profiles"""
 
     # Business-related stop words to filter out
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
         'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
         'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
         'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
         'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
         'service', 'provider', 'services', 'member', 'non', 'resource'
-    }
+    })
 
-    # High-value matching categories
-    CATEGORY_KEYWORDS = {
+    # High-value matching categories (frozen for hash membership tests;
+    # get_categories goes through the word -> category masks built below)
+    CATEGORY_KEYWORDS = {category: frozenset(words) for category, words in {
         'health': ['health', 'wellness', 'medical', 'fitness', 'natural', 'traditional', 'mental'],
         'business': ['business', 'entrepreneur', 'startup', 'consulting', 'coaching', 'marketing'],
         'finance': ['finance', 'financial', 'money', 'investment', 'wealth', 'accounting'],
@@ -88,7 +417,11 @@ class MatchGenerator:
         'relationships': ['relationship', 'relationships', 'dating', 'marriage', 'family'],
         'content': ['podcast', 'speaking', 'author', 'book', 'content', 'media', 'video'],
         'tech': ['technology', 'software', 'digital', 'online', 'internet', 'website', 'app']
-    }
+    }.items()}
+    # One bit per category; all eight fit in a uint8 per profile
+    _CATEGORY_BITS = {category: 1 << i for i, category in enumerate(CATEGORY_KEYWORDS)}
+    _WORD_CATEGORY_BITS = _build_word_categories(CATEGORY_KEYWORDS, _CATEGORY_BITS)
+    _CATEGORY_SETS = _build_category_sets(_CATEGORY_BITS)
 
     # Collaboration templates based on category combinations
     COLLABORATION_TEMPLATES = {
@@ -101,40 +434,50 @@ class MatchGenerator:
         ('relationships', 'personal_dev'): "Personal growth coaching partnership",
         ('spirituality', 'health'): "Holistic wellness retreat collaboration",
     }
+    _COLLABORATION_MATRIX = _collaboration_matrix(COLLABORATION_TEMPLATES, _CATEGORY_BITS)
+
+    # generate_match_reason wording by score tier (below 50, 50+, 70+)
+    MATCH_REASON_TIERS = (
+        "Common interests in {}. Worth exploring partnership opportunities.",
+        "Shared focus on {}. Good potential for collaboration.",
+        "Strong alignment in {}. Highly compatible for joint ventures.",
+    )
+
+    SAVE_BATCH_SIZE = 500  # match_suggestions rows per bulk upsert
+    PARALLEL_MIN_TARGETS = 500  # Smaller runs are scored in-process
+    PARALLEL_CHUNK_SIZE = 100  # Targets per worker task
+
+    # On-disk copy of each profile's keywords, reused across runs while its text is unchanged
+    SIGNAL_CACHE_PATH = os.getenv('JV_SIGNAL_CACHE_PATH', os.path.join('.jv_matcher_cache', 'keyword_signals.json'))
 
     def __init__(self):
         self.directory_service = DirectoryService(use_admin=True)
+        self._signals_cache: Dict[str, Tuple[Set[str], Set[str]]] = {}  # profile_id -> (keywords, categories) (per run)
+        self._signal_texts: Dict[Tuple[Optional[str], ...], str] = {}  # signal fields -> lowercased text (per run)
 
     def extract_keywords(self, text: str) -> Set[str]:
         """Extract meaningful keywords from text"""
-        if not text:
+        if not text or text.isspace():
             return set()
+        return self._keywords_from_lower(text.lower())
 
-        # Normalize and extract words
-        text = text.lower()
-        words = re.findall(r'\b[a-z]{3,}\b', text)
+    def _keywords_from_lower(self, text: str) -> FrozenSet[str]:
+        """extract_keywords for text that is already lowercased (cached by text)"""
+        return _keywords_for_text(text)
 
-        # Filter stop words and return unique keywords
-        keywords = {w for w in words if w not in self.STOP_WORDS}
-        return keywords
-
-    def get_categories(self, keywords: Set[str]) -> Set[str]:
+    def get_categories(self, keywords: Set[str]) -> FrozenSet[str]:
         """Identify which business categories a profile belongs to"""
-        categories = set()
-        for category, cat_keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in keywords for kw in cat_keywords):
-                categories.add(category)
-        return categories
+        if not isinstance(keywords, frozenset):
+            keywords = frozenset(keywords)
+        return _categories_for_keywords(keywords)
 
     def generate_collaboration_idea(self, target_categories: Set[str], match_categories: Set[str]) -> str:
         """Generate specific collaboration suggestion based on categories"""
-        for t_cat in target_categories:
-            for m_cat in match_categories:
-                if (t_cat, m_cat) in self.COLLABORATION_TEMPLATES:
-                    return self.COLLABORATION_TEMPLATES[(t_cat, m_cat)]
-                if (m_cat, t_cat) in self.COLLABORATION_TEMPLATES:
-                    return self.COLLABORATION_TEMPLATES[(m_cat, t_cat)]
-        return "Cross-promotion to complementary audiences"
+        if not isinstance(target_categories, frozenset):
+            target_categories = frozenset(target_categories)
+        if not isinstance(match_categories, frozenset):
+            match_categories = frozenset(match_categories)
+        return _collaboration_idea_for_masks(_category_mask(target_categories), _category_mask(match_categories))
 
     def calculate_match_score(
         self,
@@ -147,51 +490,148 @@ class MatchGenerator:
         Calculate match score between two profiles
         Returns (score 0-100, list of common keywords)
         """
-        # Keyword overlap
+        # Keyword overlap (|A ∪ B| = |A| + |B| - |A ∩ B|, no union set built)
         common_keywords = profile1_keywords.intersection(profile2_keywords)
-        keyword_score = len(common_keywords) / max(len(profile1_keywords | profile2_keywords), 1)
+        keyword_score = len(common_keywords) / max(len(profile1_keywords) + len(profile2_keywords) - len(common_keywords), 1)
 
-        # Category overlap (weighted higher)
-        common_categories = profile1_categories.intersection(profile2_categories)
-        category_score = len(common_categories) / max(len(profile1_categories | profile2_categories), 1)
+        # Category overlap (weighted higher), as one AND of category bitmasks
+        category_score = _category_jaccard(profile1_categories, profile2_categories)
 
         # Combined score (categories weighted 60%, keywords 40%)
         combined_score = (category_score * 0.6 + keyword_score * 0.4) * 100
 
-        return round(combined_score, 1), list(common_keywords)[:5]
+        return round(combined_score, 1), list(islice(common_keywords, 5))
+
+    def _signal_text(self, profile: Dict) -> str:
+        """
+        Lowercased business_focus, service_provided and company, as tokenized
+        for signals. Memoized by those field values, since the cache hash,
+        tokenizer and hybrid scoring all read it; the profile is not modified.
+        """
+        fields = (profile.get('business_focus'), profile.get('service_provided'), profile.get('company'))
+        text = self._signal_texts.get(fields)
+        if text is None:
+            text = ' '.join(field for field in fields if field).lower()
+            self._signal_texts[fields] = text
+        return text
+
+    def extract_profile_signals(self, profile: Dict) -> Tuple[Set[str], Set[str]]:
+        """Keywords and categories from a profile's business_focus, service_provided and company"""
+        # Join and lowercase once, then tokenize the lowered text directly
+        text = self._signal_text(profile)
+        # Profiles with no text have nothing to tokenize or categorize
+        if not text or text.isspace():
+            return set(), frozenset()
+        keywords = self._keywords_from_lower(text)
+        return keywords, self.get_categories(keywords)
+
+    def _compute_profile_signals(self, profile: Dict) -> Tuple[Set[str], Set[str]]:
+        """extract_profile_signals memoized by profile id for the current run"""
+        signals = self._signals_cache.get(profile['id'])
+        if signals is None:
+            signals = self.extract_profile_signals(profile)
+            self._signals_cache[profile['id']] = signals
+        return signals
+
+    def _prime_signals_cache(self, profiles: List[Dict]) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Fill _signals_cache from SIGNAL_CACHE_PATH for every profile whose
+        signal text hashes the same as when it was cached (by the same
+        tokenizer rules), so only new or edited profiles are tokenized this run. Returns the cache entries to
+        write back ({profile_id: (text hash, keywords)}), or {} if every
+        profile was served from an up-to-date cache.
+        """
+        try:
+            with open(self.SIGNAL_CACHE_PATH, 'r') as f:
+                data = json.load(f)
+            # Keywords tokenized with other rules are stale for every profile
+            cached = data['profiles'] if data.get('version') == self._signal_cache_version() else {}
+        except FileNotFoundError:
+            cached = {}
+        except Exception as e:
+            logger.warning("Could not load keyword signal cache: %s", e)
+            cached = {}
+
+        entries = {}
+        missed = False
+        for profile in profiles:
+            key = hashlib.blake2b(self._signal_text(profile).encode('utf-8'), digest_size=16).hexdigest()
+            hit = cached.get(profile['id'])
+            if hit is not None and hit[0] == key:
+                keywords = frozenset(hit[1])
+                self._signals_cache[profile['id']] = (keywords, self.get_categories(keywords))
+                entries[profile['id']] = hit
+            else:
+                keywords, _ = self._compute_profile_signals(profile)
+                entries[profile['id']] = (key, sorted(keywords))
+                missed = True
+
+        # Rewrite when anything was tokenized or cached profiles have gone
+        if missed or len(entries) != len(cached):
+            return entries
+        return {}
+
+    def _signal_cache_version(self) -> str:
+        """
+        Hash of the tokenizer rules (_WORD_RE and STOP_WORDS) behind cached
+        keywords; categories are derived from the keywords after loading
+        """
+        rules = json.dumps([_WORD_RE.pattern, sorted(self.STOP_WORDS)])
+        return hashlib.blake2b(rules.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _save_signal_cache(self, entries: Dict[str, Tuple[str, List[str]]]) -> None:
+        """Write _prime_signals_cache entries to SIGNAL_CACHE_PATH (atomically replaced)"""
+        if not entries:
+            return
+        try:
+            cache_dir = os.path.dirname(self.SIGNAL_CACHE_PATH)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{self.SIGNAL_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': self._signal_cache_version(), 'profiles': entries}, f)
+            os.replace(tmp_path, self.SIGNAL_CACHE_PATH)
+        except Exception as e:
+            logger.warning("Could not save keyword signal cache: %s", e)
 
     def calculate_mutual_score(self, profile1: Dict, profile2: Dict) -> Tuple[float, List[str], str]:
         """Calculate mutual match score (both directions) and collaboration idea"""
-        # Get text and keywords for both profiles
-        text1 = ' '.join(filter(None, [
-            profile1.get('business_focus', ''),
-            profile1.get('service_provided', ''),
-            profile1.get('company', '')
-        ]))
-        keywords1 = self.extract_keywords(text1)
-        categories1 = self.get_categories(keywords1)
-
-        text2 = ' '.join(filter(None, [
-            profile2.get('business_focus', ''),
-            profile2.get('service_provided', ''),
-            profile2.get('company', '')
-        ]))
-        keywords2 = self.extract_keywords(text2)
-        categories2 = self.get_categories(keywords2)
-
-        # Calculate score A->B
-        score_ab, common_keywords_ab = self.calculate_match_score(
-            keywords1, keywords2, categories1, categories2
-        )
+        keywords1, categories1 = self.extract_profile_signals(profile1)
+        keywords2, categories2 = self.extract_profile_signals(profile2)
+        return self._score_pair(keywords1, categories1, keywords2, categories2)
 
-        # Calculate score B->A
-        score_ba, common_keywords_ba = self.calculate_match_score(
-            keywords2, keywords1, categories2, categories1
-        )
+    def _pair_score(
+        self,
+        keywords1: Set[str],
+        categories1: Set[str],
+        keywords2: Set[str],
+        categories2: Set[str]
+    ) -> float:
+        """_score_pair's score alone: no common keyword list or collaboration idea"""
+        if keywords1.isdisjoint(keywords2) and categories1.isdisjoint(categories2):
+            return 0.0
+        common = len(keywords1.intersection(keywords2))
+        keyword_score = common / max(len(keywords1) + len(keywords2) - common, 1)
+        category_score = _category_jaccard(categories1, categories2)
+        return round((category_score * 0.6 + keyword_score * 0.4) * 100, 1)
 
-        # Use average score and combined keywords
-        mutual_score = round((score_ab + score_ba) / 2, 1)
-        common_keywords = list(set(common_keywords_ab + common_keywords_ba))[:5]
+    def _score_pair(
+        self,
+        keywords1: Set[str],
+        categories1: Set[str],
+        keywords2: Set[str],
+        categories2: Set[str]
+    ) -> Tuple[float, List[str], str]:
+        """calculate_mutual_score on pre-extracted keyword and category sets"""
+        # Nothing shared means both Jaccard terms are 0 in each direction
+        if keywords1.isdisjoint(keywords2) and categories1.isdisjoint(categories2):
+            return 0.0, [], self.generate_collaboration_idea(categories1, categories2)
+
+        # Both Jaccard terms are symmetric, so A->B already is the mutual
+        # score (the B->A score and common keywords are identical)
+        mutual_score, common_keywords = self.calculate_match_score(
+            keywords1, keywords2, categories1, categories2
+        )
 
         # Generate collaboration idea
         collaboration_idea = self.generate_collaboration_idea(categories1, categories2)
@@ -209,30 +649,15 @@ class MatchGenerator:
         """Generate human-readable match reason"""
         if not common_keywords:
             base_reason = f"{match_name} has complementary skills that could create valuable partnership opportunities."
-        elif len(common_keywords) >= 3:
-            kw_text = f"{', '.join(common_keywords[:2])}, and {common_keywords[2]}"
-            if score >= 70:
-                base_reason = f"Strong alignment in {kw_text}. Highly compatible for joint ventures."
-            elif score >= 50:
-                base_reason = f"Shared focus on {kw_text}. Good potential for collaboration."
-            else:
-                base_reason = f"Common interests in {kw_text}. Worth exploring partnership opportunities."
-        elif len(common_keywords) == 2:
-            kw_text = f"{common_keywords[0]} and {common_keywords[1]}"
-            if score >= 70:
-                base_reason = f"Strong alignment in {kw_text}. Highly compatible for joint ventures."
-            elif score >= 50:
-                base_reason = f"Shared focus on {kw_text}. Good potential for collaboration."
-            else:
-                base_reason = f"Common interests in {kw_text}. Worth exploring partnership opportunities."
         else:
-            kw_text = common_keywords[0]
-            if score >= 70:
-                base_reason = f"Strong alignment in {kw_text}. Highly compatible for joint ventures."
-            elif score >= 50:
-                base_reason = f"Shared focus on {kw_text}. Good potential for collaboration."
+            if len(common_keywords) >= 3:
+                kw_text = f"{', '.join(common_keywords[:2])}, and {common_keywords[2]}"
+            elif len(common_keywords) == 2:
+                kw_text = f"{common_keywords[0]} and {common_keywords[1]}"
             else:
-                base_reason = f"Common interests in {kw_text}. Worth exploring partnership opportunities."
+                kw_text = common_keywords[0]
+            # Tier 0/1/2 for scores below 50, from 50, from 70
+            base_reason = self.MATCH_REASON_TIERS[(score >= 50) + (score >= 70)].format(kw_text)
 
         # Add collaboration idea if provided
         if collaboration_idea:
@@ -248,12 +673,159 @@ class MatchGenerator:
         dismissed_ids: Set[str] = None
     ) -> List[Dict]:
         """Generate top matches for a single profile"""
+        # Target signals are extracted once, not once per candidate
+        target_keywords, target_categories = self._compute_profile_signals(target_profile)
+        return self._generate_matches_from_signals(
+            target_profile, target_keywords, target_categories,
+            self._build_candidate_signals(all_profiles),
+            top_n=top_n, min_score=min_score, dismissed_ids=dismissed_ids
+        )
+
+    def _build_candidate_signals(self, profiles: List[Dict]) -> List[Tuple[Dict, Set[str], Set[str]]]:
+        """(profile, keywords, categories) for every profile that has something to match on"""
+        signals = []
+        for profile in profiles:
+            keywords, categories = self._compute_profile_signals(profile)
+            # Skip if no keywords to match
+            if keywords or categories:
+                signals.append((profile, keywords, categories))
+        return signals
+
+    def _build_signal_index(self, candidate_signals: List[Tuple[Dict, Set[str], Set[str]]]) -> Dict[str, Any]:
+        """
+        Keyword posting lists in CSR form (keyword -> row id; row r's candidate
+        positions are posting_ids[posting_ptr[r]:posting_ptr[r + 1]]), a uint8
+        category bitmask per candidate, and per-candidate keyword/category
+        counts, for vectorized pair pre-scoring.
+        """
+        keyword_index = defaultdict(list)
+        category_masks = np.zeros(len(candidate_signals), dtype=np.uint8)
+        for i, (_, keywords, categories) in enumerate(candidate_signals):
+            for keyword in keywords:
+                keyword_index[keyword].append(i)
+            category_masks[i] = _category_mask(frozenset(categories))
+
+        posting_ptr = np.zeros(len(keyword_index) + 1, dtype=np.int64)
+        np.cumsum([len(positions) for positions in keyword_index.values()], out=posting_ptr[1:])
+        posting_ids = np.fromiter(
+            (i for positions in keyword_index.values() for i in positions),
+            dtype=np.int64, count=int(posting_ptr[-1])
+        )
+
+        return {
+            'keyword_ids': {keyword: row for row, keyword in enumerate(keyword_index)},
+            'posting_ptr': posting_ptr,
+            'posting_ids': posting_ids,
+            'category_masks': category_masks,
+            'keyword_counts': np.array([len(sig[1]) for sig in candidate_signals], dtype=np.float64),
+            'category_counts': _popcount(category_masks).astype(np.float64),
+        }
+
+    def _target_terms(self, target_keywords: Set[str], signal_index: Dict[str, Any]) -> List[int]:
+        """Posting-list rows of the target's keywords that any candidate has"""
+        keyword_ids = signal_index['keyword_ids']
+        return [keyword_ids[kw] for kw in target_keywords if kw in keyword_ids]
+
+    def _prescore_candidates(
+        self,
+        target_keywords: Set[str],
+        target_categories: Set[str],
+        signal_index: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        calculate_match_score (before rounding) for one target against every
+        candidate at once. Keyword intersection sizes come from counting the
+        target's posting lists (a sparse row of K @ K.T); category intersections
+        are popcounts of the ANDed category bitmasks. Unions follow from set sizes.
+        """
+        size = len(signal_index['keyword_counts'])
+        posting_ptr = signal_index['posting_ptr']
+        posting_ids = signal_index['posting_ids']
+
+        hits = [
+            posting_ids[posting_ptr[term]:posting_ptr[term + 1]]
+            for term in self._target_terms(target_keywords, signal_index)
+        ]
+        if hits:
+            common_keywords = np.bincount(np.concatenate(hits), minlength=size).astype(np.float64)
+        else:
+            common_keywords = np.zeros(size, dtype=np.float64)
+
+        target_mask = _category_mask(frozenset(target_categories))
+        common_categories = _popcount(signal_index['category_masks'] & np.uint8(target_mask)).astype(np.float64)
+
+        keyword_union = np.maximum(len(target_keywords) + signal_index['keyword_counts'] - common_keywords, 1)
+        category_union = np.maximum(len(target_categories) + signal_index['category_counts'] - common_categories, 1)
+
+        keyword_score = common_keywords / keyword_union
+        category_score = common_categories / category_union
+        return (category_score * 0.6 + keyword_score * 0.4) * 100
+
+    def _prescore_survivors(
+        self,
+        target_keywords: Set[str],
+        target_categories: Set[str],
+        signal_index: Dict[str, Any],
+        threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (positions in candidate order, pre-scores) of the candidates whose
+        pre-score reaches threshold: the compiled kernel with Numba, the NumPy
+        passes without.
+        """
+        if not NUMBA_AVAILABLE:
+            prescores = self._prescore_candidates(target_keywords, target_categories, signal_index)
+            survivors = np.flatnonzero(prescores >= threshold)
+            return survivors, prescores[survivors]
+        return _prescore_survivors_kernel(
+            signal_index['posting_ptr'], signal_index['posting_ids'],
+            np.array(self._target_terms(target_keywords, signal_index), dtype=np.int64),
+            float(len(target_keywords)), _category_mask(frozenset(target_categories)),
+            float(len(target_categories)), signal_index['keyword_counts'],
+            signal_index['category_masks'], signal_index['category_counts'],
+            _BYTE_POPCOUNTS, threshold
+        )
+
+    def _generate_matches_from_signals(
+        self,
+        target_profile: Dict,
+        target_keywords: Set[str],
+        target_categories: Set[str],
+        candidate_signals: List[Tuple[Dict, Set[str], Set[str]]],
+        top_n: int = 10,
+        min_score: float = 10.0,
+        dismissed_ids: Set[str] = None,
+        signal_index: Optional[Dict[str, Any]] = None
+    ) -> List[Dict]:
+        """
+        Pair scoring for one target against pre-extracted candidate signals.
+
+        With a signal_index (from _build_signal_index), all candidates are
+        pre-scored in one vectorized pass. The pre-score is the exact unrounded
+        pair score, so the loop only rounds it: no per-pair set work at all.
+        """
+        # A target with nothing to match on scores 0 against everyone
+        if min_score > 0 and not target_keywords and not target_categories:
+            return []
+
         if dismissed_ids is None:
             dismissed_ids = set()
 
-        matches = []
+        prescores = None
+        if signal_index is not None and candidate_signals:
+            # Scores are rounded to 1 decimal before the threshold check, so keep
+            # anything within rounding distance (survivors are in candidate order)
+            survivors, prescores = self._prescore_survivors(
+                target_keywords, target_categories, signal_index, min_score - 0.051
+            )
+            candidate_signals = [candidate_signals[i] for i in survivors]
+            prescores = prescores.tolist()
 
-        for profile in all_profiles:
+        # Bounded min-heap of (score, -seq, ...) keeps the top_n best with the
+        # earliest candidate winning ties, same as a stable descending sort
+        top = []
+
+        for seq, (profile, profile_keywords, profile_categories) in enumerate(candidate_signals):
             # Skip self
             if profile['id'] == target_profile['id']:
                 continue
@@ -262,43 +834,43 @@ class MatchGenerator:
             if profile['id'] in dismissed_ids:
                 continue
 
-            # Extract profile data
-            profile_text = ' '.join(filter(None, [
-                profile.get('business_focus', ''),
-                profile.get('service_provided', ''),
-                profile.get('company', '')
-            ]))
-            profile_keywords = self.extract_keywords(profile_text)
-            profile_categories = self.get_categories(profile_keywords)
-
-            # Skip if no keywords to match
-            if not profile_keywords and not profile_categories:
+            # Score first; only candidates that clear min_score and make the heap
+            # carry their signals along for the reason work below
+            if prescores is not None:
+                score = round(prescores[seq], 1)
+            elif min_score > 0 and target_keywords.isdisjoint(profile_keywords) \
+                    and target_categories.isdisjoint(profile_categories):
+                # A pair sharing no keyword or category scores 0
                 continue
+            else:
+                score = self._pair_score(target_keywords, target_categories, profile_keywords, profile_categories)
+            if score < min_score:
+                continue
+            if len(top) < top_n:
+                heapq.heappush(top, (score, -seq, profile, profile_keywords, profile_categories))
+            elif top and (score, -seq) > top[0][:2]:
+                heapq.heapreplace(top, (score, -seq, profile, profile_keywords, profile_categories))
 
-            # Calculate mutual match score and collaboration idea
-            score, common_keywords, collaboration_idea = self.calculate_mutual_score(
-                target_profile, profile
-            )
-
-            # Only include if above minimum score
-            if score >= min_score:
-                matches.append({
-                    'profile': profile,
-                    'score': score,
-                    'common_keywords': common_keywords,
-                    'collaboration_idea': collaboration_idea,
-                    'reason': self.generate_match_reason(
-                        target_profile.get('name', ''),
-                        profile.get('name', ''),
-                        common_keywords,
-                        score,
-                        collaboration_idea
-                    )
-                })
-
-        # Sort by score and return top N
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        return matches[:top_n]
+        # Common keywords, ideas and reasons are only built for the matches that are kept
+        target_name = target_profile.get('name', '')
+        matches = []
+        for score, _, profile, profile_keywords, profile_categories in sorted(top, key=lambda e: e[:2], reverse=True):
+            common_keywords = list(islice(target_keywords.intersection(profile_keywords), 5))
+            collaboration_idea = self.generate_collaboration_idea(target_categories, profile_categories)
+            matches.append({
+                'profile': profile,
+                'score': score,
+                'common_keywords': common_keywords,
+                'collaboration_idea': collaboration_idea,
+                'reason': self.generate_match_reason(
+                    target_name,
+                    profile.get('name', ''),
+                    common_keywords,
+                    score,
+                    collaboration_idea
+                )
+            })
+        return matches
 
     def generate_all_matches(
         self,
@@ -317,6 +889,8 @@ class MatchGenerator:
 
         all_profiles = result['data']
         print(f"Loaded {len(all_profiles)} profiles")
+        self._signals_cache.clear()
+        self._signal_texts.clear()
 
         # Filter to only registered users if requested
         if only_registered:
@@ -325,30 +899,39 @@ class MatchGenerator:
         else:
             target_profiles = all_profiles
 
+        # Tokenize every profile once for the whole run, not once per target,
+        # and only profiles whose text changed since the last run's cache
+        self._save_signal_cache(self._prime_signals_cache(all_profiles))
+        candidate_signals = self._build_candidate_signals(all_profiles)
+        signal_index = self._build_signal_index(candidate_signals)
+
         total_matches = 0
         profiles_processed = 0
+        pending = []  # match_suggestions rows awaiting a bulk upsert
+
+        # Scoring is pure CPU work: large runs fan out to forked worker processes
+        run = (self, target_profiles, candidate_signals, signal_index, top_n, min_score)
+        progress = _ProgressPrinter("  Processed {done} / {total}...", len(target_profiles))
+        for target, matches in zip(target_profiles, self._iter_target_results(run)):
+            # Queue each match for the database
+            for suggested_id, score, reason in matches:
+                pending.append({
+                    'profile_id': target['id'],
+                    'suggested_profile_id': suggested_id,
+                    'match_score': score,
+                    'match_reason': reason,
+                    'source': 'ai_matcher'
+                })
 
-        for target in target_profiles:
-            # Generate matches for this profile
-            matches = self.generate_matches_for_profile(
-                target, all_profiles, top_n=top_n, min_score=min_score
-            )
-
-            # Store each match in database
-            for match in matches:
-                result = self.directory_service.create_match_suggestion(
-                    profile_id=target['id'],
-                    suggested_profile_id=match['profile']['id'],
-                    match_score=match['score'],
-                    match_reason=match['reason'],
-                    source='ai_matcher'
-                )
-                if result['success']:
-                    total_matches += 1
+            if len(pending) >= self.SAVE_BATCH_SIZE:
+                total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
+                pending = []
 
             profiles_processed += 1
-            if profiles_processed % 100 == 0:
-                print(f"  Processed {profiles_processed} / {len(target_profiles)}...")
+            progress.update(profiles_processed)
+
+        if pending:
+            total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
 
         return {
             'success': True,
@@ -356,6 +939,35 @@ class MatchGenerator:
             'matches_created': total_matches
         }
 
+    def _iter_target_results(self, run: Tuple):
+        """
+        Yield _score_keyword_targets results for run target by target, in
+        target order. Runs in a fork-based process pool when the run is large
+        enough and the platform supports fork (each worker's initializer gets
+        the run state, inherited copy-on-write); otherwise scores in-process.
+        """
+        import multiprocessing
+
+        num_targets = len(run[1])
+        chunks = [
+            list(range(i, min(i + self.PARALLEL_CHUNK_SIZE, num_targets)))
+            for i in range(0, num_targets, self.PARALLEL_CHUNK_SIZE)
+        ]
+        workers = min(os.cpu_count() or 1, len(chunks))
+
+        if (num_targets < self.PARALLEL_MIN_TARGETS or workers < 2
+                or 'fork' not in multiprocessing.get_all_start_methods()):
+            for chunk in chunks:
+                yield from _score_keyword_targets(run, chunk)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_init_keyword_worker, initargs=(run,)) as executor:
+            for chunk_results in executor.map(_score_keyword_worker_chunk, chunks):
+                yield from chunk_results
+
     def generate_matches_for_user(self, profile_id: str, top_n: int = 10) -> Dict:
         """Generate matches for a specific user"""
         # Get target profile
@@ -371,6 +983,8 @@ class MatchGenerator:
             return {'success': False, 'error': 'Failed to fetch profiles'}
 
         all_profiles = all_result['data']
+        self._signals_cache.clear()
+        self._signal_texts.clear()
 
         # Generate matches
         matches = self.generate_matches_for_profile(
@@ -378,17 +992,17 @@ class MatchGenerator:
         )
 
         # Store matches
-        matches_created = 0
-        for match in matches:
-            result = self.directory_service.create_match_suggestion(
-                profile_id=profile_id,
-                suggested_profile_id=match['profile']['id'],
-                match_score=match['score'],
-                match_reason=match['reason'],
-                source='ai_matcher'
-            )
-            if result['success']:
-                matches_created += 1
+        result = self.directory_service.create_match_suggestions([
+            {
+                'profile_id': profile_id,
+                'suggested_profile_id': match['profile']['id'],
+                'match_score': match['score'],
+                'match_reason': match['reason'],
+                'source': 'ai_matcher'
+            }
+            for match in matches
+        ])
+        matches_created = result.get('created', 0)
 
         return {
             'success': True,
@@ -403,6 +1017,30 @@ class AIMatchGenerator:
     Provides higher quality matches with outreach messages.
     """
 
+    SAVE_BATCH_SIZE = 500  # match_suggestions rows per bulk upsert
+    MAX_WORKERS = 16  # Concurrent OpenRouter requests in generate_all_matches
+    MAX_CANDIDATES = 50  # Candidates per prompt, to stay within token limits
+    SHORTLIST_SIZE = 30  # Candidates per prompt when ranked by stored embedding similarity
+    TARGETS_PER_REQUEST = 5  # Targets sharing one candidate list per batched request (at most)
+    MAX_TOKENS_PER_TARGET = 2000  # Response budget per target in a batched request
+    MAX_OUTPUT_TOKENS = 10000  # Largest max_tokens the model accepts; bounds the batch size
+    PROFILE_PAGE_SIZE = 500  # Profiles per page when reading the directory in generate_all_matches
+
+    # Match fields and criteria shared by the single and batched prompts
+    MATCH_INSTRUCTIONS = """For each match, provide:
+1. partner_name - Their full name (must match exactly from the list)
+2. score - Match quality 0-100
+3. match_type - Type (Affiliate, Speaking, Referral, Content, Service)
+4. why_good_fit - 1-2 sentences on why they match
+5. collaboration_opportunity - Specific actionable idea
+6. first_outreach_message - Ready-to-send message (50-100 words)
+
+MATCHING CRITERIA:
+- Prioritize COMPLEMENTARY services (not competitors)
+- Consider TARGET MARKET alignment
+- Look for synergies in services and audiences
+- Only include matches with score >= 60"""
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with OpenRouter API key"""
         if not OPENAI_AVAILABLE:
@@ -436,17 +1074,45 @@ class AIMatchGenerator:
         self,
         target_profile: Dict,
         candidate_profiles: List[Dict],
-        num_matches: int = 10
+        num_matches: int = 10,
+        profile_texts: Optional[Dict[str, str]] = None,
+        candidate_names: Optional[Dict[str, Dict]] = None,
+        candidates_text: Optional[str] = None,
+        candidate_embeddings: Optional[np.ndarray] = None
     ) -> List[Dict]:
-        """Generate AI-powered matches for a profile"""
-        target_text = self.profile_to_text(target_profile)
-
-        # Limit candidates to avoid token limits
-        candidates = candidate_profiles[:50]
-        candidates_text = "\n\n".join([
-            f"--- Profile {i+1} ---\n{self.profile_to_text(p)}"
-            for i, p in enumerate(candidates)
-        ])
+        """
+        Generate AI-powered matches for a profile.
+
+        When the target has a stored embedding, the prompt lists the
+        SHORTLIST_SIZE candidates most similar to it; otherwise the first
+        MAX_CANDIDATES candidates.
+
+        profile_texts is an optional profile id -> profile_to_text cache, filled
+        as profiles are rendered, so callers matching many targets against the
+        same candidates render each profile only once. candidate_names and
+        candidates_text are the lowercased name -> profile lookup and the
+        rendered prompt list (_candidates_text) for the first MAX_CANDIDATES
+        candidates, when the caller already has them. candidate_embeddings is
+        _embedding_matrix of candidate_profiles, likewise.
+        """
+        target_text = self._profile_text(target_profile, profile_texts)
+
+        candidates = None
+        target_vector = self._stored_embedding(target_profile)
+        if target_vector is not None:
+            if candidate_embeddings is None:
+                candidate_embeddings = self._embedding_matrix(candidate_profiles, len(target_vector))
+            candidates = self._shortlist_candidates(
+                target_profile, target_vector, candidate_profiles, candidate_embeddings
+            )
+        if candidates is None:
+            # Limit candidates to avoid token limits
+            candidates = candidate_profiles[:self.MAX_CANDIDATES]
+        else:
+            # The caller's lookup and text are for the leading candidates
+            candidate_names = candidates_text = None
+        if candidates_text is None:
+            candidates_text = self._candidates_text(candidates, profile_texts)
 
         prompt = f"""You are an expert at identifying strategic JV partnerships. Find the TOP {num_matches} best partnership matches.
 
@@ -456,19 +1122,7 @@ TARGET PERSON:
 POTENTIAL PARTNERS:
 {candidates_text}
 
-For each match, provide:
-1. partner_name - Their full name (must match exactly from the list)
-2. score - Match quality 0-100
-3. match_type - Type (Affiliate, Speaking, Referral, Content, Service)
-4. why_good_fit - 1-2 sentences on why they match
-5. collaboration_opportunity - Specific actionable idea
-6. first_outreach_message - Ready-to-send message (50-100 words)
-
-MATCHING CRITERIA:
-- Prioritize COMPLEMENTARY services (not competitors)
-- Consider TARGET MARKET alignment
-- Look for synergies in services and audiences
-- Only include matches with score >= 60
+{self.MATCH_INSTRUCTIONS}
 
 Return ONLY a JSON array, no preamble:
 [{{"partner_name": "...", "score": 85, "match_type": "...", "why_good_fit": "...", "collaboration_opportunity": "...", "first_outreach_message": "..."}}]"""
@@ -485,23 +1139,224 @@ Return ONLY a JSON array, no preamble:
             if not matches:
                 return []
 
-            # Filter and validate matches
-            valid_matches = []
-            candidate_names = {p.get('name', '').lower(): p for p in candidates}
+            if candidate_names is None:
+                candidate_names = self._candidate_names(candidates)
+            return self._validate_matches(matches, candidate_names, num_matches)
 
-            for match in matches:
-                if match.get('score', 0) < 60:
-                    continue
-                partner_name = match.get('partner_name', '').lower()
-                if partner_name in candidate_names:
-                    match['profile'] = candidate_names[partner_name]
-                    valid_matches.append(match)
+        except Exception as e:
+            print(f"AI matching error: {e}")
+            return []
+
+    def generate_ai_matches_batch(
+        self,
+        target_profiles: List[Dict],
+        candidate_profiles: List[Dict],
+        num_matches: int = 10,
+        profile_texts: Optional[Dict[str, str]] = None,
+        candidate_names: Optional[Dict[str, Dict]] = None,
+        candidates_text: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        generate_ai_matches for several targets sharing one candidate list, in
+        a single request: the prompt preamble and candidate list are sent once
+        for the whole batch. Returns each target's matches, in target order.
+        Targets the response leaves out (or the whole batch, if the request
+        fails) fall back to one generate_ai_matches call each.
+        """
+        if len(target_profiles) == 1:
+            return [self.generate_ai_matches(
+                target_profiles[0], candidate_profiles, num_matches, profile_texts=profile_texts,
+                candidate_names=candidate_names, candidates_text=candidates_text
+            )]
+
+        candidates = candidate_profiles[:self.MAX_CANDIDATES]
+        if candidate_names is None:
+            candidate_names = self._candidate_names(candidates)
+        targets_text = "\n\n".join([
+            f"=== TARGET {i+1} ===\n{self._profile_text(t, profile_texts)}"
+            for i, t in enumerate(target_profiles)
+        ])
+        if candidates_text is None:
+            candidates_text = self._candidates_text(candidates, profile_texts)
 
-            return valid_matches[:num_matches]
+        prompt = f"""You are an expert at identifying strategic JV partnerships. For EACH of the {len(target_profiles)} target people below, find their TOP {num_matches} best partnership matches.
 
+TARGET PEOPLE:
+{targets_text}
+
+POTENTIAL PARTNERS:
+{candidates_text}
+
+{self.MATCH_INSTRUCTIONS}
+- Never match a target person with themselves
+
+Return ONLY a JSON object mapping each target number to its array of matches, no preamble:
+{{"1": [{{"partner_name": "...", "score": 85, "match_type": "...", "why_good_fit": "...", "collaboration_opportunity": "...", "first_outreach_message": "..."}}], "2": [...]}}"""
+
+        matches_by_target = {}
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=min(self.MAX_OUTPUT_TOKENS, self.MAX_TOKENS_PER_TARGET * len(target_profiles)),
+                messages=[{"role": "user", "content": prompt}]
+            )
+            content = response.choices[0].message.content
+            matches_by_target = extract_json_object(content) or {}
+            if not isinstance(matches_by_target, dict):
+                matches_by_target = {}
         except Exception as e:
-            print(f"AI matching error: {e}")
+            print(f"AI batch matching error: {e}")
+
+        results = []
+        for i, target in enumerate(target_profiles):
+            matches = matches_by_target.get(str(i + 1))
+            if not isinstance(matches, list):
+                results.append(self.generate_ai_matches(
+                    target, candidate_profiles, num_matches, profile_texts=profile_texts,
+                    candidate_names=candidate_names, candidates_text=candidates_text
+                ))
+                continue
+            results.append(self._validate_matches(
+                matches, candidate_names, num_matches, exclude_id=target['id']
+            ))
+        return results
+
+    def _validate_matches(
+        self,
+        matches: List[Dict],
+        candidate_names: Dict[str, Dict],
+        num_matches: int,
+        exclude_id: Optional[str] = None
+    ) -> List[Dict]:
+        """Keep AI matches scoring >= 60 whose partner_name resolves to a candidate"""
+        valid_matches = []
+        for match in matches:
+            if not isinstance(match, dict) or match.get('score', 0) < 60:
+                continue
+            partner_name = match.get('partner_name', '').lower()
+            profile = candidate_names.get(partner_name)
+            if profile is not None and profile['id'] != exclude_id:
+                match['profile'] = profile
+                valid_matches.append(match)
+
+        return valid_matches[:num_matches]
+
+    def _load_all_profiles(self) -> List[Dict]:
+        """
+        Every profile, read PROFILE_PAGE_SIZE at a time. Each page's embedding
+        JSON is decoded into a float32 embedding_vector and dropped, so the
+        directory is never held as JSON text or per-float Python lists.
+        Raises if a page can't be fetched.
+        """
+        profiles = []
+        for page in self.directory_service.iter_profiles(batch_size=self.PROFILE_PAGE_SIZE):
+            for profile in page:
+                profile['embedding_vector'] = self._stored_embedding(profile)
+                profile.pop('embedding', None)
+            profiles.extend(page)
+        return profiles
+
+    def _stored_embedding(self, profile: Dict) -> Optional[np.ndarray]:
+        """
+        A profile's embedding as float32 (embedding_vector, else the stored
+        embedding JSON, which is decoded into embedding_vector), or None
+        """
+        vector = profile.get('embedding_vector')
+        if not _has_embedding(vector):
+            vector = profile.get('embedding')
+            if isinstance(vector, str):
+                try:
+                    vector = json.loads(vector)
+                except (json.JSONDecodeError, TypeError):
+                    vector = None
+            if not isinstance(vector, list) or not vector:
+                return None
+            profile['embedding_vector'] = vector
+        return np.asarray(vector, dtype=np.float32)
+
+    def _embedding_matrix(self, profiles: List[Dict], dim: int) -> Optional[np.ndarray]:
+        """
+        The profiles' stored embeddings as a float32 matrix of unit rows (zero
+        where a profile has none, or one of another dimension), or None if no
+        profile has a usable embedding
+        """
+        matrix = np.zeros((len(profiles), dim), dtype=np.float32)
+        found = False
+        for row, profile in enumerate(profiles):
+            vector = self._stored_embedding(profile)
+            if vector is not None and vector.shape == (dim,):
+                matrix[row] = vector
+                found = True
+        if not found:
+            return None
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms != 0)
+        return matrix
+
+    def _shortlist_candidates(
+        self,
+        target_profile: Dict,
+        target_vector: np.ndarray,
+        candidates: List[Dict],
+        embedding_matrix: Optional[np.ndarray]
+    ) -> Optional[List[Dict]]:
+        """
+        The SHORTLIST_SIZE candidates (other than the target) with the highest
+        cosine similarity to target_vector, best first and ties in candidate
+        order, or None if there are no embeddings to rank by.
+        embedding_matrix is _embedding_matrix of candidates.
+        """
+        if embedding_matrix is None or embedding_matrix.shape[1] != len(target_vector):
+            return None
+        target_norm = np.linalg.norm(target_vector)
+        if target_norm == 0:
+            return None
+
+        similarities = embedding_matrix @ (target_vector / target_norm)
+        own = [i for i, p in enumerate(candidates) if p['id'] == target_profile['id']]
+        similarities[own] = -np.inf
+        size = min(self.SHORTLIST_SIZE, len(candidates) - len(own))
+        if size <= 0:
             return []
+        # Everything above the size-th best similarity, then the earliest of
+        # the candidates tied with it
+        cutoff = np.partition(similarities, len(similarities) - size)[len(similarities) - size]
+        above = np.flatnonzero(similarities > cutoff)
+        tied = np.flatnonzero(similarities == cutoff)[:size - len(above)]
+        top = np.concatenate((above, tied))
+        top = top[np.lexsort((top, -similarities[top]))]
+        return [candidates[i] for i in top]
+
+    def _profile_text(self, profile: Dict, profile_texts: Optional[Dict[str, str]] = None) -> str:
+        """profile_to_text, memoized in profile_texts (profile id -> text) when given"""
+        if profile_texts is None:
+            return self.profile_to_text(profile)
+        text = profile_texts.get(profile['id'])
+        if text is None:
+            text = profile_texts[profile['id']] = self.profile_to_text(profile)
+        return text
+
+    def _candidates_text(self, candidates: List[Dict], profile_texts: Optional[Dict[str, str]] = None) -> str:
+        """Numbered candidate list as it appears in the matching prompts"""
+        return "\n\n".join([
+            f"--- Profile {i+1} ---\n{self._profile_text(p, profile_texts)}"
+            for i, p in enumerate(candidates)
+        ])
+
+    def _candidate_names(self, candidates: List[Dict]) -> Dict[str, Dict]:
+        """Lowercased name -> profile, for resolving the AI's partner_name"""
+        return {p.get('name', '').lower(): p for p in candidates}
+
+    def _suggestion_row(self, profile_id: str, match: Dict) -> Dict:
+        """match_suggestions row for one validated AI match"""
+        reason = f"{match.get('why_good_fit', '')} {match.get('collaboration_opportunity', '')}"
+        return {
+            'profile_id': profile_id,
+            'suggested_profile_id': match.get('profile', {})['id'],
+            'match_score': match.get('score', 0),
+            'match_reason': reason[:500],
+            'source': 'ai_matcher'
+        }
 
     def generate_matches_for_user(
         self,
@@ -530,19 +1385,10 @@ Return ONLY a JSON array, no preamble:
         # Store in database
         matches_created = 0
         if store_results:
-            for match in matches:
-                profile = match.get('profile', {})
-                reason = f"{match.get('why_good_fit', '')} {match.get('collaboration_opportunity', '')}"
-
-                result = self.directory_service.create_match_suggestion(
-                    profile_id=profile_id,
-                    suggested_profile_id=profile['id'],
-                    match_score=match.get('score', 0),
-                    match_reason=reason[:500],
-                    source='ai_matcher'
-                )
-                if result['success']:
-                    matches_created += 1
+            result = self.directory_service.create_match_suggestions(
+                [self._suggestion_row(profile_id, match) for match in matches]
+            )
+            matches_created = result.get('created', 0)
 
         return {
             'success': True,
@@ -556,40 +1402,107 @@ Return ONLY a JSON array, no preamble:
         only_registered: bool = True
     ) -> Dict:
         """Generate AI matches for all registered users"""
-        result = self.directory_service.get_profiles(limit=10000)
-        if not result['success']:
-            return {'success': False, 'error': 'Failed to fetch profiles'}
+        try:
+            all_profiles = self._load_all_profiles()
+        except Exception as e:
+            return {'success': False, 'error': f'Failed to fetch profiles: {e}'}
 
-        all_profiles = result['data']
+        # The leading profiles by name (missing names last, as get_profiles
+        # orders them) are the shared candidate pool, and the targets when not
+        # limited to registered users
+        head_size = self.MAX_CANDIDATES + 1 if only_registered else max(self.MAX_CANDIDATES + 1, 100)
+        head = heapq.nsmallest(
+            head_size, all_profiles, key=lambda p: (p.get('name') is None, p.get('name') or '')
+        )
 
         if only_registered:
             target_profiles = [p for p in all_profiles if p.get('auth_user_id')]
         else:
-            target_profiles = all_profiles[:100]  # Limit for non-registered
+            target_profiles = head[:100]  # Limit for non-registered
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         total_matches = 0
         profiles_processed = 0
+        pending = []  # match_suggestions rows awaiting a bulk upsert
+
+        # Prompt text per profile id, shared across targets (and threads)
+        profile_texts: Dict[str, str] = {}
+
+        # Targets with a stored embedding get their own shortlist of the most
+        # similar profiles, ranked against one matrix of every profile
+        dim = next((len(v) for v in map(self._stored_embedding, all_profiles) if v is not None), 0)
+        all_embeddings = self._embedding_matrix(all_profiles, dim) if dim else None
+        ranked_ids = set()
+        if all_embeddings is not None:
+            for target in target_profiles:
+                vector = self._stored_embedding(target)
+                if vector is not None and vector.shape == (dim,) and vector.any():
+                    ranked_ids.add(target['id'])
+
+        # Only the first MAX_CANDIDATES other profiles reach a prompt, so every
+        # target outside that leading pool shares one candidate list and lookup
+        pool = head[:self.MAX_CANDIDATES + 1]
+        pool_ids = {p['id'] for p in pool}
+        shared_candidates = pool[:self.MAX_CANDIDATES]
+        shared_names = self._candidate_names(shared_candidates)
+        # Rendered once up front: the pool's texts feed every prompt, and the
+        # shared candidate list is identical in every shared-target request
+        for profile in pool:
+            self._profile_text(profile, profile_texts)
+        shared_text = self._candidates_text(shared_candidates, profile_texts)
+
+        def match_targets(targets):
+            if targets[0]['id'] in ranked_ids:
+                return [self.generate_ai_matches(
+                    targets[0], all_profiles, top_n, profile_texts=profile_texts,
+                    candidate_embeddings=all_embeddings
+                )]
+            # A batch of targets outside the pool shares one request
+            if targets[0]['id'] not in pool_ids:
+                return self.generate_ai_matches_batch(
+                    targets, shared_candidates, top_n, profile_texts=profile_texts,
+                    candidate_names=shared_names, candidates_text=shared_text
+                )
+            candidates = [p for p in pool if p['id'] != targets[0]['id']]
+            return [self.generate_ai_matches(targets[0], candidates, top_n, profile_texts=profile_texts)]
+
+        # Ranked and pool targets each see a different candidate list and go alone
+        shared_targets = [t for t in target_profiles if t['id'] not in pool_ids and t['id'] not in ranked_ids]
+        # As many targets per request as the model's output cap leaves room for
+        batch_size = max(1, min(self.TARGETS_PER_REQUEST, self.MAX_OUTPUT_TOKENS // self.MAX_TOKENS_PER_TARGET))
+        target_batches = [[t] for t in target_profiles if t['id'] in pool_ids or t['id'] in ranked_ids] + [
+            shared_targets[i:i + batch_size]
+            for i in range(0, len(shared_targets), batch_size)
+        ]
 
-        for target in target_profiles:
-            candidates = [p for p in all_profiles if p['id'] != target['id']]
-            matches = self.generate_ai_matches(target, candidates, top_n)
+        # Each call is seconds of network wait, so requests run concurrently;
+        # results are collected and saved on this thread
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            future_to_targets = {
+                executor.submit(match_targets, targets): targets
+                for targets in target_batches
+            }
 
-            for match in matches:
-                profile = match.get('profile', {})
-                reason = f"{match.get('why_good_fit', '')} {match.get('collaboration_opportunity', '')}"
+            for future in as_completed(future_to_targets):
+                targets = future_to_targets[future]
+                try:
+                    batch_matches = future.result()
+                except Exception as e:
+                    print(f"AI matching error for {', '.join(t.get('name') or '' for t in targets)}: {e}")
+                    batch_matches = [[] for _ in targets]
 
-                result = self.directory_service.create_match_suggestion(
-                    profile_id=target['id'],
-                    suggested_profile_id=profile['id'],
-                    match_score=match.get('score', 0),
-                    match_reason=reason[:500],
-                    source='ai_matcher'
-                )
-                if result['success']:
-                    total_matches += 1
+                for target, matches in zip(targets, batch_matches):
+                    pending.extend(self._suggestion_row(target['id'], match) for match in matches)
+                    if len(pending) >= self.SAVE_BATCH_SIZE:
+                        total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
+                        pending = []
 
-            profiles_processed += 1
-            print(f"AI Matched {profiles_processed}/{len(target_profiles)}: {target.get('name')}")
+                    profiles_processed += 1
+                    print(f"AI Matched {profiles_processed}/{len(target_profiles)}: {target.get('name')}")
+
+        if pending:
+            total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
 
         return {
             'success': True,
@@ -614,10 +1527,27 @@ class HybridMatchGenerator:
         'reach': 0.15
     }
 
+    SAVE_BATCH_SIZE = 500  # match_suggestions rows per bulk upsert
+    EMBEDDING_WORKERS = 4  # Embedding batches in flight in generate_all_embeddings
+    SIMILARITY_BLOCK_SIZE = 256  # Targets per similarity matrix product
+    PARALLEL_MIN_TARGETS = 200  # Smaller runs are scored in-process
+    PARALLEL_CHUNK_SIZE = 64  # Targets per worker task
+    PARALLEL_MIN_CANDIDATES = 2000  # Few-target runs split candidates above this
+    PROFILE_CACHE_TTL = 60.0  # Seconds a loaded profile set serves generate_matches_for_user
+
+    # On-disk copy of decoded profile embeddings, reused across runs
+    EMBEDDING_CACHE_DIR = os.getenv('JV_EMBEDDING_CACHE_DIR', os.path.join('.jv_matcher_cache', 'embeddings'))
+    SIMILARITY_CACHE_SIZE = 256  # Per-user similarity rows kept against the cached profile set
+
     def __init__(self, openai_api_key: Optional[str] = None):
         self.directory_service = DirectoryService(use_admin=True)
         self.keyword_matcher = MatchGenerator()
 
+        # (loaded at, profile version, profiles, embedding matrix); see _get_packed_profiles
+        self._profile_cache: Optional[Tuple[float, int, List[Dict], Optional[Dict[str, Any]]]] = None
+        self._profile_version = 0  # Bumped whenever this generator writes profile embeddings
+        self._similarity_rows: Dict[str, np.ndarray] = {}  # profile_id -> similarities against the cached set
+
         # Initialize embedding service if available
         self.embedding_service = None
         try:
@@ -657,56 +1587,59 @@ class HybridMatchGenerator:
         # One has reach, one doesn't - neutral
         return 50.0
 
+    def _reach_compatibilities(self, target_reach: float, reaches: np.ndarray) -> np.ndarray:
+        """calculate_reach_compatibility of target_reach against every entry of reaches"""
+        if target_reach <= 0:
+            return np.full(len(reaches), 50.0)
+        both = reaches > 0
+        ratio = np.maximum(reaches, target_reach) / np.where(both, np.minimum(reaches, target_reach), 1.0)
+        return np.where(both, np.where(ratio <= 10, 70 + ratio * 3, 70.0), 50.0)
+
     def calculate_hybrid_score(
         self,
         target_profile: Dict,
         candidate_profile: Dict,
         target_embedding: Optional[List[float]] = None,
-        candidate_embedding: Optional[List[float]] = None
+        candidate_embedding: Optional[List[float]] = None,
+        semantic_similarity: Optional[float] = None,
+        target_signals: Optional[Tuple[Set[str], Set[str]]] = None,
+        candidate_signals: Optional[Tuple[Set[str], Set[str]]] = None
     ) -> Tuple[float, Dict[str, float], List[str], str]:
         """
         Calculate hybrid match score combining all signals.
+        semantic_similarity is the embeddings' cosine similarity, if the caller
+        already computed it (see _semantic_similarities); target_signals and
+        candidate_signals are the profiles' extract_profile_signals, likewise.
         Returns: (total_score, component_scores, common_keywords, collaboration_idea)
         """
         component_scores = {}
 
         # 1. Keyword-based scores (from existing matcher)
-        target_text = ' '.join(filter(None, [
-            target_profile.get('business_focus', ''),
-            target_profile.get('service_provided', ''),
-            target_profile.get('company', '')
-        ]))
-        target_keywords = self.keyword_matcher.extract_keywords(target_text)
-        target_categories = self.keyword_matcher.get_categories(target_keywords)
-
-        candidate_text = ' '.join(filter(None, [
-            candidate_profile.get('business_focus', ''),
-            candidate_profile.get('service_provided', ''),
-            candidate_profile.get('company', '')
-        ]))
-        candidate_keywords = self.keyword_matcher.extract_keywords(candidate_text)
-        candidate_categories = self.keyword_matcher.get_categories(candidate_keywords)
+        target_keywords, target_categories = \
+            target_signals or self.keyword_matcher.extract_profile_signals(target_profile)
+        candidate_keywords, candidate_categories = \
+            candidate_signals or self.keyword_matcher.extract_profile_signals(candidate_profile)
 
         # Keyword overlap score
         common_keywords = target_keywords.intersection(candidate_keywords)
         if target_keywords or candidate_keywords:
-            keyword_score = len(common_keywords) / max(len(target_keywords | candidate_keywords), 1) * 100
+            keyword_score = len(common_keywords) / max(len(target_keywords) + len(candidate_keywords) - len(common_keywords), 1) * 100
         else:
             keyword_score = 0.0
         component_scores['keyword'] = keyword_score
 
         # Category overlap score
-        common_categories = target_categories.intersection(candidate_categories)
         if target_categories or candidate_categories:
-            category_score = len(common_categories) / max(len(target_categories | candidate_categories), 1) * 100
+            category_score = _category_jaccard(target_categories, candidate_categories) * 100
         else:
             category_score = 0.0
         component_scores['category'] = category_score
 
         # 2. Semantic similarity (if embeddings available)
-        if self.embedding_service and target_embedding and candidate_embedding:
-            semantic_sim = self.embedding_service.cosine_similarity(target_embedding, candidate_embedding)
-            semantic_score = max(0.0, semantic_sim * 100)
+        if self.embedding_service and _has_embedding(target_embedding) and _has_embedding(candidate_embedding):
+            if semantic_similarity is None:
+                semantic_similarity = self.embedding_service.cosine_similarity(target_embedding, candidate_embedding)
+            semantic_score = max(0.0, float(semantic_similarity) * 100)
         else:
             # Fall back to keyword/category average if no embeddings
             semantic_score = (keyword_score + category_score) / 2
@@ -731,7 +1664,7 @@ class HybridMatchGenerator:
             target_categories, candidate_categories
         )
 
-        return round(total_score, 1), component_scores, list(common_keywords)[:5], collaboration_idea
+        return round(total_score, 1), component_scores, list(islice(common_keywords, 5)), collaboration_idea
 
     def generate_matches_for_profile(
         self,
@@ -739,93 +1672,344 @@ class HybridMatchGenerator:
         all_profiles: List[Dict],
         top_n: int = 10,
         min_score: float = 15.0,
-        dismissed_ids: Optional[Set[str]] = None
+        dismissed_ids: Optional[Set[str]] = None,
+        embedding_matrix: Optional[Dict[str, Any]] = None,
+        similarities: Optional[np.ndarray] = None
     ) -> List[Dict]:
-        """Generate top matches using hybrid scoring"""
+        """
+        Generate top matches using hybrid scoring.
+
+        embedding_matrix (from _build_embedding_matrix) lets callers scoring
+        many targets against the same profiles stack the embeddings only once;
+        similarities is the target's precomputed row of cosine similarities
+        against it (see _iter_block_similarities).
+        """
         if dismissed_ids is None:
             dismissed_ids = set()
 
-        matches = []
+        # Bounded min-heap of the top_n best, earliest candidate winning ties
+        top = []
+
+        # Keyword signals: the target's once per call, candidates' once per
+        # matrix (aligned with all_profiles when it was built from them)
+        target_signals = self.keyword_matcher.extract_profile_signals(target_profile)
+        position_signals = None
+        if embedding_matrix is not None and embedding_matrix.get('profiles') is all_profiles:
+            position_signals = embedding_matrix['signals']
 
         # Get target embedding
         target_embedding = target_profile.get('embedding_vector')
-        if not target_embedding and self.embedding_service:
-            target_embedding = self.embedding_service.get_profile_embedding(target_profile)
-
-        for candidate in all_profiles:
-            # Skip self and dismissed
-            if candidate['id'] == target_profile['id']:
-                continue
-            if candidate['id'] in dismissed_ids:
-                continue
+        if not _has_embedding(target_embedding) and self.embedding_service:
+            target_embedding = self.embedding_service.get_profile_embedding(target_profile, return_numpy=True)
+
+        # Cosine similarity to every candidate in one matrix-vector product
+        if similarities is None and self.embedding_service and _has_embedding(target_embedding):
+            if embedding_matrix is None:
+                embedding_matrix = self._build_embedding_matrix(all_profiles)
+            similarities = self._semantic_similarities(target_embedding, embedding_matrix)
+        embedding_rows = embedding_matrix['rows'] if similarities is not None else {}
+
+        # A candidate sharing no keyword or category with the target scores
+        # exactly its semantic and reach terms (computed here for all rows at
+        # once) plus at most 100 for any other component; those whose bound
+        # can't reach min_score (or beat the current top_n) are skipped
+        score_bounds = None
+        candidate_seqs = range(len(all_profiles))
+        if similarities is not None:
+            target_keyword_mask, target_category_mask = self._signal_masks(target_profile, target_signals)
+            disjoint = (
+                ((embedding_matrix['keyword_masks'] & np.uint64(target_keyword_mask)) == 0)
+                & ((embedding_matrix['category_masks'] & np.uint64(target_category_mask)) == 0)
+            )
+            other_weight = sum(w for k, w in self.WEIGHTS.items()
+                               if k not in ('semantic', 'keyword', 'category', 'reach'))
+            reach_scores = self._reach_compatibilities(
+                target_profile.get('social_reach', 0) or 0, embedding_matrix['reaches']
+            )
+            bounds = (self.WEIGHTS['semantic'] * np.maximum(similarities.astype(np.float64), 0.0) * 100
+                      + self.WEIGHTS['reach'] * reach_scores
+                      + other_weight * 100 + 0.051)  # rounding margin
+            score_bounds = np.where(disjoint, bounds, np.inf)
+
+            # Self and dismissed candidates, masked by matrix row
+            excluded = np.zeros(len(score_bounds), dtype=bool)
+            excluded[[embedding_rows[pid] for pid in dismissed_ids if pid in embedding_rows]] = True
+            target_row = embedding_rows.get(target_profile['id'])
+            if target_row is not None:
+                excluded[target_row] = True
+
+            # When the matrix was built from all_profiles, only candidates that
+            # are neither masked out nor bounded below min_score are visited
+            if embedding_matrix.get('profiles') is all_profiles:
+                positions = embedding_matrix['positions']
+                eligible = ~excluded & (score_bounds >= min_score)
+                candidate_seqs = np.flatnonzero(np.where(positions >= 0, eligible[positions], True)).tolist()
+
+        for seq in candidate_seqs:
+            candidate = all_profiles[seq]
 
             # Get candidate embedding
             candidate_embedding = candidate.get('embedding_vector')
+            row = embedding_rows.get(candidate['id'])
+            if row is not None and score_bounds is not None:
+                # Self and dismissed are masked; others skip if they can't qualify
+                bound = score_bounds[row]
+                if excluded[row] or bound < min_score or (len(top) >= top_n and top and bound < top[0][0]):
+                    continue
+            elif candidate['id'] == target_profile['id'] or candidate['id'] in dismissed_ids:
+                continue
 
             # Calculate hybrid score
             score, components, common_keywords, collaboration_idea = self.calculate_hybrid_score(
-                target_profile, candidate, target_embedding, candidate_embedding
+                target_profile, candidate, target_embedding, candidate_embedding,
+                semantic_similarity=float(similarities[row]) if row is not None else None,
+                target_signals=target_signals,
+                candidate_signals=position_signals[seq] if position_signals is not None else None
             )
 
             if score >= min_score:
-                matches.append({
-                    'profile': candidate,
-                    'score': score,
-                    'component_scores': components,
-                    'common_keywords': common_keywords,
-                    'collaboration_idea': collaboration_idea,
-                    'reason': self.keyword_matcher.generate_match_reason(
-                        target_profile.get('name', ''),
-                        candidate.get('name', ''),
-                        common_keywords,
-                        score,
-                        collaboration_idea
-                    )
-                })
+                entry = (score, -seq, candidate, components, common_keywords, collaboration_idea)
+                if len(top) < top_n:
+                    heapq.heappush(top, entry)
+                elif top and entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+
+        # Sort by score; reasons are only built for the matches that are kept
+        target_name = target_profile.get('name', '')
+        return [
+            {
+                'profile': candidate,
+                'score': score,
+                'component_scores': components,
+                'common_keywords': common_keywords,
+                'collaboration_idea': collaboration_idea,
+                'reason': self.keyword_matcher.generate_match_reason(
+                    target_name,
+                    candidate.get('name', ''),
+                    common_keywords,
+                    score,
+                    collaboration_idea
+                )
+            }
+            for score, _, candidate, components, common_keywords, collaboration_idea
+            in sorted(top, key=lambda e: e[:2], reverse=True)
+        ]
+
+    def _build_embedding_matrix(self, profiles: List[Dict]) -> Optional[Dict[str, Any]]:
+        """
+        Pack profile embedding vectors into one contiguous float32 matrix of
+        unit rows (zero vectors stay zero), so cosine similarity is a plain dot
+        product. Returns {'rows': profile_id -> row, 'matrix', 'profiles',
+        'positions': row of each profile (-1 if none), 'signals': each
+        profile's extract_profile_signals} plus each row's signal masks and
+        social reach, or None if no profile has an embedding. Vectors
+        whose dimension differs from the first one are left out and scored
+        pair by pair.
+        """
+        vectors = [p.get('embedding_vector') for p in profiles]
+        dim = next((len(v) for v in vectors if _has_embedding(v)), 0)
+        if not dim:
+            return None
+
+        signals = [self.keyword_matcher.extract_profile_signals(p) for p in profiles]
+        rows = {}
+        for profile, vector, profile_signals in zip(profiles, vectors, signals):
+            if _has_embedding(vector) and len(vector) == dim and profile['id'] not in rows:
+                rows[profile['id']] = (profile, vector, profile_signals)
+
+        # Filled row by row, so no float64 intermediate copy of all vectors
+        matrix = np.empty((len(rows), dim), dtype=np.float32)
+        masks = []
+        reaches = np.empty(len(rows), dtype=np.float64)
+        for row, (profile, vector, profile_signals) in enumerate(rows.values()):
+            matrix[row] = vector
+            masks.append(self._signal_masks(profile, profile_signals))
+            reaches[row] = profile.get('social_reach', 0) or 0
+        rows = {profile_id: row for row, profile_id in enumerate(rows)}
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms != 0)
+        return {
+            'rows': rows,
+            'matrix': matrix,
+            'profiles': profiles,
+            'signals': signals,
+            'positions': np.array([rows.get(p['id'], -1) for p in profiles], dtype=np.intp),
+            'keyword_masks': np.array([m[0] for m in masks], dtype=np.uint64),
+            'category_masks': np.array([m[1] for m in masks], dtype=np.uint64),
+            'reaches': reaches,
+        }
+
+    def _signal_masks(self, profile: Dict, signals: Optional[Tuple[Set[str], Set[str]]] = None) -> Tuple[int, int]:
+        """
+        (keyword mask, category mask) of a profile's keyword signals (signals,
+        if already extracted): keywords hashed onto 64 bits, categories one bit
+        each. Two profiles whose masks don't intersect share no keyword and no
+        category.
+        """
+        keywords, categories = signals or self.keyword_matcher.extract_profile_signals(profile)
+        keyword_mask = 0
+        for keyword in keywords:
+            keyword_mask |= 1 << (hash(keyword) & 63)
+        return keyword_mask, _category_mask(frozenset(categories))
+
+    def _semantic_similarities(
+        self,
+        target_embedding: Union[List[float], np.ndarray],
+        embedding_matrix: Optional[Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
+        """
+        EmbeddingService.cosine_similarity of the target against every row of
+        embedding_matrix (0.0 where either vector has zero norm), or None if
+        the dimensions don't match.
+        """
+        if embedding_matrix is None:
+            return None
+        matrix = embedding_matrix['matrix']
+        target = np.asarray(target_embedding, dtype=np.float32)
+        if target.shape != (matrix.shape[1],):
+            return None
+
+        target_norm = np.linalg.norm(target)
+        if target_norm == 0:
+            return np.zeros(len(matrix), dtype=np.float32)
+        return matrix @ (target / target_norm)
+
+    def _iter_block_similarities(
+        self,
+        targets: List[Dict],
+        embedding_matrix: Optional[Dict[str, Any]]
+    ) -> Iterator[Optional[np.ndarray]]:
+        """
+        Per target, _semantic_similarities against embedding_matrix, computed
+        SIMILARITY_BLOCK_SIZE targets at a time with one matrix product.
+        Yields None for targets that have no row in the matrix.
+        """
+        if embedding_matrix is None:
+            for _ in targets:
+                yield None
+            return
 
-        # Sort by score
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        return matches[:top_n]
+        rows = embedding_matrix['rows']
+        matrix = embedding_matrix['matrix']
+        for start in range(0, len(targets), self.SIMILARITY_BLOCK_SIZE):
+            block = targets[start:start + self.SIMILARITY_BLOCK_SIZE]
+            block_rows = [rows.get(t['id']) for t in block]
+            present = [row for row in block_rows if row is not None]
+            if present:
+                block_sims = matrix[present] @ matrix.T
+            position = 0
+            for row in block_rows:
+                if row is None:
+                    yield None
+                else:
+                    yield block_sims[position]
+                    position += 1
 
-    def generate_all_embeddings(self, batch_size: int = 50) -> Dict:
-        """Generate and store embeddings for all profiles without them"""
+    def generate_all_embeddings(self, batch_size: Optional[int] = None) -> Dict:
+        """
+        Generate and store embeddings for all profiles without them, and for
+        profiles whose text changed since their embedding was made, streamed
+        from the database a page at a time. Text some profile already has an
+        embedding for reuses it instead of calling the API. Batches are packed
+        to the embedding provider's limits; batch_size optionally caps them
+        further.
+        """
         if not self.embedding_service:
             return {'success': False, 'error': 'Embedding service not available'}
 
-        profiles = self.directory_service.get_profiles_without_embeddings(limit=1000)
-        if not profiles:
-            return {'success': True, 'profiles_updated': 0, 'message': 'All profiles have embeddings'}
+        from concurrent.futures import ThreadPoolExecutor
 
         updated = 0
         errors = 0
+        reused = 0
 
-        for i in range(0, len(profiles), batch_size):
-            batch = profiles[i:i + batch_size]
-            texts = [self.embedding_service.profile_to_text(p) for p in batch]
-
+        def embed_batch(batch):
+            """Embed one batch of (profile, text, text hash) and store its vectors; returns (updated, errors)"""
+            batch_updated = 0
+            batch_errors = 0
             try:
-                embeddings = self.embedding_service.get_embeddings_batch(texts)
+                embeddings = self.embedding_service.get_embeddings_batch([text for _, text, _ in batch])
 
-                for j, profile in enumerate(batch):
+                for j, (profile, _, text_hash) in enumerate(batch):
+                    # Failed (zero) embeddings get no hash, so they aren't taken as current
                     result = self.directory_service.update_profile_embedding(
-                        profile['id'], embeddings[j]
+                        profile['id'], embeddings[j], text_hash if any(embeddings[j]) else None
                     )
                     if result['success']:
-                        updated += 1
+                        batch_updated += 1
                     else:
-                        errors += 1
+                        batch_errors += 1
             except Exception as e:
                 print(f"Batch embedding error: {e}")
-                errors += len(batch)
+                batch_errors += len(batch)
+            return batch_updated, batch_errors
+
+        # Profiles stream in pages; each page's batches are independent API
+        # round-trips, so a few run at once
+        processed = 0
+        progress = _ProgressPrinter("Progress: {done} profiles processed", None)
+        with ThreadPoolExecutor(max_workers=self.EMBEDDING_WORKERS) as executor:
+            for page in self._iter_profiles_to_embed():
+                # Text already embedded for another profile (or an earlier run) is copied over
+                known = self.directory_service.get_embeddings_by_text_hash([h for _, _, h in page])
+                to_embed = []
+                for profile, text, text_hash in page:
+                    if text_hash not in known:
+                        to_embed.append((profile, text, text_hash))
+                        continue
+                    result = self.directory_service.update_profile_embedding(profile['id'], known[text_hash], text_hash)
+                    if result['success']:
+                        updated += 1
+                        reused += 1
+                    else:
+                        errors += 1
+                    processed += 1
+                    progress.update(processed)
+
+                batches = [
+                    [to_embed[i] for i in indexes]
+                    for indexes in self.embedding_service.pack_batches([t for _, t, _ in to_embed], batch_size)
+                ]
+                for batch, (batch_updated, batch_errors) in zip(batches, executor.map(embed_batch, batches)):
+                    updated += batch_updated
+                    errors += batch_errors
+                    processed += len(batch)
+                    progress.update(processed)
+
+        if not processed:
+            return {'success': True, 'profiles_updated': 0, 'message': 'All profiles have embeddings'}
 
-            print(f"Progress: {i + len(batch)}/{len(profiles)} profiles processed")
+        if updated:
+            self._profile_version += 1
 
         return {
             'success': True,
             'profiles_updated': updated,
+            'embeddings_reused': reused,
             'errors': errors
         }
 
+    def _iter_profiles_to_embed(self) -> Iterator[List[Tuple[Dict, str, str]]]:
+        """
+        Pages of (profile, embedding text, text hash) for generate_all_embeddings:
+        profiles with no embedding, then those whose stored text hash no longer
+        matches their text
+        """
+        for page in self.directory_service.iter_profiles_without_embeddings():
+            texts = [self.embedding_service.profile_to_text(p) for p in page]
+            yield [(p, t, self.embedding_service.text_hash(t)) for p, t in zip(page, texts)]
+
+        for page in self.directory_service.iter_profiles_with_embedding_hashes():
+            changed = []
+            for profile in page:
+                text = self.embedding_service.profile_to_text(profile)
+                text_hash = self.embedding_service.text_hash(text)
+                if text_hash != profile.get('embedding_text_hash'):
+                    changed.append((profile, text, text_hash))
+            if changed:
+                yield changed
+
     def generate_all_matches(
         self,
         top_n: int = 10,
@@ -833,16 +2017,22 @@ class HybridMatchGenerator:
         only_registered: bool = False,
         generate_rich_analysis: bool = True
     ) -> Dict:
-        """Generate hybrid matches for all profiles with optional rich AI analysis"""
+        """
+        Generate hybrid matches for all profiles.
+
+        Rich AI analyses come from ConversationAwareMatchGenerator's two-stage
+        run, which tracks match ids; generate_rich_analysis is accepted for
+        compatibility, and rich_analyses_generated is always 0 here.
+        """
         # Auto-generate embeddings for profiles that don't have them
         if self.embedding_service:
             print("Checking for profiles needing embeddings...")
-            embed_result = self.generate_all_embeddings(batch_size=50)
+            embed_result = self.generate_all_embeddings()
             if embed_result.get('profiles_updated', 0) > 0:
                 print(f"Generated embeddings for {embed_result['profiles_updated']} profiles")
 
         # Get all profiles with embeddings
-        all_profiles = self.directory_service.get_all_profiles_for_matching()
+        all_profiles = self._load_profiles_for_matching()
         if not all_profiles:
             return {'success': False, 'error': 'Failed to fetch profiles'}
 
@@ -856,60 +2046,274 @@ class HybridMatchGenerator:
             target_profiles = all_profiles
 
         total_matches = 0
-        total_rich_analyses = 0
         profiles_processed = 0
 
-        for target in target_profiles:
-            # Get dismissed profiles for this user
-            dismissed_ids = self.directory_service.get_dismissed_profile_ids(target['id'])
+        # Candidate embeddings are stacked once for every target (and kept for
+        # generate_matches_for_user)
+        embedding_matrix = self._build_embedding_matrix(all_profiles) if self.embedding_service else None
+        self._store_packed_profiles(all_profiles, embedding_matrix)
 
-            # Generate matches
-            matches = self.generate_matches_for_profile(
-                target, all_profiles, top_n=top_n, min_score=min_score,
-                dismissed_ids=dismissed_ids
-            )
+        # Dismissals are fetched up front so scoring needs no database access
+        dismissed_by_target = self.directory_service.get_dismissed_profile_ids_bulk(
+            [t['id'] for t in target_profiles]
+        )
 
-            # Store matches with optional rich analysis
-            for match in matches:
-                result = self.directory_service.create_match_suggestion(
-                    profile_id=target['id'],
-                    suggested_profile_id=match['profile']['id'],
-                    match_score=match['score'],
-                    match_reason=match['reason'],
-                    source='hybrid_matcher'
-                )
-                if result['success']:
-                    total_matches += 1
-                    match_id = result.get('data', {}).get('id')
-
-                    # Generate rich AI analysis if enabled
-                    if generate_rich_analysis and self.rich_match_service and match_id:
-                        try:
-                            rich_result = self.rich_match_service.generate_rich_analysis(
-                                target, match['profile']
-                            )
-                            if rich_result.get('success') and rich_result.get('analysis'):
-                                analysis_result = self.directory_service.update_match_rich_analysis(
-                                    match_id, rich_result['analysis']
-                                )
-                                if analysis_result.get('success'):
-                                    total_rich_analyses += 1
-                        except Exception as e:
-                            print(f"Error generating rich analysis: {e}")
+        # Targets without a stored embedding are embedded through the API while
+        # scoring, which stays in this process
+        allow_processes = not self.embedding_service or all(
+            _has_embedding(t.get('embedding_vector')) for t in target_profiles
+        )
+
+        pending = []  # match_suggestions rows awaiting a bulk upsert
+        run = (self, target_profiles, all_profiles, embedding_matrix, dismissed_by_target, top_n, min_score)
+        progress = _ProgressPrinter("  Processed {done}/{total}...", len(target_profiles))
+        for target, results in zip(target_profiles, self._iter_target_results(run, allow_processes)):
+            pending.extend(
+                self._suggestion_row(target['id'], suggested_id, score, reason)
+                for suggested_id, score, reason in results
+            )
+            if len(pending) >= self.SAVE_BATCH_SIZE:
+                total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
+                pending = []
 
             profiles_processed += 1
-            if profiles_processed % 50 == 0:
-                print(f"  Processed {profiles_processed}/{len(target_profiles)}... ({total_rich_analyses} rich analyses)")
+            progress.update(profiles_processed)
+
+        if pending:
+            total_matches += self.directory_service.create_match_suggestions(pending).get('created', 0)
 
         return {
             'success': True,
             'profiles_processed': profiles_processed,
             'matches_created': total_matches,
-            'rich_analyses_generated': total_rich_analyses
+            'rich_analyses_generated': 0
+        }
+
+    def _load_profiles_for_matching(self) -> List[Dict]:
+        """
+        get_all_profiles_for_matching, with embedding_vector read from the
+        on-disk embedding cache (memory-mapped float32 rows) for every profile
+        whose stored embedding JSON is unchanged since it was cached, so only
+        new or changed embeddings are decoded. The cache is rewritten when any
+        were.
+        """
+        all_profiles = self.directory_service.get_all_profiles_for_matching(parse_embeddings=False)
+        cached_rows, cached_matrix = self._load_embedding_cache()
+        dim = cached_matrix.shape[1] if cached_matrix is not None else 0
+
+        entries = {}  # profile_id -> (embedding hash, vector) for the new cache
+        decoded = False
+        for profile in all_profiles:
+            stored = profile.get('embedding')
+            vector = None
+            if stored:
+                key = None
+                from_cache = False
+                if isinstance(stored, str):
+                    key = hashlib.blake2b(stored.encode('utf-8'), digest_size=16).hexdigest()
+                    hit = cached_rows.get(profile['id'])
+                    if hit is not None and hit[1] == key:
+                        vector = cached_matrix[hit[0]]
+                        from_cache = True
+                if vector is None:
+                    try:
+                        vector = json.loads(stored)
+                    except (json.JSONDecodeError, TypeError):
+                        vector = None
+                    if key is not None and _has_embedding(vector):
+                        dim = dim or len(vector)
+                if key is not None and _has_embedding(vector) and len(vector) == dim:
+                    entries.setdefault(profile['id'], (key, vector))
+                    decoded = decoded or not from_cache
+            profile['embedding_vector'] = vector
+
+        if decoded:
+            self._save_embedding_cache(entries, dim)
+        return all_profiles
+
+    def _load_embedding_cache(self) -> Tuple[Dict[str, Tuple[int, str]], Optional[np.ndarray]]:
+        """
+        ({profile_id: (row, embedding hash)}, memory-mapped matrix) from
+        EMBEDDING_CACHE_DIR, or ({}, None) if it is missing or unreadable
+        """
+        try:
+            with open(os.path.join(self.EMBEDDING_CACHE_DIR, 'meta.json'), 'r') as f:
+                meta = json.load(f)
+            matrix = np.load(os.path.join(self.EMBEDDING_CACHE_DIR, meta['matrix']), mmap_mode='r')
+            if matrix.ndim != 2 or matrix.shape[0] != len(meta['ids']):
+                return {}, None
+            rows = {
+                profile_id: (row, key)
+                for row, (profile_id, key) in enumerate(zip(meta['ids'], meta['keys']))
+            }
+            return rows, matrix
+        except FileNotFoundError:
+            return {}, None
+        except Exception as e:
+            logger.warning("Could not load embedding cache: %s", e)
+            return {}, None
+
+    def _save_embedding_cache(self, entries: Dict[str, Tuple[str, Any]], dim: int) -> None:
+        """
+        Write entries ({profile_id: (embedding hash, vector)}) as the embedding
+        cache. Each write goes to a new matrix file and meta.json is replaced
+        last, so readers never pair old metadata with new rows.
+        """
+        if not entries:
+            return
+        try:
+            os.makedirs(self.EMBEDDING_CACHE_DIR, exist_ok=True)
+            matrix = np.empty((len(entries), dim), dtype=np.float32)
+            for row, (_, vector) in enumerate(entries.values()):
+                matrix[row] = vector
+            matrix_name = f"embeddings-{os.getpid()}-{time.time_ns()}.npy"
+            np.save(os.path.join(self.EMBEDDING_CACHE_DIR, matrix_name), matrix)
+
+            meta_path = os.path.join(self.EMBEDDING_CACHE_DIR, 'meta.json')
+            tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'matrix': matrix_name,
+                    'ids': list(entries),
+                    'keys': [key for key, _ in entries.values()],
+                }, f)
+            os.replace(tmp_path, meta_path)
+
+            # Superseded matrices (open memory maps keep their data until closed)
+            for name in os.listdir(self.EMBEDDING_CACHE_DIR):
+                if name.startswith('embeddings-') and name.endswith('.npy') and name != matrix_name:
+                    try:
+                        os.remove(os.path.join(self.EMBEDDING_CACHE_DIR, name))
+                    except OSError:
+                        pass
+        except Exception as e:
+            logger.warning("Could not save embedding cache: %s", e)
+
+    def _get_packed_profiles(self) -> Tuple[List[Dict], Optional[Dict[str, Any]]]:
+        """
+        (all profiles for matching, their embedding matrix), reloaded from the
+        database only when older than PROFILE_CACHE_TTL or when this generator
+        has stored new embeddings since. Returns ([], None) if the fetch fails.
+        """
+        import time
+
+        cache = self._profile_cache
+        if (cache is not None and cache[1] == self._profile_version
+                and time.monotonic() - cache[0] < self.PROFILE_CACHE_TTL):
+            return cache[2], cache[3]
+
+        all_profiles = self._load_profiles_for_matching()
+        if not all_profiles:
+            return [], None
+        embedding_matrix = self._build_embedding_matrix(all_profiles) if self.embedding_service else None
+        self._store_packed_profiles(all_profiles, embedding_matrix)
+        return all_profiles, embedding_matrix
+
+    def _store_packed_profiles(self, all_profiles: List[Dict], embedding_matrix: Optional[Dict[str, Any]]) -> None:
+        """Cache a freshly loaded profile set for _get_packed_profiles"""
+        import time
+
+        self._profile_cache = (time.monotonic(), self._profile_version, all_profiles, embedding_matrix)
+        self._similarity_rows = {}
+
+    def _user_similarities(
+        self,
+        profile_id: str,
+        target_embedding: List[float],
+        embedding_matrix: Optional[Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
+        """
+        _semantic_similarities for a user's stored embedding against the cached
+        profile set, remembered (oldest evicted first) until that set is reloaded.
+        """
+        similarities = self._similarity_rows.get(profile_id)
+        if similarities is None:
+            similarities = self._semantic_similarities(target_embedding, embedding_matrix)
+            if similarities is not None:
+                if len(self._similarity_rows) >= self.SIMILARITY_CACHE_SIZE:
+                    self._similarity_rows.pop(next(iter(self._similarity_rows)))
+                self._similarity_rows[profile_id] = similarities
+        return similarities
+
+    def _suggestion_row(self, profile_id: str, suggested_profile_id: str, score: float, reason: str) -> Dict:
+        """match_suggestions row for one hybrid match"""
+        return {
+            'profile_id': profile_id,
+            'suggested_profile_id': suggested_profile_id,
+            'match_score': score,
+            'match_reason': reason,
+            'source': 'hybrid_matcher'
         }
 
+    def _iter_target_results(self, run: Tuple, allow_processes: bool = True):
+        """
+        Yield _score_hybrid_targets results for run target by target, in target
+        order. Runs in a fork-based process pool when allowed and the platform
+        supports fork: split by target for large runs, or by candidate slice
+        when there are fewer targets than cores (see
+        _iter_candidate_parallel_results). Otherwise scores in-process.
+        """
+        import multiprocessing
+
+        num_targets = len(run[1])
+        chunks = [
+            list(range(i, min(i + self.PARALLEL_CHUNK_SIZE, num_targets)))
+            for i in range(0, num_targets, self.PARALLEL_CHUNK_SIZE)
+        ]
+        cpus = os.cpu_count() or 1
+        can_fork = allow_processes and cpus > 1 and 'fork' in multiprocessing.get_all_start_methods()
+        num_candidates = len(run[2])
+
+        if can_fork and 0 < num_targets < cpus and num_candidates >= self.PARALLEL_MIN_CANDIDATES:
+            yield from self._iter_candidate_parallel_results(run, cpus)
+            return
+
+        workers = min(cpus, len(chunks))
+        if not can_fork or num_targets < self.PARALLEL_MIN_TARGETS or workers < 2:
+            for chunk in chunks:
+                yield from _score_hybrid_targets(run, chunk)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_init_hybrid_worker, initargs=(run,)) as executor:
+            for chunk_results in executor.map(_score_hybrid_worker_chunk, chunks):
+                yield from chunk_results
+
+    def _iter_candidate_parallel_results(self, run: Tuple, workers: int):
+        """
+        _iter_target_results for runs with fewer targets than cores: each
+        target is scored against `workers` candidate slices in parallel, and the
+        per-slice top matches are merged into the overall top_n (ties keep
+        candidate order, as in generate_matches_for_profile).
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        _, target_profiles, all_profiles, embedding_matrix, _, top_n, _ = run
+        positions = {p['id']: i for i, p in enumerate(all_profiles)}
+        similarities = list(self._iter_block_similarities(target_profiles, embedding_matrix))
+
+        slice_size = -(-len(all_profiles) // workers)
+        bounds = [(start, min(start + slice_size, len(all_profiles)))
+                  for start in range(0, len(all_profiles), slice_size)]
+        tasks = [(i, start, end) for i in range(len(target_profiles)) for start, end in bounds]
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_init_hybrid_worker,
+                                 initargs=(run, positions, similarities)) as executor:
+            partials = executor.map(_score_hybrid_candidate_chunk, tasks)
+            for _ in target_profiles:
+                candidates = [match for _, part in zip(bounds, partials) for match in part]
+                top = heapq.nlargest(top_n, candidates, key=lambda m: (m[0], -m[1]))
+                yield [(suggested_id, score, reason) for score, _, suggested_id, reason in top]
+
     def generate_matches_for_user(self, profile_id: str, top_n: int = 10, generate_rich_analysis: bool = True) -> Dict:
-        """Generate hybrid matches for a single user with optional rich AI analysis"""
+        """
+        Generate hybrid matches for a single user. As in generate_all_matches,
+        generate_rich_analysis is accepted for compatibility only.
+        """
         # Get user profile
         profile_result = self.directory_service.get_profile_by_id(profile_id)
         if not profile_result.get('success') or not profile_result.get('data'):
@@ -917,66 +2321,49 @@ class HybridMatchGenerator:
 
         target_profile = profile_result['data']
 
-        # Get all profiles for matching
-        all_profiles = self.directory_service.get_all_profiles_for_matching()
+        # Candidate profiles and their embedding matrix, cached between calls
+        all_profiles, embedding_matrix = self._get_packed_profiles()
         if not all_profiles:
             return {'success': False, 'error': 'Failed to fetch profiles'}
 
         # Get dismissed profiles
         dismissed_ids = self.directory_service.get_dismissed_profile_ids(profile_id)
 
-        # Generate embedding for target if needed
-        if self.embedding_service and not target_profile.get('embedding'):
-            embedding = self.embedding_service.get_profile_embedding(target_profile)
+        # Use the stored embedding if there is one, else generate it
+        similarities = None
+        if self.embedding_service:
+            embedding = None
+            if target_profile.get('embedding'):
+                try:
+                    embedding = json.loads(target_profile['embedding'])
+                except (json.JSONDecodeError, TypeError):
+                    embedding = None
+            if embedding:
+                # A stored embedding's similarities are reused by repeat calls
+                similarities = self._user_similarities(profile_id, embedding, embedding_matrix)
+            else:
+                # Generated as float32, as the similarity product consumes it
+                embedding = self.embedding_service.get_profile_embedding(target_profile, return_numpy=True)
             target_profile['embedding_vector'] = embedding
 
         # Generate matches
         matches = self.generate_matches_for_profile(
             target_profile, all_profiles, top_n=top_n, min_score=10.0,
-            dismissed_ids=dismissed_ids
+            dismissed_ids=dismissed_ids, embedding_matrix=embedding_matrix,
+            similarities=similarities
         )
 
         # Store matches in database
-        matches_created = 0
-        rich_analyses_generated = 0
-
-        for match in matches:
-            # Create the match suggestion first
-            result = self.directory_service.create_match_suggestion(
-                profile_id=profile_id,
-                suggested_profile_id=match['profile']['id'],
-                match_score=match['score'],
-                match_reason=match['reason'],
-                source='hybrid_matcher'
-            )
-
-            if result['success']:
-                matches_created += 1
-                match_id = result.get('data', {}).get('id')
-
-                # Generate rich AI analysis if service available and enabled
-                if generate_rich_analysis and self.rich_match_service and match_id:
-                    try:
-                        rich_result = self.rich_match_service.generate_rich_analysis(
-                            target_profile, match['profile']
-                        )
-
-                        if rich_result.get('success') and rich_result.get('analysis'):
-                            # Store rich analysis in database
-                            analysis_result = self.directory_service.update_match_rich_analysis(
-                                match_id, rich_result['analysis']
-                            )
-                            if analysis_result.get('success'):
-                                rich_analyses_generated += 1
-                                # Add rich analysis to match object for return
-                                match['rich_analysis'] = rich_result['analysis']
-                    except Exception as e:
-                        print(f"Error generating rich analysis for match: {e}")
+        result = self.directory_service.create_match_suggestions([
+            self._suggestion_row(profile_id, match['profile']['id'], match['score'], match['reason'])
+            for match in matches
+        ])
+        matches_created = result.get('created', 0)
 
         return {
             'success': True,
             'matches_created': matches_created,
-            'rich_analyses_generated': rich_analyses_generated,
+            'rich_analyses_generated': 0,
             'matches': matches
         }
 
@@ -1294,7 +2681,10 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
         target_profile: Dict,
         candidate_profile: Dict,
         target_embedding: Optional[List[float]] = None,
-        candidate_embedding: Optional[List[float]] = None
+        candidate_embedding: Optional[List[float]] = None,
+        semantic_similarity: Optional[float] = None,
+        target_signals: Optional[Tuple[Set[str], Set[str]]] = None,
+        candidate_signals: Optional[Tuple[Set[str], Set[str]]] = None
     ) -> Tuple[float, Dict[str, float], List[str], str]:
         """
         Extended hybrid score including conversation signals.
@@ -1304,42 +2694,31 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
 
         # 1. Get base component scores from parent logic
         # Keyword-based scores
-        target_text = ' '.join(filter(None, [
-            target_profile.get('business_focus', ''),
-            target_profile.get('service_provided', ''),
-            target_profile.get('company', '')
-        ]))
-        target_keywords = self.keyword_matcher.extract_keywords(target_text)
-        target_categories = self.keyword_matcher.get_categories(target_keywords)
-
-        candidate_text = ' '.join(filter(None, [
-            candidate_profile.get('business_focus', ''),
-            candidate_profile.get('service_provided', ''),
-            candidate_profile.get('company', '')
-        ]))
-        candidate_keywords = self.keyword_matcher.extract_keywords(candidate_text)
-        candidate_categories = self.keyword_matcher.get_categories(candidate_keywords)
+        target_keywords, target_categories = \
+            target_signals or self.keyword_matcher.extract_profile_signals(target_profile)
+        candidate_keywords, candidate_categories = \
+            candidate_signals or self.keyword_matcher.extract_profile_signals(candidate_profile)
 
         # Keyword overlap score
         common_keywords = target_keywords.intersection(candidate_keywords)
         if target_keywords or candidate_keywords:
-            keyword_score = len(common_keywords) / max(len(target_keywords | candidate_keywords), 1) * 100
+            keyword_score = len(common_keywords) / max(len(target_keywords) + len(candidate_keywords) - len(common_keywords), 1) * 100
         else:
             keyword_score = 0.0
         component_scores['keyword'] = keyword_score
 
         # Category overlap score
-        common_categories = target_categories.intersection(candidate_categories)
         if target_categories or candidate_categories:
-            category_score = len(common_categories) / max(len(target_categories | candidate_categories), 1) * 100
+            category_score = _category_jaccard(target_categories, candidate_categories) * 100
         else:
             category_score = 0.0
         component_scores['category'] = category_score
 
         # Semantic similarity
-        if self.embedding_service and target_embedding and candidate_embedding:
-            semantic_sim = self.embedding_service.cosine_similarity(target_embedding, candidate_embedding)
-            semantic_score = max(0.0, semantic_sim * 100)
+        if self.embedding_service and _has_embedding(target_embedding) and _has_embedding(candidate_embedding):
+            if semantic_similarity is None:
+                semantic_similarity = self.embedding_service.cosine_similarity(target_embedding, candidate_embedding)
+            semantic_score = max(0.0, float(semantic_similarity) * 100)
         else:
             semantic_score = (keyword_score + category_score) / 2
         component_scores['semantic'] = semantic_score
@@ -1375,7 +2754,7 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
         if conversation_score > 60:
             collaboration_idea = f"[Strong conversation signal] {collaboration_idea}"
 
-        return round(total_score, 1), component_scores, list(common_keywords)[:5], collaboration_idea
+        return round(total_score, 1), component_scores, list(islice(common_keywords, 5)), collaboration_idea
 
     def _build_match_context(self, seeker_profile_id: str, match_profile_id: str) -> Optional[Dict]:
         """
@@ -1622,66 +3001,60 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
 
         return results
 
-    def _batch_save_all_matches(self, all_matches: List[Dict]) -> int:
+    def _two_stage_row(self, match: Dict) -> Dict:
+        """match_suggestions row for one two-stage match entry"""
+        match_data = {
+            "profile_id": match['profile_id'],
+            "suggested_profile_id": match['suggested_profile_id'],
+            "match_score": match.get('score', 0),
+            "match_reason": match.get('reason', ''),
+            "source": "hybrid_matcher",
+            "status": "pending"
+        }
+
+        # Add rich analysis if available
+        if match.get('rich_analysis'):
+            match_data['rich_analysis'] = match['rich_analysis']
+
+        # Add time-based match context if available
+        if match.get('match_context'):
+            match_data['match_context'] = match['match_context']
+
+        return match_data
+
+    def _save_match_batch(self, batch_data: List[Dict], batch_number: int) -> int:
         """
-        Save all matches in large batches (500 rows per insert).
-        Returns the number of matches saved successfully.
+        Upsert one batch of match_suggestions rows, falling back to row-by-row
+        upserts if the batch fails. Returns the number of rows saved.
         """
-        if not all_matches:
+        if not batch_data:
             return 0
 
-        BATCH_SIZE = 500
-        saved = 0
-
         # Get supabase client
         supabase = self.directory_service.supabase
 
-        for i in range(0, len(all_matches), BATCH_SIZE):
-            batch = all_matches[i:i + BATCH_SIZE]
-
-            batch_data = []
-            for match in batch:
-                match_data = {
-                    "profile_id": match['profile_id'],
-                    "suggested_profile_id": match['suggested_profile_id'],
-                    "match_score": match.get('score', 0),
-                    "match_reason": match.get('reason', ''),
-                    "source": "hybrid_matcher",
-                    "status": "pending"
-                }
-
-                # Add rich analysis if available
-                if match.get('rich_analysis'):
-                    match_data['rich_analysis'] = match['rich_analysis']
-
-                # Add time-based match context if available
-                if match.get('match_context'):
-                    match_data['match_context'] = match['match_context']
-
-                batch_data.append(match_data)
-
-            try:
-                # Use upsert to handle duplicates
-                result = supabase.table("match_suggestions").upsert(
-                    batch_data,
-                    on_conflict="profile_id,suggested_profile_id"
-                ).execute()
-                saved += len(batch_data)
-                print(f"  Saved batch {i//BATCH_SIZE + 1}: {len(batch_data)} matches")
-            except Exception as e:
-                print(f"  Error saving batch: {e}")
-                # Try individual inserts as fallback
-                for match_data in batch_data:
-                    try:
-                        supabase.table("match_suggestions").upsert(
-                            match_data,
-                            on_conflict="profile_id,suggested_profile_id"
-                        ).execute()
-                        saved += 1
-                    except:
-                        pass
-
-        return saved
+        try:
+            # Use upsert to handle duplicates
+            supabase.table("match_suggestions").upsert(
+                batch_data,
+                on_conflict="profile_id,suggested_profile_id"
+            ).execute()
+            print(f"  Saved batch {batch_number}: {len(batch_data)} matches")
+            return len(batch_data)
+        except Exception as e:
+            print(f"  Error saving batch: {e}")
+            # Try individual inserts as fallback
+            saved = 0
+            for match_data in batch_data:
+                try:
+                    supabase.table("match_suggestions").upsert(
+                        match_data,
+                        on_conflict="profile_id,suggested_profile_id"
+                    ).execute()
+                    saved += 1
+                except:
+                    pass
+            return saved
 
     def generate_matches_two_stage(
         self,
@@ -1709,7 +3082,7 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
         start_time = time.time()
 
         # Get all profiles
-        all_profiles = self.directory_service.get_all_profiles_for_matching()
+        all_profiles = self._load_profiles_for_matching()
         if not all_profiles:
             return {'success': False, 'error': 'Failed to fetch profiles'}
 
@@ -1727,20 +3100,33 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
         profile_id_list = [p['id'] for p in all_profiles]
         self._prefetch_conversation_data(profile_id_list)
 
-        # STAGE 1: Calculate all scores (no OpenAI)
+        # STAGE 1: Calculate all scores (no OpenAI). Rows are saved in batches
+        # as targets are scored; only the matches stage 2 needs are kept.
         stage1_start = time.time()
-        all_matches = []
+        keep_rank = generate_rich_for_top_n if self.rich_match_service else 0
+        top_matches = []
+        pending = []  # match_suggestions rows awaiting a bulk upsert
+        matches_scored = 0
+        saved_count = 0
+        batches_saved = 0
+        embedding_matrix = self._build_embedding_matrix(all_profiles) if self.embedding_service else None
+        target_similarities = self._iter_block_similarities(target_profiles, embedding_matrix)
+        dismissed_by_target = self.directory_service.get_dismissed_profile_ids_bulk(
+            [t['id'] for t in target_profiles]
+        )
+        progress = _ProgressPrinter("  Scored {done}/{total} profiles...", len(target_profiles))
 
-        for idx, target in enumerate(target_profiles):
-            dismissed_ids = self.directory_service.get_dismissed_profile_ids(target['id'])
+        for idx, (target, similarities) in enumerate(zip(target_profiles, target_similarities)):
+            dismissed_ids = dismissed_by_target.get(target['id'], set())
 
             # Generate matches for this profile
             matches = self.generate_matches_for_profile(
                 target, all_profiles, top_n=top_n, min_score=min_score,
-                dismissed_ids=dismissed_ids
+                dismissed_ids=dismissed_ids, embedding_matrix=embedding_matrix,
+                similarities=similarities
             )
 
-            # Add to all_matches with rank and match context
+            # Queue each match (with rank and match context) for saving
             for rank, match in enumerate(matches):
                 match_entry = {
                     'profile_id': target['id'],
@@ -1756,22 +3142,29 @@ class ConversationAwareMatchGenerator(HybridMatchGenerator):
                 if match_context:
                     match_entry['match_context'] = match_context
 
-                all_matches.append(match_entry)
+                pending.append(self._two_stage_row(match_entry))
+                if match_entry['rank'] <= keep_rank:
+                    top_matches.append(match_entry)
+                matches_scored += 1
 
-            if (idx + 1) % 100 == 0:
-                print(f"  Scored {idx + 1}/{len(target_profiles)} profiles...")
+            if len(pending) >= self.SAVE_BATCH_SIZE:
+                batches_saved += 1
+                saved_count += self._save_match_batch(pending, batches_saved)
+                pending = []
 
-        stage1_time = time.time() - stage1_start
-        print(f"Stage 1 complete: {len(all_matches)} matches scored in {stage1_time:.1f}s")
+            progress.update(idx + 1)
 
-        # Save all matches (without rich analysis)
-        saved_count = self._batch_save_all_matches(all_matches)
+        if pending:
+            batches_saved += 1
+            saved_count += self._save_match_batch(pending, batches_saved)
+
+        stage1_time = time.time() - stage1_start
+        print(f"Stage 1 complete: {matches_scored} matches scored in {stage1_time:.1f}s")
         print(f"Saved {saved_count} matches to database")
 
         # STAGE 2: Generate rich analysis for top N matches only
         if generate_rich_for_top_n > 0 and self.rich_match_service:
             stage2_start = time.time()
-            top_matches = [m for m in all_matches if m['rank'] <= generate_rich_for_top_n]
             print(f"Stage 2: Generating rich analysis for {len(top_matches)} top matches...")
 
             # Generate rich analyses in parallel
@@ -1864,11 +3257,37 @@ class V1MatchGenerator:
 
     POPULARITY_CAP = 5  # Max appearances in Top 3 per cycle
     SCALE_PENALTY_THRESHOLD = 0.1  # 10x difference triggers penalty
+    SAVE_BATCH_SIZE = 500  # match_suggestions / match_popularity rows per bulk upsert
+    SCORING_WORKERS = 16  # Threads scoring pairs (OpenAI-bound) in generate_all_matches*
+    PAIR_BLOCK_SIZE = 50  # Pre-filtered pairs per worker task in generate_all_matches_hybrid
+
+    # Words ignored by the fast keyword intent/synergy checks
+    KEYWORD_STOP_WORDS = frozenset({'and', 'the', 'a', 'an', 'or', 'for', 'to', 'in', 'of', 'with'})
+
+    # Match reason suffixes keyed by (is_platinum, activity)
+    REASON_NOTES = {
+        (False, None): "",
+        (False, 'active'): " • Active this week",
+        (False, 'event'): " • Attended same event",
+        (True, None): " ✅ *Verified intent*",
+        (True, 'active'): " ✅ *Verified intent* • Active this week",
+        (True, 'event'): " ✅ *Verified intent* • Attended same event",
+    }
+
+    # On-disk cache of GPT intent verdicts, reused across match cycles
+    SEMANTIC_CACHE_PATH = os.getenv('JV_SEMANTIC_CACHE_PATH', os.path.join('.jv_matcher_cache', 'semantic_intent.json'))
+    SEMANTIC_CACHE_MAX_ENTRIES = 200000
 
     def __init__(self, openai_api_key: Optional[str] = None):
         self.directory_service = DirectoryService(use_admin=True)
         self.supabase = self.directory_service.client
         self._semantic_cache = {}
+        self._persisted_semantic = self._load_semantic_cache()  # content hash -> score
+        self._persisted_semantic_dirty = False
+        self._word_union_cache: Dict[Tuple[str, ...], frozenset] = {}
+        self._active_at_cache: Dict[str, Any] = {}  # last_active_at string -> aware datetime (None if unparseable)
+        self._verified_cache: Dict[str, Dict] = {}  # profile_id -> verified data (per run)
+        self._reason_primary_cache: Dict[Tuple[Any, str], str] = {}  # (candidate id, branch) -> sentence (per run)
 
         # Initialize OpenAI client for semantic matching
         try:
@@ -1876,7 +3295,7 @@ class V1MatchGenerator:
             self.openai_client = OpenAI(api_key=openai_api_key or os.getenv('OPENAI_API_KEY'))
             self._openai_available = True
         except Exception as e:
-            print(f"OpenAI not available for V1MatchGenerator: {e}")
+            logger.warning("OpenAI not available for V1MatchGenerator: %s", e)
             self._openai_available = False
             self.openai_client = None
 
@@ -1965,6 +3384,15 @@ class V1MatchGenerator:
             return 0.0
         return (2 * score_ab * score_ba) / (score_ab + score_ba)
 
+    def calculate_harmonic_mean_batch(self, scores_ab: np.ndarray, scores_ba: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_harmonic_mean over arrays of directional scores.
+        Pairs where AB + BA == 0 score 0.0.
+        """
+        denom = scores_ab + scores_ba
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denom > 0, (2 * scores_ab * scores_ba) / denom, 0.0)
+
     def _get_confidence_tier(self, score: float) -> Optional[Dict[str, Any]]:
         """
         Get confidence tier based on harmonic mean score (V1.5 Tactical).
@@ -2004,6 +3432,44 @@ class V1MatchGenerator:
             }
         return None
 
+    def _semantic_cache_digest(self, cache_key: Tuple[Tuple[str, ...], Tuple[str, ...]]) -> str:
+        """Stable content hash of a (needs, offers) cache key for on-disk storage"""
+        return hashlib.blake2b(json.dumps(cache_key).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_semantic_cache(self) -> Dict[str, float]:
+        """Load persisted intent verdicts from SEMANTIC_CACHE_PATH (empty if missing)"""
+        try:
+            with open(self.SEMANTIC_CACHE_PATH, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Could not load semantic cache: %s", e)
+            return {}
+
+    def _save_semantic_cache(self) -> None:
+        """Write new intent verdicts back to SEMANTIC_CACHE_PATH (atomic replace)"""
+        if not self._persisted_semantic_dirty:
+            return
+
+        # Bound disk usage - drop oldest entries first (dicts keep insertion order)
+        overflow = len(self._persisted_semantic) - self.SEMANTIC_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            for key in list(self._persisted_semantic)[:overflow]:
+                del self._persisted_semantic[key]
+
+        try:
+            cache_dir = os.path.dirname(self.SEMANTIC_CACHE_PATH)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{self.SEMANTIC_CACHE_PATH}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._persisted_semantic, f)
+            os.replace(tmp_path, self.SEMANTIC_CACHE_PATH)
+            self._persisted_semantic_dirty = False
+        except Exception as e:
+            logger.warning("Could not save semantic cache: %s", e)
+
     def calculate_intent_score(self, needs: List[str], offers: List[str]) -> float:
         """
         Binary intent matching: 1.0 if ANY need matches ANY offer, else 0.0
@@ -2017,6 +3483,13 @@ class V1MatchGenerator:
         if cache_key in self._semantic_cache:
             return self._semantic_cache[cache_key]
 
+        # Then verdicts persisted by previous match cycles
+        digest = self._semantic_cache_digest(cache_key)
+        if digest in self._persisted_semantic:
+            score = self._persisted_semantic[digest]
+            self._semantic_cache[cache_key] = score
+            return score
+
         if self._openai_available and self.openai_client:
             try:
                 prompt = f"""Compare these two lists and determine if ANY item from NEEDS semantically matches ANY item from OFFERS.
@@ -2045,20 +3518,28 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 result = response.choices[0].message.content.strip().upper()
                 score = 1.0 if result == "YES" else 0.0
                 self._semantic_cache[cache_key] = score
+                self._persisted_semantic[digest] = score
+                self._persisted_semantic_dirty = True
                 return score
 
             except Exception as e:
-                print(f"Semantic matching error: {e}")
-
-        # Fallback to simple keyword matching
-        for need in needs:
-            need_words = set(need.lower().split())
-            for offer in offers:
-                offer_words = set(offer.lower().split())
-                if need_words & offer_words:  # Any word overlap
-                    return 1.0
+                logger.warning("Semantic matching error: %s", e)
+
+        # Fallback to simple keyword matching: some need/offer pair shares a
+        # word exactly when the per-list word unions intersect
+        if self._word_union(needs) & self._word_union(offers):
+            return 1.0
         return 0.0
 
+    def _word_union(self, items: List[str]) -> frozenset:
+        """Lowercased words across all items, tokenized once per distinct list"""
+        key = tuple(items)
+        words = self._word_union_cache.get(key)
+        if words is None:
+            words = frozenset(w for item in items for w in item.lower().split())
+            self._word_union_cache[key] = words
+        return words
+
     def calculate_synergy_score(
         self,
         niche_a: str,
@@ -2177,10 +3658,21 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
             return 0.3  # Unknown = lower priority
 
         if isinstance(last_active_at, str):
-            try:
-                last_active_at = datetime.fromisoformat(last_active_at.replace('Z', '+00:00'))
-            except:
+            # Each profile's timestamp is scored once per pair and direction,
+            # so parse each distinct string once (None marks unparseable)
+            if last_active_at in self._active_at_cache:
+                parsed = self._active_at_cache[last_active_at]
+            else:
+                try:
+                    parsed = datetime.fromisoformat(last_active_at.replace('Z', '+00:00'))
+                    if parsed.tzinfo is None:
+                        parsed = parsed.replace(tzinfo=timezone.utc)
+                except:
+                    parsed = None
+                self._active_at_cache[last_active_at] = parsed
+            if parsed is None:
                 return 0.3
+            last_active_at = parsed
 
         if last_active_at.tzinfo is None:
             last_active_at = last_active_at.replace(tzinfo=timezone.utc)
@@ -2206,7 +3698,19 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         Get verified intent data with fallback chain:
         1. Verified intake (Platinum) - 1.0x weight
         2. Profile fields (Legacy) - 0.3x weight
+
+        Results are memoized in self._verified_cache for the current run.
         """
+        cached = self._verified_cache.get(profile_id)
+        if cached is not None:
+            return cached
+
+        verified = self._fetch_verified_data(profile_id)
+        self._verified_cache[profile_id] = verified
+        return verified
+
+    def _fetch_verified_data(self, profile_id: str) -> Dict:
+        """Fetch verified data for a single profile (uncached, 1-2 queries)"""
         # Try intake_submissions first (Platinum trust)
         try:
             intake_result = self.supabase.table("intake_submissions") \
@@ -2217,17 +3721,9 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 .execute()
 
             if intake_result.data and intake_result.data[0].get('confirmed_at'):
-                intake = intake_result.data[0]
-                return {
-                    'offers': intake.get('verified_offers', []) or [],
-                    'needs': intake.get('verified_needs', []) or [],
-                    'match_preference': intake.get('match_preference', 'Peer_Bundle'),
-                    'events': [intake.get('event_id')] if intake.get('event_id') else [],
-                    'trust_level': 'platinum',
-                    'weight_multiplier': 1.0
-                }
+                return self._verified_from_intake(intake_result.data[0])
         except Exception as e:
-            print(f"Error fetching intake for {profile_id}: {e}")
+            logger.warning("Error fetching intake for %s: %s", profile_id, e)
 
         # Fallback to profile fields (Legacy trust)
         try:
@@ -2238,26 +3734,122 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 .execute()
 
             if profile_result.data:
-                profile = profile_result.data[0]
-                offers = []
-                needs = []
-
-                if profile.get('offering'):
-                    offers = [o.strip() for o in profile['offering'].split(',') if o.strip()]
-                if profile.get('seeking'):
-                    needs = [n.strip() for n in profile['seeking'].split(',') if n.strip()]
-
-                return {
-                    'offers': offers,
-                    'needs': needs,
-                    'match_preference': 'Peer_Bundle',
-                    'events': [],
-                    'trust_level': 'legacy',
-                    'weight_multiplier': 0.3
-                }
+                return self._verified_from_profile(profile_result.data[0])
         except Exception as e:
-            print(f"Error fetching profile {profile_id}: {e}")
+            logger.warning("Error fetching profile %s: %s", profile_id, e)
+
+        return self._unverified_data()
+
+    def _prefetch_verified_data(
+        self,
+        profile_ids: List[str],
+        batch_size: int = 500,
+        profile_rows: Optional[List[Dict]] = None
+    ) -> None:
+        """
+        Warm self._verified_cache for many profiles with batched in_() queries.
+        Replaces 1-2 round-trips per candidate with ~2 queries per batch.
+
+        Args:
+            profile_ids: Profiles to load
+            batch_size: Max ids per in_() list
+            profile_rows: Profile rows the caller already fetched; rows carrying
+                offering/seeking feed the Legacy fallback without re-querying profiles
+        """
+        pending = [pid for pid in dict.fromkeys(profile_ids) if pid not in self._verified_cache]
+        if not pending:
+            return
+
+        loaded_profiles = {
+            p['id']: p for p in (profile_rows or [])
+            if 'offering' in p and 'seeking' in p
+        }
+
+        for i in range(0, len(pending), batch_size):
+            batch = pending[i:i + batch_size]
+
+            # Latest intake per profile (rows arrive newest first)
+            latest_intake = {}
+            try:
+                offset = 0
+                while True:
+                    intake_result = self.supabase.table("intake_submissions") \
+                        .select("*") \
+                        .in_("profile_id", batch) \
+                        .order("created_at", desc=True) \
+                        .range(offset, offset + 999) \
+                        .execute()
+                    rows = intake_result.data or []
+                    for intake in rows:
+                        latest_intake.setdefault(intake.get('profile_id'), intake)
+                    if len(rows) < 1000:
+                        break
+                    offset += 1000
+            except Exception as e:
+                logger.warning("Error prefetching intakes: %s", e)
+
+            legacy_ids = []
+            for pid in batch:
+                intake = latest_intake.get(pid)
+                if intake and intake.get('confirmed_at'):
+                    self._verified_cache[pid] = self._verified_from_intake(intake)
+                elif pid in loaded_profiles:
+                    self._verified_cache[pid] = self._verified_from_profile(loaded_profiles[pid])
+                else:
+                    legacy_ids.append(pid)
+
+            if not legacy_ids:
+                continue
+
+            # Fallback to profile fields (Legacy trust)
+            try:
+                profile_result = self.supabase.table("profiles") \
+                    .select("id, offering, seeking, business_focus") \
+                    .in_("id", legacy_ids) \
+                    .execute()
+                profiles_by_id = {p['id']: p for p in (profile_result.data or [])}
+            except Exception as e:
+                logger.warning("Error prefetching profiles: %s", e)
+                continue  # Leave uncached; _get_verified_data retries per profile
+
+            for pid in legacy_ids:
+                profile = profiles_by_id.get(pid)
+                self._verified_cache[pid] = (
+                    self._verified_from_profile(profile) if profile else self._unverified_data()
+                )
+
+    def _verified_from_intake(self, intake: Dict) -> Dict:
+        """Build Platinum verified data from a confirmed intake submission"""
+        return {
+            'offers': intake.get('verified_offers', []) or [],
+            'needs': intake.get('verified_needs', []) or [],
+            'match_preference': intake.get('match_preference', 'Peer_Bundle'),
+            'events': [intake.get('event_id')] if intake.get('event_id') else [],
+            'trust_level': 'platinum',
+            'weight_multiplier': 1.0
+        }
+
+    def _verified_from_profile(self, profile: Dict) -> Dict:
+        """Build Legacy verified data from profile offering/seeking fields"""
+        offers = []
+        needs = []
+
+        if profile.get('offering'):
+            offers = [o.strip() for o in profile['offering'].split(',') if o.strip()]
+        if profile.get('seeking'):
+            needs = [n.strip() for n in profile['seeking'].split(',') if n.strip()]
+
+        return {
+            'offers': offers,
+            'needs': needs,
+            'match_preference': 'Peer_Bundle',
+            'events': [],
+            'trust_level': 'legacy',
+            'weight_multiplier': 0.3
+        }
 
+    def _unverified_data(self) -> Dict:
+        """Default verified data when neither intake nor profile is available"""
         return {
             'offers': [],
             'needs': [],
@@ -2329,47 +3921,57 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
 
         Instead of database-like "Keyword match: X ↔ Y", create sentences like:
         "They offer Business Coaching, which aligns with your interest in leadership development."
-        """
-        candidate_name = candidate.get('name', 'They').split()[0]  # First name only
 
+        The primary sentence depends only on the candidate and which component
+        won, so it is built once per (candidate, branch) and reused for every
+        target; trust/activity notes come from REASON_NOTES.
+        """
         # Primary reason based on highest scoring component
-        primary = None
-
-        # Intent-based narrative (they have what you need)
         if components.get('intent', 0) > 0.5:
+            branch = 'intent'  # They have what you need
+        elif components.get('synergy', 0) > 0.5:
+            branch = 'synergy'  # Same/complementary space
+        else:
+            branch = 'focus'  # Keyword fallback with better formatting
+
+        cache_key = (candidate.get('id'), branch)
+        primary = self._reason_primary_cache.get(cache_key) if cache_key[0] is not None else None
+        if primary is None:
+            primary = self._build_reason_primary(candidate, branch)
+            if cache_key[0] is not None:
+                self._reason_primary_cache[cache_key] = primary
+
+        # Add trust context and activity context if notable
+        if components.get('momentum', 0) > 0.8:
+            activity = 'active'
+        elif components.get('context', 0) > 0:
+            activity = 'event'
+        else:
+            activity = None
+
+        return primary + self.REASON_NOTES[(trust_level == 'platinum', activity)]
+
+    def _build_reason_primary(self, candidate: Dict, branch: str) -> str:
+        """Primary sentence of a match reason for one candidate and winning branch"""
+        if branch == 'intent':
+            candidate_name = candidate.get('name', 'They').split()[0]  # First name only
             candidate_offering = candidate.get('service_provided') or candidate.get('offering') or candidate.get('business_focus', 'their services')
             # Truncate if too long
             if len(candidate_offering) > 60:
                 candidate_offering = candidate_offering[:57] + "..."
-            primary = f"{candidate_name} offers **{candidate_offering}**, which matches what you're looking for"
+            return f"{candidate_name} offers **{candidate_offering}**, which matches what you're looking for"
 
-        # Synergy-based narrative (same/complementary space)
-        elif components.get('synergy', 0) > 0.5:
+        if branch == 'synergy':
             candidate_niche = candidate.get('business_focus') or candidate.get('niche', 'your space')
             if len(candidate_niche) > 40:
                 candidate_niche = candidate_niche[:37] + "..."
-            primary = f"You're both in the **{candidate_niche}** space with complementary audiences"
+            return f"You're both in the **{candidate_niche}** space with complementary audiences"
 
-        # Keyword fallback with better formatting
-        else:
-            candidate_focus = candidate.get('business_focus') or candidate.get('service_provided', 'business services')
-            if len(candidate_focus) > 50:
-                candidate_focus = candidate_focus[:47] + "..."
-            primary = f"{candidate_name} focuses on **{candidate_focus}**, which could complement your work"
-
-        # Add trust context
-        trust_note = ""
-        if trust_level == 'platinum':
-            trust_note = " ✅ *Verified intent*"
-
-        # Add activity context if notable
-        activity_note = ""
-        if components.get('momentum', 0) > 0.8:
-            activity_note = " • Active this week"
-        elif components.get('context', 0) > 0:
-            activity_note = " • Attended same event"
-
-        return f"{primary}{trust_note}{activity_note}"
+        candidate_name = candidate.get('name', 'They').split()[0]  # First name only
+        candidate_focus = candidate.get('business_focus') or candidate.get('service_provided', 'business services')
+        if len(candidate_focus) > 50:
+            candidate_focus = candidate_focus[:47] + "..."
+        return f"{candidate_name} focuses on **{candidate_focus}**, which could complement your work"
 
     def apply_popularity_cap(
         self,
@@ -2384,17 +3986,35 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         """
         from collections import defaultdict
 
+        # Group matches by target profile
+        by_profile = defaultdict(list)
+        for match in all_matches:
+            by_profile[match['profile_id']].append(match)
+
+        for matches in by_profile.values():
+            matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
+
+        capped = self._apply_popularity_cap_sorted(by_profile, match_cycle_id)
+        return [match for matches in capped.values() for match in matches]
+
+    def _apply_popularity_cap_sorted(
+        self,
+        by_profile: Dict[str, List[Dict]],
+        match_cycle_id: str
+    ) -> Dict[str, List[Dict]]:
+        """
+        Popularity cap over matches already grouped by target profile and
+        sorted by harmonic_mean (descending). Returns the same grouping with
+        over-popular Top 3 entries removed; group order is preserved.
+        """
+        from collections import defaultdict
+
         appearance_count = defaultdict(int)
-        filtered_matches = []
-
-        # Group matches by target profile
-        by_profile = defaultdict(list)
-        for match in all_matches:
-            by_profile[match['profile_id']].append(match)
+        filtered_by_profile = {}
 
-        # Sort each profile's matches and count Top 3 appearances
+        # Count Top 3 appearances in each profile's (sorted) matches
         for profile_id, matches in by_profile.items():
-            matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
+            filtered = []
             for rank, match in enumerate(matches):
                 match['rank'] = rank + 1
                 suggested_id = match['suggested_profile_id']
@@ -2402,23 +4022,27 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 if rank < 3:  # Top 3
                     if appearance_count[suggested_id] < self.POPULARITY_CAP:
                         appearance_count[suggested_id] += 1
-                        filtered_matches.append(match)
+                        filtered.append(match)
                     # else: skip - over popular
                 else:
-                    filtered_matches.append(match)
+                    filtered.append(match)
+            filtered_by_profile[profile_id] = filtered
 
         # Store popularity counts for analytics
+        popularity_rows = [
+            {'profile_id': profile_id, 'match_cycle_id': match_cycle_id, 'top_3_appearances': count}
+            for profile_id, count in appearance_count.items()
+        ]
         try:
-            for profile_id, count in appearance_count.items():
-                self.supabase.table("match_popularity").upsert({
-                    'profile_id': profile_id,
-                    'match_cycle_id': match_cycle_id,
-                    'top_3_appearances': count
-                }, on_conflict="profile_id,match_cycle_id").execute()
+            for i in range(0, len(popularity_rows), self.SAVE_BATCH_SIZE):
+                execute_with_retry(self.supabase.table("match_popularity").upsert(
+                    popularity_rows[i:i + self.SAVE_BATCH_SIZE],
+                    on_conflict="profile_id,match_cycle_id"
+                ))
         except Exception as e:
-            print(f"Error updating popularity: {e}")
+            logger.warning("Error updating popularity: %s", e)
 
-        return filtered_matches
+        return filtered_by_profile
 
     def generate_all_matches_fast(
         self,
@@ -2444,10 +4068,10 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         from collections import defaultdict
         start_time = time.time()
 
-        print(f"[V1-FAST] Starting optimized match generation for cycle: {match_cycle_id}")
+        logger.info("[V1-FAST] Starting optimized match generation for cycle: %s", match_cycle_id)
 
         # Step 1: Batch fetch ALL matchable profiles (have offering OR niche)
-        print("[V1-FAST] Fetching matchable profiles (offering OR niche)...")
+        logger.info("[V1-FAST] Fetching matchable profiles (offering OR niche)...")
         try:
             profiles_with_offers = self._fetch_matchable_profiles_paginated(
                 select_fields="id, name, company, offering, seeking, niche, business_focus, list_size, social_reach, last_active_at"
@@ -2455,7 +4079,7 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         except Exception as e:
             return {'success': False, 'error': f'Failed to fetch profiles: {e}'}
 
-        print(f"[V1-FAST] Found {len(profiles_with_offers)} matchable profiles")
+        logger.info("[V1-FAST] Found %d matchable profiles", len(profiles_with_offers))
 
         if len(profiles_with_offers) < 2:
             return {'success': False, 'error': 'Not enough profiles with offering data'}
@@ -2478,12 +4102,14 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 'list_size': p.get('list_size') or 0,
                 'social_reach': p.get('social_reach') or 0,
                 'last_active_at': p.get('last_active_at'),
+                'sig_offers': self._keyword_signature(offers),
+                'sig_needs': self._keyword_signature(needs),
                 # Default to legacy trust (no intake form)
                 'trust_level': 'legacy',
                 'weight_multiplier': 0.3
             }
 
-        print(f"[V1-FAST] Pre-processed {len(profile_data)} profiles")
+        logger.info("[V1-FAST] Pre-processed %d profiles", len(profile_data))
 
         # Step 3: Generate matches using keyword matching (no OpenAI calls)
         all_matches = []
@@ -2492,13 +4118,16 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
 
         profile_ids = list(profile_data.keys())
         total_pairs = len(profile_ids) * (len(profile_ids) - 1) // 2
-        print(f"[V1-FAST] Evaluating up to {total_pairs} pairs...")
+        logger.info("[V1-FAST] Evaluating up to %d pairs...", total_pairs)
 
-        for i, target_id in enumerate(profile_ids):
+        # Only pairs sharing a need/offer word can have an intent match, so
+        # each target visits the later profiles from its words' posting lists
+        for i, later in self._iter_overlap_candidates(profile_ids, profile_data):
+            target_id = profile_ids[i]
             target = profile_data[target_id]
             target_profile = target['profile']
 
-            for j in range(i + 1, len(profile_ids)):
+            for j in later:
                 candidate_id = profile_ids[j]
                 candidate = profile_data[candidate_id]
                 candidate_profile = candidate['profile']
@@ -2538,8 +4167,9 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                     self.WEIGHTS['context'] * context_ba
                 )
 
-                # Harmonic mean (scale to 0-100)
-                harmonic = self.calculate_harmonic_mean(score_ab, score_ba) * 100
+                # Harmonic mean (scale to 0-100), inlined
+                denom = score_ab + score_ba
+                harmonic = ((2 * score_ab * score_ba) / denom if denom else 0.0) * 100
 
                 # Apply trust weighting
                 trust_weight = min(target['weight_multiplier'], candidate['weight_multiplier'])
@@ -2579,9 +4209,10 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
             profiles_processed += 1
             if profiles_processed % 100 == 0:
                 elapsed = time.time() - start_time
-                print(f"[V1-FAST] Processed {profiles_processed}/{len(profile_ids)} profiles ({pairs_evaluated} pairs, {len(all_matches)} matches) in {elapsed:.1f}s")
+                logger.info("[V1-FAST] Processed %d/%d profiles (%d pairs, %d matches) in %.1fs",
+                            profiles_processed, len(profile_ids), pairs_evaluated, len(all_matches), elapsed)
 
-        print(f"[V1-FAST] Generated {len(all_matches)} total matches from {pairs_evaluated} pairs")
+        logger.info("[V1-FAST] Generated %d total matches from %d pairs", len(all_matches), pairs_evaluated)
 
         # Step 4: Keep only top_n per profile
         by_profile = defaultdict(list)
@@ -2591,28 +4222,16 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         # Sort and trim
         final_matches = []
         for profile_id, matches in by_profile.items():
-            matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
-            final_matches.extend(matches[:top_n])
+            final_matches.extend(heapq.nlargest(top_n, matches, key=lambda x: x['harmonic_mean']))
 
-        print(f"[V1-FAST] Trimmed to {len(final_matches)} matches (top {top_n} per profile)")
+        logger.info("[V1-FAST] Trimmed to %d matches (top %d per profile)", len(final_matches), top_n)
 
         # Step 5: Batch save to database
-        saved = 0
-        errors = 0
-        for match in final_matches:
-            try:
-                self.supabase.table("match_suggestions").upsert(
-                    match,
-                    on_conflict="profile_id,suggested_profile_id"
-                ).execute()
-                saved += 1
-            except Exception as e:
-                errors += 1
-                if errors <= 3:
-                    print(f"[V1-FAST] Save error: {e}")
+        saved = self._upsert_matches_in_batches(final_matches, log_prefix="[V1-FAST] ")
+        errors = len(final_matches) - saved
 
         total_time = time.time() - start_time
-        print(f"[V1-FAST] COMPLETE: Saved {saved} matches in {total_time:.1f}s ({errors} errors)")
+        logger.info("[V1-FAST] COMPLETE: Saved %d matches in %.1fs (%d errors)", saved, total_time, errors)
 
         return {
             'success': True,
@@ -2638,12 +4257,81 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 # If any significant word overlaps, count as match
                 overlap = need_words & offer_words
                 # Remove common stop words
-                overlap -= {'and', 'the', 'a', 'an', 'or', 'for', 'to', 'in', 'of', 'with'}
+                overlap -= self.KEYWORD_STOP_WORDS
                 if overlap:
                     return 1.0
 
         return 0.0
 
+    def _keyword_signature(self, items: List[str]) -> int:
+        """
+        64-bit signature of the significant words in items.
+        Two lists can only share a keyword if their signatures share a bit,
+        so a zero AND rules out a _keyword_intent_score match without tokenizing.
+        """
+        sig = 0
+        for item in items:
+            for word in item.lower().split():
+                if word not in self.KEYWORD_STOP_WORDS:
+                    sig |= 1 << (hash(word) & 63)
+        return sig
+
+    def _iter_overlap_candidates(
+        self,
+        profile_ids: List[str],
+        profile_data: Dict[str, Dict],
+        match_niche: bool = False
+    ) -> Iterator[Tuple[int, List[int]]]:
+        """
+        For each position i in profile_ids, the later positions j > i (ascending)
+        whose profile shares a significant need/offer word with it in either
+        direction, found through word -> position posting lists instead of a
+        scan over every pair. With match_niche, profiles whose niches share a
+        word or are identical are included too (_fast_synergy_score >= 0.5).
+        """
+        def words(items):
+            found = set()
+            for item in items:
+                found.update(item.lower().split())
+            return found - self.KEYWORD_STOP_WORDS
+
+        need_words = [words(profile_data[pid]['needs']) for pid in profile_ids]
+        offer_words = [words(profile_data[pid]['offers']) for pid in profile_ids]
+        need_index = defaultdict(list)
+        offer_index = defaultdict(list)
+        for i in range(len(profile_ids)):
+            for word in need_words[i]:
+                need_index[word].append(i)
+            for word in offer_words[i]:
+                offer_index[word].append(i)
+
+        niche_keys = []
+        niche_index = defaultdict(list)
+        if match_niche:
+            for i, pid in enumerate(profile_ids):
+                niche = profile_data[pid]['niche'].lower()
+                # Identical niches match on the whole string, others on shared words
+                keys = {('niche', niche)} if niche else set()
+                if niche:
+                    keys.update(
+                        ('word', word)
+                        for word in set(niche.replace(',', ' ').split()) - self.KEYWORD_STOP_WORDS
+                    )
+                niche_keys.append(keys)
+                for key in keys:
+                    niche_index[key].append(i)
+
+        for i in range(len(profile_ids)):
+            candidates = set()
+            for word in need_words[i]:
+                candidates.update(offer_index.get(word, ()))
+            for word in offer_words[i]:
+                candidates.update(need_index.get(word, ()))
+            if match_niche:
+                for key in niche_keys[i]:
+                    candidates.update(niche_index[key])
+            yield i, sorted(j for j in candidates if j > i)
+
     def _fast_synergy_score(self, niche_a: str, niche_b: str) -> float:
         """Fast niche overlap scoring (no API calls)"""
         if not niche_a or not niche_b:
@@ -2659,14 +4347,14 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         # Word overlap
         words_a = set(niche_a_lower.replace(',', ' ').split())
         words_b = set(niche_b_lower.replace(',', ' ').split())
-        words_a -= {'and', 'the', 'a', 'an', 'or', 'for', 'to', 'in', 'of', 'with'}
-        words_b -= {'and', 'the', 'a', 'an', 'or', 'for', 'to', 'in', 'of', 'with'}
+        words_a -= self.KEYWORD_STOP_WORDS
+        words_b -= self.KEYWORD_STOP_WORDS
 
         if not words_a or not words_b:
             return 0.3
 
         overlap = len(words_a & words_b)
-        total = len(words_a | words_b)
+        total = len(words_a) + len(words_b) - overlap
 
         if overlap > 0:
             return 0.5 + (0.3 * overlap / total)
@@ -2698,12 +4386,12 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         from collections import defaultdict
         start_time = time.time()
 
-        print(f"[V1-HYBRID] Starting two-stage match generation for cycle: {match_cycle_id}")
+        logger.info("[V1-HYBRID] Starting two-stage match generation for cycle: %s", match_cycle_id)
 
         # ============================================
         # STAGE 0: Pre-fetch all matchable profiles (offering OR niche)
         # ============================================
-        print("[V1-HYBRID] Stage 0: Fetching matchable profiles (offering OR niche)...")
+        logger.info("[V1-HYBRID] Stage 0: Fetching matchable profiles (offering OR niche)...")
         try:
             profiles_with_offers = self._fetch_matchable_profiles_paginated(
                 select_fields="id, name, company, offering, seeking, niche, business_focus, list_size, social_reach, last_active_at"
@@ -2711,7 +4399,7 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         except Exception as e:
             return {'success': False, 'error': f'Failed to fetch profiles: {e}'}
 
-        print(f"[V1-HYBRID] Found {len(profiles_with_offers)} matchable profiles")
+        logger.info("[V1-HYBRID] Found %d matchable profiles", len(profiles_with_offers))
 
         if len(profiles_with_offers) < 2:
             return {'success': False, 'error': 'Not enough profiles with offering data'}
@@ -2733,34 +4421,41 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 'list_size': p.get('list_size') or 0,
                 'social_reach': p.get('social_reach') or 0,
                 'last_active_at': p.get('last_active_at'),
+                'sig_offers': self._keyword_signature(offers),
+                'sig_needs': self._keyword_signature(needs),
                 'trust_level': 'legacy',
                 'weight_multiplier': 0.3
             }
 
         profile_ids = list(profile_data.keys())
         total_pairs = len(profile_ids) * (len(profile_ids) - 1) // 2
-        print(f"[V1-HYBRID] Total possible pairs: {total_pairs}")
+        logger.info("[V1-HYBRID] Total possible pairs: %d", total_pairs)
 
         # ============================================
         # STAGE 1: Fast keyword pre-filter
         # ============================================
-        print("[V1-HYBRID] Stage 1: Running keyword pre-filter...")
+        logger.info("[V1-HYBRID] Stage 1: Running keyword pre-filter...")
         candidate_pairs = []
-        pairs_checked = 0
+        pairs_checked = total_pairs  # Every pair is covered by the posting-list lookup
         pairs_passed = 0
 
-        for i, target_id in enumerate(profile_ids):
+        # Pairs sharing no need/offer word and no niche word can't pass either
+        # pre-filter, so only the posting-list candidates are checked
+        for i, later in self._iter_overlap_candidates(profile_ids, profile_data, match_niche=True):
+            target_id = profile_ids[i]
             target = profile_data[target_id]
 
-            for j in range(i + 1, len(profile_ids)):
+            for j in later:
                 candidate_id = profile_ids[j]
                 candidate = profile_data[candidate_id]
-                pairs_checked += 1
 
                 # Pre-filter 1: Check keyword overlap in EITHER direction
+                # (signature bits first; only possible overlaps are tokenized)
                 has_keyword_match = (
-                    self._keyword_intent_score(target['needs'], candidate['offers']) > 0 or
-                    self._keyword_intent_score(candidate['needs'], target['offers']) > 0
+                    ((target['sig_needs'] & candidate['sig_offers']) and
+                     self._keyword_intent_score(target['needs'], candidate['offers']) > 0) or
+                    ((candidate['sig_needs'] & target['sig_offers']) and
+                     self._keyword_intent_score(candidate['needs'], target['offers']) > 0)
                 )
 
                 if not has_keyword_match:
@@ -2779,18 +4474,91 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
 
         filter_rate = 100 * (1 - pairs_passed / max(pairs_checked, 1))
         stage1_time = time.time() - start_time
-        print(f"[V1-HYBRID] Stage 1 complete: {pairs_passed}/{pairs_checked} pairs passed ({filter_rate:.1f}% filtered out) in {stage1_time:.1f}s")
+        logger.info("[V1-HYBRID] Stage 1 complete: %d/%d pairs passed (%.1f%% filtered out) in %.1fs",
+                    pairs_passed, pairs_checked, filter_rate, stage1_time)
 
         # ============================================
         # STAGE 2: Full V1 semantic scoring on candidates
         # ============================================
-        print(f"[V1-HYBRID] Stage 2: Running V1 semantic scoring on {len(candidate_pairs)} candidate pairs...")
+        logger.info("[V1-HYBRID] Stage 2: Running V1 semantic scoring on %d candidate pairs...", len(candidate_pairs))
         stage2_start = time.time()
 
         all_matches = []
         pairs_scored = 0
 
-        for target_id, candidate_id in candidate_pairs:
+        # Pairs are independent; blocks of them are scored on worker threads so
+        # the OpenAI round-trips in calculate_intent_score overlap (results
+        # come back in pair order, so the output matches a sequential run)
+        from concurrent.futures import ThreadPoolExecutor
+        block_size = self.PAIR_BLOCK_SIZE
+        with ThreadPoolExecutor(max_workers=self.SCORING_WORKERS) as executor:
+            for block_matches in executor.map(
+                lambda start: self._score_candidate_pairs(
+                    candidate_pairs[start:start + block_size], profile_data, min_score
+                ),
+                range(0, len(candidate_pairs), block_size)
+            ):
+                all_matches.extend(block_matches)
+                previous = pairs_scored
+                pairs_scored = min(pairs_scored + block_size, len(candidate_pairs))
+                if pairs_scored // 500 > previous // 500:
+                    elapsed = time.time() - stage2_start
+                    logger.info("[V1-HYBRID] Stage 2 progress: %d/%d pairs scored in %.1fs", pairs_scored, len(candidate_pairs), elapsed)
+
+        stage2_time = time.time() - stage2_start
+        self._reason_primary_cache.clear()
+        self._save_semantic_cache()
+        logger.info("[V1-HYBRID] Stage 2 complete: %d matches generated in %.1fs", len(all_matches), stage2_time)
+
+        # ============================================
+        # STAGE 3: Keep top_n per profile and save
+        # ============================================
+        logger.info("[V1-HYBRID] Stage 3: Saving top matches to database...")
+
+        by_profile = defaultdict(list)
+        for match in all_matches:
+            by_profile[match['profile_id']].append(match)
+
+        final_matches = []
+        for profile_id, matches in by_profile.items():
+            final_matches.extend(heapq.nlargest(top_n, matches, key=lambda x: x['harmonic_mean']))
+
+        logger.info("[V1-HYBRID] Trimmed to %d matches (top %d per profile)", len(final_matches), top_n)
+
+        # Batch save (SAVE_BATCH_SIZE rows per request)
+        saved = self._upsert_matches_in_batches(final_matches, log_prefix="[V1-HYBRID] ")
+
+        total_time = time.time() - start_time
+        logger.info("[V1-HYBRID] COMPLETE: Saved %d matches in %.1fs total", saved, total_time)
+        logger.info("[V1-HYBRID] Stats: %d pairs checked, %d passed filter (%.1f%% eliminated), %d saved",
+                    pairs_checked, pairs_passed, filter_rate, saved)
+
+        return {
+            'success': True,
+            'profiles_processed': len(profile_ids),
+            'total_pairs': pairs_checked,
+            'pairs_after_filter': pairs_passed,
+            'filter_elimination_rate': round(filter_rate, 1),
+            'matches_created': saved,
+            'stage1_time_seconds': round(stage1_time, 1),
+            'stage2_time_seconds': round(stage2_time, 1),
+            'total_time_seconds': round(total_time, 1)
+        }
+
+    def _score_candidate_pairs(
+        self,
+        pairs: List[Tuple[str, str]],
+        profile_data: Dict[str, Dict],
+        min_score: float
+    ) -> List[Dict]:
+        """
+        generate_all_matches_hybrid stage 2 for a block of pre-filtered
+        (target_id, candidate_id) pairs: full V1 scoring (semantic intent via
+        OpenAI), returning both directions' rows for pairs above min_score.
+        """
+        matches = []
+
+        for target_id, candidate_id in pairs:
             target = profile_data[target_id]
             candidate = profile_data[candidate_id]
             target_profile = target['profile']
@@ -2824,18 +4592,14 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 self.WEIGHTS['context'] * context
             )
 
-            # Harmonic mean (scale to 0-100)
-            harmonic = self.calculate_harmonic_mean(score_ab, score_ba) * 100
+            # Harmonic mean (scale to 0-100), inlined
+            denom = score_ab + score_ba
+            harmonic = ((2 * score_ab * score_ba) / denom if denom else 0.0) * 100
 
             # Apply trust weighting
             trust_weight = min(target['weight_multiplier'], candidate['weight_multiplier'])
             weighted_score = harmonic * trust_weight
 
-            pairs_scored += 1
-            if pairs_scored % 500 == 0:
-                elapsed = time.time() - stage2_start
-                print(f"[V1-HYBRID] Stage 2 progress: {pairs_scored}/{len(candidate_pairs)} pairs scored in {elapsed:.1f}s")
-
             if weighted_score < min_score:
                 continue
 
@@ -2844,7 +4608,7 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 {'intent': intent_ab, 'synergy': synergy, 'momentum': momentum_ab, 'context': context}, target['trust_level'])
 
             # Add bidirectional matches
-            all_matches.append({
+            matches.append({
                 'profile_id': target_id,
                 'suggested_profile_id': candidate_id,
                 'score_ab': round(score_ab * 100, 2),
@@ -2855,7 +4619,7 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 'match_reason': match_reason
             })
 
-            all_matches.append({
+            matches.append({
                 'profile_id': candidate_id,
                 'suggested_profile_id': target_id,
                 'score_ab': round(score_ba * 100, 2),
@@ -2866,69 +4630,141 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 'match_reason': match_reason
             })
 
-        stage2_time = time.time() - stage2_start
-        print(f"[V1-HYBRID] Stage 2 complete: {len(all_matches)} matches generated in {stage2_time:.1f}s")
-
-        # ============================================
-        # STAGE 3: Keep top_n per profile and save
-        # ============================================
-        print("[V1-HYBRID] Stage 3: Saving top matches to database...")
-
-        by_profile = defaultdict(list)
-        for match in all_matches:
-            by_profile[match['profile_id']].append(match)
-
-        final_matches = []
-        for profile_id, matches in by_profile.items():
-            matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
-            final_matches.extend(matches[:top_n])
+        return matches
 
-        print(f"[V1-HYBRID] Trimmed to {len(final_matches)} matches (top {top_n} per profile)")
+    def _upsert_matches_in_batches(self, rows: List[Dict], log_prefix: str = "") -> int:
+        """
+        Upsert match_suggestions rows SAVE_BATCH_SIZE per request. A batch the
+        API rejects is retried one row per request (_upsert_matches_concurrently),
+        so a bad row only costs its own save.
 
-        # BATCH SAVE - 500 rows per request for ~50x speedup
-        BATCH_SIZE = 500
+        Returns:
+            Number of rows saved
+        """
         saved = 0
-        errors = 0
-
-        for i in range(0, len(final_matches), BATCH_SIZE):
-            batch = final_matches[i:i + BATCH_SIZE]
+        for i in range(0, len(rows), self.SAVE_BATCH_SIZE):
+            batch = rows[i:i + self.SAVE_BATCH_SIZE]
             try:
-                self.supabase.table("match_suggestions").upsert(
+                execute_with_retry(self.supabase.table("match_suggestions").upsert(
                     batch,
                     on_conflict="profile_id,suggested_profile_id"
-                ).execute()
+                ))
                 saved += len(batch)
-                print(f"[V1-HYBRID] Saved batch {i//BATCH_SIZE + 1}: {len(batch)} matches")
+                logger.debug("%sSaved batch %d: %d matches", log_prefix, i // self.SAVE_BATCH_SIZE + 1, len(batch))
             except Exception as e:
-                print(f"[V1-HYBRID] Batch error, falling back to individual saves: {e}")
-                # Fallback to individual saves for this batch
-                for match in batch:
-                    try:
-                        self.supabase.table("match_suggestions").upsert(
-                            match,
-                            on_conflict="profile_id,suggested_profile_id"
-                        ).execute()
-                        saved += 1
-                    except Exception as e2:
-                        errors += 1
-                        if errors <= 3:
-                            print(f"[V1-HYBRID] Save error: {e2}")
+                logger.warning("%sBatch error, falling back to individual saves: %s", log_prefix, e)
+                saved += self._upsert_matches_concurrently(batch, log_prefix=log_prefix)
+        return saved
 
-        total_time = time.time() - start_time
-        print(f"[V1-HYBRID] COMPLETE: Saved {saved} matches in {total_time:.1f}s total")
-        print(f"[V1-HYBRID] Stats: {pairs_checked} pairs checked, {pairs_passed} passed filter ({filter_rate:.1f}% eliminated), {saved} saved")
+    def _upsert_matches_concurrently(self, rows: List[Dict], log_prefix: str = "", max_workers: int = 20) -> int:
+        """
+        Upsert match_suggestions rows one request each, with up to max_workers
+        requests in flight so round-trips overlap instead of queueing.
+        A failed row is logged and skipped without affecting the others.
 
-        return {
-            'success': True,
-            'profiles_processed': len(profile_ids),
-            'total_pairs': pairs_checked,
-            'pairs_after_filter': pairs_passed,
-            'filter_elimination_rate': round(filter_rate, 1),
-            'matches_created': saved,
-            'stage1_time_seconds': round(stage1_time, 1),
-            'stage2_time_seconds': round(stage2_time, 1),
-            'total_time_seconds': round(total_time, 1)
-        }
+        Returns:
+            Number of rows saved
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def save_single(match):
+            try:
+                execute_with_retry(self.supabase.table("match_suggestions").upsert(
+                    match,
+                    on_conflict="profile_id,suggested_profile_id"
+                ))
+                return True
+            except Exception as e:
+                logger.warning("%sError saving match: %s", log_prefix, e)
+                return False
+
+        if not rows:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(rows))) as executor:
+            return sum(executor.map(save_single, rows))
+
+    def _score_target_pairs(
+        self,
+        target_index: int,
+        profile_ids: List[str],
+        profile_data: Dict[str, Dict],
+        min_score: float
+    ) -> List[Dict]:
+        """
+        Score one target against every LATER profile (one generate_all_matches task).
+
+        Directional scores for a pair are computed once and emitted as both
+        the A -> B and B -> A rows, so every unordered pair is scored exactly once.
+
+        Args:
+            target_index: Index of the target in profile_ids
+            profile_ids: Ordered profile IDs for this run
+            profile_data: profile_id -> {'profile': ..., 'verified': ...}
+            min_score: Minimum trust-weighted harmonic mean score (0-100 scale)
+
+        Returns:
+            Match rows (both directions) above min_score
+        """
+        target_id = profile_ids[target_index]
+        target_info = profile_data[target_id]
+        target_profile = target_info['profile']
+        target_verified = target_info['verified']
+        matches = []
+
+        for candidate_id in profile_ids[target_index + 1:]:
+            candidate_info = profile_data[candidate_id]
+            candidate_profile = candidate_info['profile']
+            candidate_verified = candidate_info['verified']
+
+            # Calculate bidirectional scores
+            score_ab, components_ab = self._calculate_directional_score(
+                target_profile, candidate_profile, target_verified, candidate_verified
+            )
+            score_ba, components_ba = self._calculate_directional_score(
+                candidate_profile, target_profile, candidate_verified, target_verified
+            )
+
+            # Harmonic mean (scale to 0-100) - symmetric in AB/BA, inlined per pair
+            denom = score_ab + score_ba
+            harmonic = ((2 * score_ab * score_ba) / denom if denom else 0.0) * 100
+
+            # Apply trust level weighting (also symmetric)
+            trust_weight = min(target_verified['weight_multiplier'], candidate_verified['weight_multiplier'])
+            weighted_score = harmonic * trust_weight
+
+            if weighted_score < min_score:
+                continue
+
+            matches.append({
+                'profile_id': target_id,
+                'suggested_profile_id': candidate_id,
+                'score_ab': round(score_ab * 100, 2),
+                'score_ba': round(score_ba * 100, 2),
+                'harmonic_mean': round(harmonic, 2),
+                'match_score': round(weighted_score, 2),
+                'scale_symmetry_score': round(components_ab['synergy'], 2),
+                'trust_level': target_verified['trust_level'],
+                'match_reason': self._generate_reason(
+                    target_profile, candidate_profile, components_ab, target_verified['trust_level']
+                )
+            })
+
+            matches.append({
+                'profile_id': candidate_id,
+                'suggested_profile_id': target_id,
+                'score_ab': round(score_ba * 100, 2),
+                'score_ba': round(score_ab * 100, 2),
+                'harmonic_mean': round(harmonic, 2),
+                'match_score': round(weighted_score, 2),
+                'scale_symmetry_score': round(components_ba['synergy'], 2),
+                'trust_level': candidate_verified['trust_level'],
+                'match_reason': self._generate_reason(
+                    candidate_profile, target_profile, components_ba, candidate_verified['trust_level']
+                )
+            })
+
+        return matches
 
     def generate_all_matches(
         self,
@@ -2947,7 +4783,7 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         Returns:
             Dict with success status and statistics
         """
-        print(f"Starting V1 match generation for cycle: {match_cycle_id}")
+        logger.info("Starting V1 match generation for cycle: %s", match_cycle_id)
 
         # Get all profiles (with pagination to bypass 1000 row limit)
         try:
@@ -2955,9 +4791,10 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
         except Exception as e:
             return {'success': False, 'error': f'Failed to fetch profiles: {e}'}
 
-        print(f"Found {len(all_profiles)} profiles")
+        logger.info("Found %d profiles", len(all_profiles))
 
-        # Pre-fetch verified data for all profiles
+        # Pre-fetch verified data for all profiles (batched, memoized)
+        self._prefetch_verified_data([p['id'] for p in all_profiles], profile_rows=all_profiles)
         profile_data = {}
         for profile in all_profiles:
             pid = profile['id']
@@ -2966,79 +4803,56 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
                 'verified': self._get_verified_data(pid)
             }
 
-        all_matches = []
+        profile_ids = list(profile_data.keys())
         profiles_processed = 0
 
-        for target_id, target_info in profile_data.items():
-            target_profile = target_info['profile']
-            target_verified = target_info['verified']
-
-            for candidate_id, candidate_info in profile_data.items():
-                if candidate_id == target_id:
-                    continue
-
-                candidate_profile = candidate_info['profile']
-                candidate_verified = candidate_info['verified']
-
-                # Calculate bidirectional scores
-                score_ab, components_ab = self._calculate_directional_score(
-                    target_profile, candidate_profile, target_verified, candidate_verified
-                )
-                score_ba, components_ba = self._calculate_directional_score(
-                    candidate_profile, target_profile, candidate_verified, target_verified
-                )
-
-                # Harmonic mean (scale to 0-100)
-                harmonic = self.calculate_harmonic_mean(score_ab, score_ba) * 100
-
-                # Apply trust level weighting
-                trust_weight = min(target_verified['weight_multiplier'], candidate_verified['weight_multiplier'])
-                weighted_score = harmonic * trust_weight
-
-                if weighted_score < min_score:
-                    continue
+        # Group rows by target as they are scored, keeping a bounded min-heap
+        # per target. The popularity cap can only drop Top 3 entries, so
+        # top_n + 3 rows per target is enough to fill top_n after capping.
+        keep_per_target = top_n + 3
+        heaps_by_target = {pid: [] for pid in profile_ids}
+        seq = 0  # Arrival order - ties keep the earlier candidate, like a stable sort
+
+        # Each target's pair block is independent; threads overlap the OpenAI
+        # round-trips made by calculate_intent_score (shared _semantic_cache)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.SCORING_WORKERS) as executor:
+            for pair_matches in executor.map(
+                lambda i: self._score_target_pairs(i, profile_ids, profile_data, min_score),
+                range(len(profile_ids))
+            ):
+                for match in pair_matches:
+                    heap = heaps_by_target[match['profile_id']]
+                    entry = (match['harmonic_mean'], -seq, match)
+                    seq += 1
+                    if len(heap) < keep_per_target:
+                        heapq.heappush(heap, entry)
+                    else:
+                        heapq.heappushpop(heap, entry)
 
-                all_matches.append({
-                    'profile_id': target_id,
-                    'suggested_profile_id': candidate_id,
-                    'score_ab': round(score_ab * 100, 2),
-                    'score_ba': round(score_ba * 100, 2),
-                    'harmonic_mean': round(harmonic, 2),
-                    'match_score': round(weighted_score, 2),
-                    'scale_symmetry_score': round(components_ab['synergy'], 2),
-                    'trust_level': target_verified['trust_level'],
-                    'match_reason': self._generate_reason(
-                        target_profile, candidate_profile, components_ab, target_verified['trust_level']
-                    )
-                })
+                profiles_processed += 1
+                if profiles_processed % 100 == 0:
+                    logger.info("Processed %d/%d profiles...", profiles_processed, len(all_profiles))
 
-            profiles_processed += 1
-            if profiles_processed % 100 == 0:
-                print(f"Processed {profiles_processed}/{len(all_profiles)} profiles...")
+        # Drain heaps best-first (target order preserved for the popularity cap)
+        matches_by_target = {
+            pid: [entry[2] for entry in sorted(heap, reverse=True)]
+            for pid, heap in heaps_by_target.items()
+        }
 
         # Apply popularity cap
-        filtered_matches = self.apply_popularity_cap(all_matches, match_cycle_id)
+        capped_by_target = self._apply_popularity_cap_sorted(matches_by_target, match_cycle_id)
 
-        # Save to database (keep only top_n per profile)
-        from collections import defaultdict
-        by_profile = defaultdict(list)
-        for match in filtered_matches:
-            by_profile[match['profile_id']].append(match)
-
-        saved = 0
-        for profile_id, matches in by_profile.items():
-            matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
-            for match in matches[:top_n]:
-                try:
-                    self.supabase.table("match_suggestions").upsert(
-                        match,
-                        on_conflict="profile_id,suggested_profile_id"
-                    ).execute()
-                    saved += 1
-                except Exception as e:
-                    print(f"Error saving match: {e}")
+        # Save to database (groups are already sorted - keep only top_n per profile)
+        saved = self._upsert_matches_in_batches(
+            [match for matches in capped_by_target.values() for match in matches[:top_n]]
+        )
 
-        print(f"V1 match generation complete: {saved} matches saved")
+        self._verified_cache.clear()
+        self._reason_primary_cache.clear()
+        self._save_semantic_cache()
+        logger.info("V1 match generation complete: %d matches saved", saved)
 
         return {
             'success': True,
@@ -3047,94 +4861,146 @@ Return ONLY "YES" if there's at least one semantic match, or "NO" if none."""
             'match_cycle_id': match_cycle_id
         }
 
-    def generate_matches_for_user(self, profile_id: str, top_n: int = 10, min_score: float = 5.0) -> Dict:
-        """Generate V1 matches for a specific user"""
-        print(f"[V1] Starting match generation for profile: {profile_id}")
+    def _score_candidate_chunks(
+        self,
+        target_profile: Dict,
+        target_verified: Dict,
+        candidates: List[Dict],
+        chunk_size: int = 1024
+    ) -> Iterator[List[Tuple[Dict, Dict, float, float, Dict]]]:
+        """
+        Yield directional scores for candidates in fixed-size chunks, so callers
+        can reduce each chunk before the next is scored. Candidates must
+        already exclude the target.
+
+        Yields:
+            Lists of (candidate, candidate_verified, score_ab, score_ba, components_ab)
+        """
+        chunk = []
+        for candidate in candidates:
+            candidate_verified = self._get_verified_data(candidate['id'])
+
+            score_ab, components_ab = self._calculate_directional_score(
+                target_profile, candidate, target_verified, candidate_verified
+            )
+            score_ba, components_ba = self._calculate_directional_score(
+                candidate, target_profile, candidate_verified, target_verified
+            )
+            chunk.append((candidate, candidate_verified, score_ab, score_ba, components_ab))
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def generate_matches_for_user(
+        self,
+        profile_id: str,
+        top_n: int = 10,
+        min_score: float = 5.0,
+        include_matches: bool = True
+    ) -> Dict:
+        """
+        Generate V1 matches for a specific user
+
+        Args:
+            include_matches: Return the saved match rows (with candidate profiles);
+                pass False when only the database write and counts are needed
+        """
+        logger.info("[V1] Starting match generation for profile: %s", profile_id)
 
         # Get target profile
         result = self.directory_service.get_profile_by_id(profile_id)
         if not result.get('success') or not result.get('data'):
-            print(f"[V1] ERROR: Profile not found")
+            logger.error("[V1] ERROR: Profile not found")
             return {'success': False, 'error': 'Profile not found'}
 
         target_profile = result['data']
-        target_verified = self._get_verified_data(profile_id)
-        print(f"[V1] Target: {target_profile.get('name')} | Trust: {target_verified['trust_level']} | Offers: {target_verified['offers'][:2] if target_verified['offers'] else 'None'} | Needs: {target_verified['needs'][:2] if target_verified['needs'] else 'None'}")
 
         # Get all profiles
         all_result = self.directory_service.get_all_profiles_for_matching()
         if not all_result:
-            print(f"[V1] ERROR: Failed to fetch profiles")
+            logger.error("[V1] ERROR: Failed to fetch profiles")
             return {'success': False, 'error': 'Failed to fetch profiles'}
 
-        print(f"[V1] Evaluating {len(all_result)} candidate profiles...")
+        # Warm verified-data cache for target and candidates in batched queries
+        self._prefetch_verified_data(
+            [profile_id] + [c['id'] for c in all_result],
+            profile_rows=[target_profile] + all_result
+        )
 
-        matches = []
+        target_verified = self._get_verified_data(profile_id)
+        logger.info("[V1] Target: %s | Trust: %s | Offers: %s | Needs: %s", target_profile.get('name'),
+                    target_verified['trust_level'], target_verified['offers'][:2] or 'None', target_verified['needs'][:2] or 'None')
+        logger.info("[V1] Evaluating %d candidate profiles...", len(all_result))
+        candidates = [c for c in all_result if c['id'] != profile_id]
+
+        # Stream scored chunks through harmonic mean, trust weighting and threshold,
+        # keeping only the running top N (best first, ties in candidate order)
+        top_scored = []  # (candidate, candidate_verified, score_ab, score_ba, components_ab, harmonic, weighted)
         scores_above_zero = 0
+        above_threshold = 0
+        for chunk in self._score_candidate_chunks(target_profile, target_verified, candidates):
+            scores_ab = np.array([s[2] for s in chunk], dtype=np.float64)
+            scores_ba = np.array([s[3] for s in chunk], dtype=np.float64)
+            candidate_weights = np.array([s[1]['weight_multiplier'] for s in chunk], dtype=np.float64)
 
-        for candidate in all_result:
-            if candidate['id'] == profile_id:
-                continue
-
-            candidate_verified = self._get_verified_data(candidate['id'])
-
-            score_ab, components_ab = self._calculate_directional_score(
-                target_profile, candidate, target_verified, candidate_verified
-            )
-            score_ba, components_ba = self._calculate_directional_score(
-                candidate, target_profile, candidate_verified, target_verified
-            )
-
-            harmonic = self.calculate_harmonic_mean(score_ab, score_ba) * 100
-            trust_weight = min(target_verified['weight_multiplier'], candidate_verified['weight_multiplier'])
-            weighted_score = harmonic * trust_weight
-
-            if harmonic > 0:
-                scores_above_zero += 1
+            harmonic = self.calculate_harmonic_mean_batch(scores_ab, scores_ba) * 100
+            weighted = harmonic * np.minimum(target_verified['weight_multiplier'], candidate_weights)
+            scores_above_zero += int(np.count_nonzero(harmonic > 0))
 
             # Lower threshold to allow more matches through (default 5.0 instead of 15.0)
-            if weighted_score >= min_score:
-                # V1.5: Include winning_preference for smart template selection
-                winning_pref = components_ab.get('winning_preference', 'Peer_Bundle')
-
-                matches.append({
-                    'profile_id': profile_id,
-                    'suggested_profile_id': candidate['id'],
-                    'profile': candidate,
-                    'score_ab': round(score_ab * 100, 2),
-                    'score_ba': round(score_ba * 100, 2),
-                    'harmonic_mean': round(harmonic, 2),
-                    'match_score': round(weighted_score, 2),
-                    'trust_level': target_verified['trust_level'],
-                    'winning_preference': winning_pref,  # V1.5: For Draft Intro template
-                    'match_reason': self._generate_reason(
-                        target_profile, candidate, components_ab, target_verified['trust_level']
-                    )
-                })
+            passing = np.flatnonzero(weighted >= min_score).tolist()
+            above_threshold += len(passing)
+
+            # Keep top N by (rounded) harmonic mean - partial selection, no full sort
+            top_scored = heapq.nlargest(
+                top_n,
+                top_scored + [chunk[i] + (float(harmonic[i]), float(weighted[i])) for i in passing],
+                key=lambda s: round(s[5], 2)
+            )
 
-        print(f"[V1] Scores > 0: {scores_above_zero} | Matches above threshold ({min_score}): {len(matches)}")
+        logger.info("[V1] Scores > 0: %d | Matches above threshold (%s): %d", scores_above_zero, min_score, above_threshold)
 
-        # Sort and keep top N
-        matches.sort(key=lambda x: x['harmonic_mean'], reverse=True)
-        matches = matches[:top_n]
+        matches = []
+        for candidate, candidate_verified, score_ab, score_ba, components_ab, harmonic_mean, weighted_score in top_scored:
+            # V1.5: Include winning_preference for smart template selection
+            winning_pref = components_ab.get('winning_preference', 'Peer_Bundle')
+
+            # Row is the match_suggestions payload as-is; 'profile' is attached after saving
+            matches.append({
+                'profile_id': profile_id,
+                'suggested_profile_id': candidate['id'],
+                'score_ab': round(score_ab * 100, 2),
+                'score_ba': round(score_ba * 100, 2),
+                'harmonic_mean': round(harmonic_mean, 2),
+                'match_score': round(weighted_score, 2),
+                'trust_level': target_verified['trust_level'],
+                'winning_preference': winning_pref,  # V1.5: For Draft Intro template
+                'match_reason': self._generate_reason(
+                    target_profile, candidate, components_ab, target_verified['trust_level']
+                )
+            })
 
         if matches:
-            print(f"[V1] Top match: {matches[0].get('profile', {}).get('name')} | Score: {matches[0].get('harmonic_mean')}")
+            logger.info("[V1] Top match: %s | Score: %s", top_scored[0][0].get('name'), matches[0].get('harmonic_mean'))
 
         # Save to database
-        saved = 0
-        for match in matches:
-            match_copy = {k: v for k, v in match.items() if k != 'profile'}
-            try:
-                self.supabase.table("match_suggestions").upsert(
-                    match_copy,
-                    on_conflict="profile_id,suggested_profile_id"
-                ).execute()
-                saved += 1
-            except Exception as e:
-                print(f"[V1] Error saving match: {e}")
+        saved = self._upsert_matches_in_batches(matches, log_prefix="[V1] ")
+
+        self._verified_cache.clear()
+        self._reason_primary_cache.clear()
+        self._save_semantic_cache()
+        logger.info("[V1] COMPLETE: Saved %d matches to database", saved)
 
-        print(f"[V1] COMPLETE: Saved {saved} matches to database")
+        if not include_matches:
+            return {'success': True, 'matches_created': saved}
+
+        # Attach candidate profiles for callers (in place, after the payloads were sent)
+        for scored, match in zip(top_scored, matches):
+            match['profile'] = scored[0]
 
         return {
             'success': True,
@@ -3157,30 +5023,40 @@ def get_matcher(use_ai: bool = False, use_hybrid: bool = False, use_conversation
 
 
 # CLI for testing
+def summarize_result(result: Dict) -> Dict:
+    """Result dict for display, with any match payload reduced to its count"""
+    summary = {k: v for k, v in result.items() if k != 'matches'}
+    if 'matches' in result:
+        summary['matches'] = len(result['matches'])
+    return summary
+
+
 if __name__ == '__main__':
     import sys
 
+    logging.basicConfig(level=logging.INFO)
+
     if len(sys.argv) > 1:
         if sys.argv[1] == '--all':
             print("Generating keyword-based matches for all profiles...")
             generator = MatchGenerator()
             result = generator.generate_all_matches(top_n=10, min_score=15.0)
-            print(f"\nResult: {result}")
+            print(f"\nResult: {summarize_result(result)}")
         elif sys.argv[1] == '--ai':
             print("Generating AI-powered matches for registered users...")
             generator = AIMatchGenerator()
             result = generator.generate_all_matches(top_n=10, only_registered=True)
-            print(f"\nResult: {result}")
+            print(f"\nResult: {summarize_result(result)}")
         elif sys.argv[1] == '--hybrid':
             print("Generating hybrid matches for all profiles...")
             generator = HybridMatchGenerator()
             result = generator.generate_all_matches(top_n=10, min_score=15.0)
-            print(f"\nResult: {result}")
+            print(f"\nResult: {summarize_result(result)}")
         elif sys.argv[1] == '--embeddings':
             print("Generating embeddings for all profiles...")
             generator = HybridMatchGenerator()
             result = generator.generate_all_embeddings()
-            print(f"\nResult: {result}")
+            print(f"\nResult: {summarize_result(result)}")
     else:
         print("Usage:")
         print("  python match_generator.py --all        # Keyword matching for all")
@@ -11,16 +11,26 @@ Features:
 import os
 import re
 import json
+import time
+import random
 import logging
 import hashlib
+import threading
 from datetime import datetime, date
 from typing import Dict, Any, List, Optional, Callable
 from difflib import SequenceMatcher
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+from openai import OpenAI, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
 from supabase_client import get_admin_client
 from directory_service import DirectoryService
 
+# Optional rapidfuzz import for fast fuzzy name matching (difflib otherwise)
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,6 +38,75 @@ logger = logging.getLogger(__name__)
 # Token/character limits for chunking
 MAX_CHUNK_CHARS = 24000  # ~6000 tokens - larger chunks = fewer API calls
 MAX_PARALLEL_CHUNKS = 4  # Process up to 4 chunks concurrently
+MAX_PARALLEL_TRANSCRIPTS = 10  # Extraction requests in flight in process_transcripts_batch
+TRANSCRIPTS_PER_REQUEST = 6  # Short transcripts sharing one extraction request
+
+# Extracted profile fields and their descriptions, sent as a strict JSON schema
+# (Structured Outputs) instead of spelled out in the prompt
+PROFILE_FIELD_DESCRIPTIONS = {
+    "name": "Person's full name",
+    "email": "Email address if mentioned",
+    "company": "Company or brand name",
+    "what_you_do": "Clear description of their business/service (2-3 sentences)",
+    "who_you_serve": "Target audience/ideal client description",
+    "seeking": "What they're looking for in partnerships",
+    "offering": "What they can offer to partners",
+    "current_projects": "Active projects or initiatives",
+    "contact": "Contact information (phone, website, social media)",
+    "business_focus": "Primary business category/niche",
+    "list_size": "Email list size (0 if not mentioned)",
+    "social_reach": "Social media following (0 if not mentioned)",
+}
+PROFILE_COUNT_FIELDS = {"list_size", "social_reach"}
+
+PROFILE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        field: {
+            "type": "integer" if field in PROFILE_COUNT_FIELDS else ["string", "null"],
+            "description": description
+        }
+        for field, description in PROFILE_FIELD_DESCRIPTIONS.items()
+    },
+    "required": list(PROFILE_FIELD_DESCRIPTIONS),
+    "additionalProperties": False
+}
+
+EXTRACTION_GUIDELINES = (
+    "Use only information explicitly stated, null for anything not mentioned, "
+    "and keep it specific, concise and focused on partnership details."
+)
+
+
+# OpenAI errors worth retrying: rate limits, dropped connections, timeouts and 5xx
+RETRYABLE_OPENAI_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+
+def create_completion_with_retry(
+    client: OpenAI,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    **params
+):
+    """
+    client.chat.completions.create(**params), retrying transient OpenAI errors.
+
+    Uses randomized exponential backoff (base_delay * 2^attempt, times 1-2,
+    capped at max_delay). Other errors (bad requests, auth) are raised
+    immediately, as is the last transient one. The SDK's own retries are
+    turned off for these calls, so max_attempts is the total number of requests.
+    """
+    client = client.with_options(max_retries=0)
+    for attempt in range(max_attempts):
+        try:
+            return client.chat.completions.create(**params)
+        except RETRYABLE_OPENAI_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt) * random.uniform(1, 2))
+            logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            time.sleep(delay)
 
 
 class AIProfileExtractor:
@@ -36,6 +115,17 @@ class AIProfileExtractor:
     and intelligently matches to existing profiles with confidence scoring
     """
 
+    # Optional on-disk copy of each successful extraction, keyed by a hash of
+    # the full request (model, prompt and transcript), so reruns skip the API
+    # call. Off unless JV_EXTRACTION_CACHE_DIR is set: entries hold extracted
+    # personal data (names, emails, contact details). Entries expire after
+    # EXTRACTION_CACHE_MAX_AGE_DAYS and the oldest are evicted past
+    # EXTRACTION_CACHE_MAX_ENTRIES.
+    EXTRACTION_CACHE_DIR = os.getenv('JV_EXTRACTION_CACHE_DIR') or None
+    EXTRACTION_CACHE_MAX_ENTRIES = 5000
+    EXTRACTION_CACHE_MAX_AGE_DAYS = 30
+    EXTRACTION_CACHE_PRUNE_EVERY = 100  # Saves between evictions
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the profile extractor
@@ -50,6 +140,8 @@ class AIProfileExtractor:
         self.client = OpenAI(api_key=self.api_key)
         self.directory_service = DirectoryService(use_admin=True)
         self.supabase = get_admin_client()
+        self._cache_saves = 0  # Extraction cache writes, for periodic pruning
+        self._cache_lock = threading.Lock()
 
     # ============================================
     # ERROR TRACKING METHODS
@@ -266,6 +358,96 @@ class AIProfileExtractor:
         except Exception as e:
             logger.error(f"Failed to update transcript status: {e}")
 
+    def _extraction_request(self, transcript_text: str) -> Dict[str, Any]:
+        """Chat completions parameters for extracting one transcript's profile"""
+        return {
+            "model": "gpt-5-nano",
+            "messages": [
+                {"role": "system", "content": "You are an expert at extracting structured business profile data from conversations."},
+                {"role": "user", "content": f"Extract the speaker's business profile from this transcript. {EXTRACTION_GUIDELINES}\n\nTranscript:\n{transcript_text}"}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "extracted_profile", "strict": True, "schema": PROFILE_JSON_SCHEMA}
+            }
+        }
+
+    def _extraction_result(self, content: str) -> Dict[str, Any]:
+        """extract_profile_from_transcript's result for a completion's JSON content"""
+        extracted_data = json.loads(content)
+        logger.info(f"Successfully extracted profile for: {extracted_data.get('name', 'Unknown')}")
+
+        return {
+            "success": True,
+            "data": extracted_data,
+            "confidence": self._calculate_extraction_confidence(extracted_data)
+        }
+
+    def _extraction_cache_path(self, request: Dict[str, Any]) -> Optional[str]:
+        """
+        Cache file for an _extraction_request (a prompt or model change gives a
+        new key), or None when the extraction cache is off
+        """
+        if not self.EXTRACTION_CACHE_DIR:
+            return None
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+        return os.path.join(self.EXTRACTION_CACHE_DIR, f"{key}.json")
+
+    def _load_cached_extraction(self, cache_path: Optional[str]) -> Optional[str]:
+        """Completion content cached at cache_path, or None (also if expired)"""
+        if cache_path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.EXTRACTION_CACHE_MAX_AGE_DAYS * 86400:
+                return None
+            with open(cache_path, 'r') as f:
+                return json.load(f)['content']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not load cached extraction: {e}")
+            return None
+
+    def _save_cached_extraction(self, cache_path: Optional[str], content: str) -> None:
+        """Write completion content to cache_path (atomically replaced), pruning the cache periodically"""
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'content': content}, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save cached extraction: {e}")
+            return
+
+        with self._cache_lock:
+            prune = self._cache_saves % self.EXTRACTION_CACHE_PRUNE_EVERY == 0
+            self._cache_saves += 1
+        if prune:
+            self._prune_extraction_cache()
+
+    def _prune_extraction_cache(self) -> None:
+        """Delete expired cache entries, then the oldest beyond EXTRACTION_CACHE_MAX_ENTRIES"""
+        try:
+            entries = []
+            for entry in os.scandir(self.EXTRACTION_CACHE_DIR):
+                if entry.name.endswith('.json'):
+                    entries.append((entry.stat().st_mtime, entry.path))
+            entries.sort()
+
+            cutoff = time.time() - self.EXTRACTION_CACHE_MAX_AGE_DAYS * 86400
+            expired = sum(1 for mtime, _ in entries if mtime < cutoff)
+            overflow = len(entries) - self.EXTRACTION_CACHE_MAX_ENTRIES
+            for _, path in entries[:max(expired, overflow)]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        except Exception as e:
+            logger.warning(f"Could not prune extraction cache: {e}")
+
     def extract_profile_from_transcript(self, transcript_text: str) -> Dict[str, Any]:
         """
         Extract structured profile data from a transcript using GPT-4o-mini
@@ -279,59 +461,239 @@ class AIProfileExtractor:
         try:
             logger.info("Extracting profile data from transcript")
 
-            prompt = """
-            Extract profile information from this transcript. Return a JSON object with these fields:
+            request = self._extraction_request(transcript_text)
+            cache_path = self._extraction_cache_path(request)
+            content = self._load_cached_extraction(cache_path)
+            if content is not None:
+                logger.info("Using cached extraction for this transcript")
+                return self._extraction_result(content)
 
-            {
-                "name": "Person's full name",
-                "email": "Email address if mentioned",
-                "company": "Company or brand name",
-                "what_you_do": "Clear description of their business/service (2-3 sentences)",
-                "who_you_serve": "Target audience/ideal client description",
-                "seeking": "What they're looking for in partnerships",
-                "offering": "What they can offer to partners",
-                "current_projects": "Active projects or initiatives",
-                "contact": "Contact information (phone, website, social media)",
-                "business_focus": "Primary business category/niche",
-                "list_size": "Email list size (number only, 0 if not mentioned)",
-                "social_reach": "Social media following (number only, 0 if not mentioned)"
+            response = create_completion_with_retry(self.client, **request)
+            content = response.choices[0].message.content
+            result = self._extraction_result(content)
+            # Only responses that parsed are cached
+            self._save_cached_extraction(cache_path, content)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error extracting profile from transcript: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "data": {}
             }
 
-            Guidelines:
-            - Extract only information explicitly stated in the transcript
-            - Use null for fields not mentioned
-            - Be specific and concise
-            - Focus on actionable partnership details
-            - For list_size and social_reach, extract numbers only
+    def extract_profiles_from_transcripts(
+        self,
+        transcripts: List[str],
+        max_concurrency: int = MAX_PARALLEL_TRANSCRIPTS
+    ) -> List[Dict[str, Any]]:
+        """
+        extract_profile_from_transcript for many transcripts. Cached transcripts
+        are served from the extraction cache; the rest are grouped, up to
+        TRANSCRIPTS_PER_REQUEST and MAX_CHUNK_CHARS per group, into one request
+        each (cached by that request), so the prompt is sent once per group. Groups run up to
+        max_concurrency at a time. A group whose response doesn't come back as
+        one profile per transcript falls back to one request per transcript.
 
-            Transcript:
-            """
+        Args:
+            transcripts: Transcript texts to extract
+            max_concurrency: Maximum extraction requests in flight
 
-            response = self.client.chat.completions.create(
-                model="gpt-5-nano",
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting structured business profile data from conversations."},
-                    {"role": "user", "content": f"{prompt}\n\n{transcript_text}"}
-                ],
-                response_format={"type": "json_object"}
-            )
+        Returns:
+            extract_profile_from_transcript's result for each transcript, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transcripts)
+        cache_paths = [self._extraction_cache_path(self._extraction_request(t)) for t in transcripts]
+
+        groups = []
+        group: List[int] = []
+        group_chars = 0
+        for i, transcript_text in enumerate(transcripts):
+            content = self._load_cached_extraction(cache_paths[i])
+            if content is not None:
+                results[i] = self._extraction_result(content)
+                continue
+            if group and (len(group) >= TRANSCRIPTS_PER_REQUEST or group_chars + len(transcript_text) > MAX_CHUNK_CHARS):
+                groups.append(group)
+                group = []
+                group_chars = 0
+            group.append(i)
+            group_chars += len(transcript_text)
+        if group:
+            groups.append(group)
+
+        def extract_group(indexes: List[int]) -> List[Dict[str, Any]]:
+            if len(indexes) == 1:
+                return [self.extract_profile_from_transcript(transcripts[indexes[0]])]
+            # The group's response is cached under its own request, never under
+            # the single-transcript requests it didn't make
+            request = self._multi_extraction_request([transcripts[i] for i in indexes])
+            group_cache_path = self._extraction_cache_path(request)
+            content = self._load_cached_extraction(group_cache_path)
+            try:
+                if content is None:
+                    response = create_completion_with_retry(self.client, **request)
+                    content = response.choices[0].message.content
+                profiles = json.loads(content).get("results")
+            except Exception as e:
+                logger.error(f"Error extracting {len(indexes)} transcripts in one request: {str(e)}")
+                profiles = None
+            if not isinstance(profiles, list) or len(profiles) != len(indexes):
+                return [self.extract_profile_from_transcript(transcripts[i]) for i in indexes]
+            self._save_cached_extraction(group_cache_path, content)
+
+            group_results = []
+            for i, profile in zip(indexes, profiles):
+                if not isinstance(profile, dict):
+                    group_results.append(self.extract_profile_from_transcript(transcripts[i]))
+                    continue
+                group_results.append(self._extraction_result(json.dumps(profile)))
+            return group_results
+
+        if groups:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(groups)))) as executor:
+                for indexes, group_results in zip(groups, executor.map(extract_group, groups)):
+                    for i, result in zip(indexes, group_results):
+                        results[i] = result
+        return results
+
+    def _multi_extraction_request(self, transcripts: List[str]) -> Dict[str, Any]:
+        """Chat completions parameters for extracting several transcripts' profiles at once"""
+        transcripts_text = "\n\n".join(
+            f"=== TRANSCRIPT {i + 1} ===\n{transcript_text}" for i, transcript_text in enumerate(transcripts)
+        )
+        schema = {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": PROFILE_JSON_SCHEMA,
+                    "description": "One profile per transcript, in transcript order"
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False
+        }
+
+        return {
+            "model": "gpt-5-nano",
+            "messages": [
+                {"role": "system", "content": "You are an expert at extracting structured business profile data from conversations."},
+                {"role": "user", "content": (
+                    f"Extract the speaker's business profile from each of these {len(transcripts)} transcripts, "
+                    f"keeping each transcript separate. {EXTRACTION_GUIDELINES}\n\nTranscripts:\n{transcripts_text}"
+                )}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "extracted_profiles", "strict": True, "schema": schema}
+            }
+        }
 
-            extracted_data = json.loads(response.choices[0].message.content)
-            logger.info(f"Successfully extracted profile for: {extracted_data.get('name', 'Unknown')}")
+    # ==========================================
+    # BATCH API EXTRACTION
+    # ==========================================
 
-            return {
-                "success": True,
-                "data": extracted_data,
-                "confidence": self._calculate_extraction_confidence(extracted_data)
-            }
+    def submit_batch_extraction(self, transcripts: List[str]) -> str:
+        """
+        Submit extract_profile_from_transcript for many transcripts as one
+        OpenAI Batch API job: half the cost of realtime requests, with results
+        within 24 hours. Use for bulk runs that don't need profiles right away.
 
-        except Exception as e:
-            logger.error(f"Error extracting profile from transcript: {str(e)}")
-            return {
+        Args:
+            transcripts: Transcript texts to extract
+
+        Returns:
+            The batch ID, for poll_batch and collect_batch_results
+        """
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._extraction_request(transcript_text)
+            })
+            for i, transcript_text in enumerate(transcripts)
+        ]
+        batch_file = self.client.files.create(
+            file=("profile_extraction.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch extraction {batch.id} for {len(transcripts)} transcripts")
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Current state of a submitted batch extraction
+
+        Returns:
+            Dict with: {status, done: bool, completed: int, failed: int, total: int}
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            "status": batch.status,
+            "done": batch.status in ("completed", "failed", "expired", "cancelled"),
+            "completed": counts.completed if counts else 0,
+            "failed": counts.failed if counts else 0,
+            "total": counts.total if counts else 0
+        }
+
+    def collect_batch_results(self, batch_id: str, transcript_count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Results of a finished batch extraction, one per submitted transcript in
+        submission order, shaped like extract_profile_from_transcript's. Requests
+        the batch did not complete come back as failures.
+
+        Args:
+            batch_id: ID returned by submit_batch_extraction
+            transcript_count: Number of transcripts submitted (counted from the
+                batch's input file if not given; a batch that failed validation
+                reports no requests)
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if transcript_count is None:
+            transcript_count = sum(
+                1 for line in self.client.files.content(batch.input_file_id).text.splitlines() if line.strip()
+            )
+        total = transcript_count
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"])
+                if not 0 <= index < total or results[index] is not None:
+                    continue
+                response = record.get("response") or {}
+                try:
+                    if record.get("error") or response.get("status_code") != 200:
+                        raise ValueError(record.get("error") or response.get("body", {}).get("error") or "Request failed")
+                    results[index] = self._extraction_result(
+                        response["body"]["choices"][0]["message"]["content"]
+                    )
+                except Exception as e:
+                    logger.error(f"Error in batch extraction result {index}: {str(e)}")
+                    results[index] = {"success": False, "error": str(e), "data": {}}
+
+        return [
+            result if result is not None else {
                 "success": False,
-                "error": str(e),
+                "error": f"No result in batch {batch_id} (status: {batch.status})",
                 "data": {}
             }
+            for result in results
+        ]
 
     def extract_all_profiles_from_transcript(
         self,
@@ -630,7 +992,8 @@ class AIProfileExtractor:
             Transcript:
             """
 
-            response = self.client.chat.completions.create(
+            response = create_completion_with_retry(
+                self.client,
                 model="gpt-5-nano",
                 messages=[
                     {"role": "system", "content": "You are an expert at identifying all speakers in networking conversations and extracting their business profile data."},
@@ -841,88 +1204,62 @@ class AIProfileExtractor:
                     "message": "Cannot match profile without a name"
                 }
 
-            # Strategy 1: Email match (100% confidence)
-            if email:
-                result = self.directory_service.get_profiles(limit=1)
-                if result["success"] and result["data"]:
-                    for profile in result["data"]:
-                        if (profile.get("email") or "").lower() == email.lower():
-                            logger.info(f"Found exact email match: {profile['id']}")
-                            return {
-                                "action": "update",
-                                "profile_id": profile["id"],
-                                "confidence": 100.0,
-                                "match_details": {
-                                    "strategy": "email_match",
-                                    "matched_field": "email",
-                                    "profile_name": profile.get("name")
-                                },
-                                "message": f"Exact email match found: {profile.get('name')}"
-                            }
-
-            # Get all profiles for fuzzy matching
-            all_profiles_result = self.directory_service.get_profiles(limit=1000)
-            if not all_profiles_result["success"]:
-                logger.error("Failed to retrieve profiles for matching")
-                return {
-                    "action": "review",
-                    "profile_id": None,
-                    "confidence": 0.0,
-                    "match_details": {"reason": "Database error"},
-                    "message": "Unable to retrieve profiles for matching"
-                }
-
-            profiles = all_profiles_result["data"]
-
-            # Strategy 2: Name + Company match (90% confidence)
-            if company:
-                for profile in profiles:
-                    profile_name = (profile.get("name") or "").strip().lower()
-                    profile_company = (profile.get("company") or "").strip().lower()
-
-                    if (self._normalize_name(profile_name) == self._normalize_name((name or "").lower()) and
-                        profile_company and (company or "").lower() in profile_company):
-                        logger.info(f"Found name+company match: {profile['id']}")
-                        return {
-                            "action": "update",
-                            "profile_id": profile["id"],
-                            "confidence": 90.0,
-                            "match_details": {
-                                "strategy": "name_company_match",
-                                "profile_name": profile.get("name"),
-                                "profile_company": profile.get("company")
-                            },
-                            "message": f"Strong match found: {profile.get('name')} at {profile.get('company')}"
-                        }
-
-            # Strategy 3: Exact name match (70% confidence)
-            for profile in profiles:
-                profile_name = (profile.get("name") or "").strip().lower()
-                if self._normalize_name(profile_name) == self._normalize_name((name or "").lower()):
-                    logger.info(f"Found exact name match: {profile['id']}")
+            # Strategies 1-3 only need the profiles sharing the email or the
+            # normalized name, which the database finds through its indexes
+            target_name = self._normalize_name(name)
+            profiles = None
+            lookup = self.directory_service.find_profiles_for_matching(target_name, email)
+            if lookup["success"]:
+                match = self._exact_profile_match(
+                    lookup["data"], target_name, email, company, confidence_threshold
+                )
+                if match:
+                    return match
+
+                # Strategy 4 only scores the names the trigram index finds similar
+                similar = self.directory_service.match_profiles_by_name(target_name)
+                if similar["success"]:
+                    profiles = similar["data"]
+
+            # Without the database functions, every strategy scans the directory
+            if profiles is None:
+                all_profiles_result = self.directory_service.get_profiles(limit=1000)
+                if not all_profiles_result["success"]:
+                    logger.error("Failed to retrieve profiles for matching")
                     return {
-                        "action": "review" if confidence_threshold > 70 else "update",
-                        "profile_id": profile["id"],
-                        "confidence": 70.0,
-                        "match_details": {
-                            "strategy": "exact_name_match",
-                            "profile_name": profile.get("name"),
-                            "profile_company": profile.get("company")
-                        },
-                        "message": f"Name match found: {profile.get('name')} - recommend manual review"
+                        "action": "review",
+                        "profile_id": None,
+                        "confidence": 0.0,
+                        "match_details": {"reason": "Database error"},
+                        "message": "Unable to retrieve profiles for matching"
                     }
 
+                profiles = all_profiles_result["data"]
+
+                if not lookup["success"]:
+                    match = self._exact_profile_match(profiles, target_name, email, company, confidence_threshold)
+                    if match:
+                        return match
+
+            profile_names = [self._normalize_name(profile.get("name") or "") for profile in profiles]
+
             # Strategy 4: Fuzzy name match (50% confidence)
             best_match = None
             best_similarity = 0.0
 
-            for profile in profiles:
-                profile_name = (profile.get("name") or "").strip().lower()
-                similarity = self._fuzzy_match(self._normalize_name((name or "").lower()), self._normalize_name(profile_name))
+            if RAPIDFUZZ_AVAILABLE:
+                # One native pass over every name, skipping those under 80% similar
+                found = process.extractOne(target_name, profile_names, scorer=fuzz.ratio, score_cutoff=80)
+                if found:
+                    best_similarity = found[1] / 100.0
+                    best_match = profiles[found[2]]
+            else:
+                for profile, profile_name in zip(profiles, profile_names):
+                    similarity = self._fuzzy_match(target_name, profile_name)
 
-                if similarity > best_similarity and similarity >= 0.80:  # 80% string similarity
-                    best_similarity = similarity
-                    best_match = profile
+                    if similarity > best_similarity and similarity >= 0.80:  # 80% string similarity
+                        best_similarity = similarity
+                        best_match = profile
 
             if best_match:
                 confidence = 50.0 + (best_similarity - 0.80) * 100  # Scale 80-100% similarity to 50-70% confidence
@@ -960,6 +1297,80 @@ class AIProfileExtractor:
                 "message": f"Error during matching: {str(e)}"
             }
 
+    def _exact_profile_match(
+        self,
+        profiles: List[Dict[str, Any]],
+        target_name: str,
+        email: str,
+        company: str,
+        confidence_threshold: float
+    ) -> Optional[Dict[str, Any]]:
+        """Email, name + company and exact name strategies over profiles (None if none hit)"""
+        # Strategy 1: Email match (100% confidence)
+        if email:
+            email_index = {}
+            for profile in profiles:
+                if profile.get("email"):
+                    email_index.setdefault(profile["email"].lower(), profile)
+            profile = email_index.get(email.lower())
+            if profile is not None:
+                logger.info(f"Found exact email match: {profile['id']}")
+                return {
+                    "action": "update",
+                    "profile_id": profile["id"],
+                    "confidence": 100.0,
+                    "match_details": {
+                        "strategy": "email_match",
+                        "matched_field": "email",
+                        "profile_name": profile.get("name")
+                    },
+                    "message": f"Exact email match found: {profile.get('name')}"
+                }
+
+        # Profiles sharing the normalized name, kept in fetch order
+        same_name = [
+            profile for profile in profiles
+            if self._normalize_name(profile.get("name") or "") == target_name
+        ]
+
+        # Strategy 2: Name + Company match (90% confidence)
+        if company:
+            target_company = company.lower()
+            for profile in same_name:
+                profile_company = (profile.get("company") or "").strip().lower()
+
+                if profile_company and target_company in profile_company:
+                    logger.info(f"Found name+company match: {profile['id']}")
+                    return {
+                        "action": "update",
+                        "profile_id": profile["id"],
+                        "confidence": 90.0,
+                        "match_details": {
+                            "strategy": "name_company_match",
+                            "profile_name": profile.get("name"),
+                            "profile_company": profile.get("company")
+                        },
+                        "message": f"Strong match found: {profile.get('name')} at {profile.get('company')}"
+                    }
+
+        # Strategy 3: Exact name match (70% confidence)
+        if same_name:
+            profile = same_name[0]
+            logger.info(f"Found exact name match: {profile['id']}")
+            return {
+                "action": "review" if confidence_threshold > 70 else "update",
+                "profile_id": profile["id"],
+                "confidence": 70.0,
+                "match_details": {
+                    "strategy": "exact_name_match",
+                    "profile_name": profile.get("name"),
+                    "profile_company": profile.get("company")
+                },
+                "message": f"Name match found: {profile.get('name')} - recommend manual review"
+            }
+
+        return None
+
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison (remove extra spaces, lowercase)"""
         if not name:
@@ -968,7 +1379,8 @@ class AIProfileExtractor:
 
     def _fuzzy_match(self, str1: str, str2: str) -> float:
         """
-        Calculate fuzzy string similarity using SequenceMatcher
+        Calculate fuzzy string similarity (rapidfuzz's ratio when installed,
+        SequenceMatcher otherwise)
 
         Args:
             str1: First string
@@ -977,6 +1389,8 @@ class AIProfileExtractor:
         Returns:
             Similarity ratio (0.0 to 1.0)
         """
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(str1, str2) / 100.0
         return SequenceMatcher(None, str1, str2).ratio()
 
     def queue_for_review(
@@ -1045,9 +1459,49 @@ class AIProfileExtractor:
         Returns:
             Dict with full processing results
         """
+        # Step 1: Extract profile data
+        extraction_result = self.extract_profile_from_transcript(transcript_text)
+        return self._apply_extraction(transcript_text, extraction_result, auto_update_threshold, auto_create)
+
+    def process_transcripts_batch(
+        self,
+        transcripts: List[str],
+        auto_update_threshold: float = 90.0,
+        auto_create: bool = False,
+        max_concurrency: int = MAX_PARALLEL_TRANSCRIPTS
+    ) -> List[Dict[str, Any]]:
+        """
+        process_transcript for many transcripts. The extraction requests (the
+        slow part; see extract_profiles_from_transcripts) run up to
+        max_concurrency at a time; matching and the resulting profile writes
+        then run one transcript at a time, in input order, so two transcripts
+        about the same person cannot both create a profile.
+
+        Args:
+            transcripts: Transcript texts to process
+            auto_update_threshold: Minimum confidence to auto-update (default 90%)
+            auto_create: Whether to automatically create new profiles (default False)
+            max_concurrency: Maximum extraction requests in flight
+
+        Returns:
+            process_transcript's result for each transcript, in input order
+        """
+        extraction_results = self.extract_profiles_from_transcripts(transcripts, max_concurrency)
+
+        return [
+            self._apply_extraction(transcript_text, extraction_result, auto_update_threshold, auto_create)
+            for transcript_text, extraction_result in zip(transcripts, extraction_results)
+        ]
+
+    def _apply_extraction(
+        self,
+        transcript_text: str,
+        extraction_result: Dict[str, Any],
+        auto_update_threshold: float,
+        auto_create: bool
+    ) -> Dict[str, Any]:
+        """Steps 2-3 of process_transcript: match the extracted profile and act on it"""
         try:
-            # Step 1: Extract profile data
-            extraction_result = self.extract_profile_from_transcript(transcript_text)
             if not extraction_result["success"]:
                 return extraction_result
 
@@ -382,13 +382,13 @@ Important:
                 # Merge with existing
                 existing = unique[matched_key]
 
-                # Merge offers (dedupe)
-                existing.potential_offers = list(set(
+                # Merge offers (order-preserving dedupe, existing first)
+                existing.potential_offers = list(dict.fromkeys(
                     existing.potential_offers + speaker.potential_offers
                 ))[:5]  # Cap at 5
 
                 # Merge needs (dedupe)
-                existing.potential_needs = list(set(
+                existing.potential_needs = list(dict.fromkeys(
                     existing.potential_needs + speaker.potential_needs
                 ))[:5]
 
@@ -401,7 +401,7 @@ Important:
                     existing.company = speaker.company
 
                 # Add more quotes
-                existing.context_quotes = list(set(
+                existing.context_quotes = list(dict.fromkeys(
                     existing.context_quotes + speaker.context_quotes
                 ))[:self.MAX_CONTEXT_QUOTES]
 
@@ -2,6 +2,7 @@
 Supabase client configuration for JV Directory
 """
 import os
+import time
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
@@ -42,3 +43,26 @@ def get_admin_client() -> Client:
     if _admin_client is None:
         _admin_client = get_supabase_admin_client()
     return _admin_client
+
+
+# Substrings that mark a failed request as worth retrying (network / 5xx)
+TRANSIENT_ERROR_MARKERS = (
+    "timeout", "timed out", "connection", "temporarily", "502", "503", "504"
+)
+
+def execute_with_retry(query, max_retries: int = 3, base_delay: float = 0.2):
+    """
+    Execute a PostgREST query builder, retrying transient failures.
+
+    Uses exponential backoff (base_delay * 2^attempt, capped at 2s). Non-transient
+    errors (bad payloads, constraint violations) are raised immediately.
+    """
+    for attempt in range(max_retries):
+        try:
+            return query.execute()
+        except Exception as e:
+            error_str = str(e).lower()
+            transient = any(marker in error_str for marker in TRANSIENT_ERROR_MARKERS)
+            if not transient or attempt == max_retries - 1:
+                raise
+            time.sleep(min(2.0, base_delay * (2 ** attempt)))
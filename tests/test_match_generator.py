@@ -0,0 +1,348 @@
+"""
+Tests for keyword and hybrid match scoring
+"""
+
+import pytest
+import sys
+import os
+import random
+import threading
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import match_generator
+from match_generator import MatchGenerator, HybridMatchGenerator, ConversationAwareMatchGenerator
+from embedding_service import EmbeddingService
+
+
+BUSINESS_WORDS = [
+    "coaching", "wellness", "marketing", "finance", "software", "podcast",
+    "mindset", "fitness", "nutrition", "leadership", "sales", "investing",
+    "branding", "speaking", "health", "automation", "consulting", "training",
+]
+
+
+OTHER_WORDS = [
+    "gardening", "pottery", "knitting", "origami", "birdwatching", "calligraphy",
+    "beekeeping", "woodturning", "quilting", "astronomy",
+]
+
+
+def offline_generator(cls, monkeypatch):
+    """cls with no database and a local-only embedding service"""
+    monkeypatch.setattr(match_generator, "DirectoryService", lambda use_admin=False: None)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    generator = cls()
+    # cosine_similarity needs no client: the pair-by-pair float64 reference
+    generator.embedding_service = object.__new__(EmbeddingService)
+    return generator
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """HybridMatchGenerator with no database and a local-only embedding service"""
+    return offline_generator(HybridMatchGenerator, monkeypatch)
+
+
+@pytest.fixture
+def profiles():
+    """Profiles with random 1536-dimension embeddings and business text"""
+    rng = random.Random(11)
+    np_rng = np.random.default_rng(11)
+    base = np_rng.normal(size=1536)
+    return [
+        {
+            "id": f"p{i:03d}",
+            "name": f"Person {i}",
+            "business_focus": " ".join(rng.sample(BUSINESS_WORDS, 3)),
+            "service_provided": " ".join(rng.sample(BUSINESS_WORDS, 2)),
+            "company": f"Company {i % 7}",
+            "social_reach": rng.choice([0, 500, 2000, 15000]),
+            # Correlated with a shared direction, so similarities spread out
+            "embedding_vector": (base * rng.uniform(0, 1) + np_rng.normal(size=1536)).tolist(),
+        }
+        for i in range(120)
+    ]
+
+
+class TestHybridFloat32Scores:
+    """The float32 embedding matrix must not move rounded match scores"""
+
+    def test_matrix_scores_match_float64_reference(self, generator, profiles):
+        """Scores from the float32 matrix equal pairwise float64 scores, rounded"""
+        compared = 0
+        for target in profiles[:10]:
+            matches = generator.generate_matches_for_profile(
+                target, profiles, top_n=len(profiles), min_score=0.0
+            )
+            scores = {m["profile"]["id"]: m["score"] for m in matches}
+            assert len(scores) == len(profiles) - 1
+
+            for candidate in profiles:
+                if candidate["id"] == target["id"]:
+                    continue
+                _, components, _, _ = generator.calculate_hybrid_score(
+                    target, candidate, target["embedding_vector"], candidate["embedding_vector"]
+                )
+                exact = sum(components[k] * w for k, w in generator.WEIGHTS.items())
+                # float32 may only disagree right at a rounding boundary
+                if abs((exact * 10) % 1 - 0.5) < 1e-3:
+                    continue
+                assert scores[candidate["id"]] == round(exact, 1)
+                compared += 1
+
+        assert compared > 1000
+
+    def test_similarities_close_to_float64(self, generator, profiles):
+        """Matrix cosine similarities stay within float32 precision of float64"""
+        matrix = generator._build_embedding_matrix(profiles)
+        target = profiles[0]["embedding_vector"]
+        similarities = generator._semantic_similarities(target, matrix)
+
+        reference = np.array([
+            EmbeddingService.cosine_similarity(None, target, p["embedding_vector"])
+            for p in profiles
+        ])
+        assert similarities.dtype == np.float32
+        assert np.max(np.abs(similarities - reference)) < 1e-5
+
+
+@pytest.fixture
+def mixed_profiles(profiles):
+    """
+    profiles plus some sharing no keyword or category with them (but close
+    in embedding space), and some with no text
+    """
+    rng = random.Random(5)
+    np_rng = np.random.default_rng(5)
+    others = [
+        {
+            "id": f"q{i:03d}",
+            "name": f"Hobbyist {i}",
+            "business_focus": " ".join(rng.sample(OTHER_WORDS, 3)) if i % 5 else "",
+            "service_provided": "",
+            "company": "",
+            "social_reach": rng.choice([0, 800, 40000]),
+            # Near another profile's embedding, so semantic scores alone can qualify
+            "embedding_vector": (
+                np.asarray(profiles[i]["embedding_vector"]) + np_rng.normal(scale=0.6, size=1536)
+            ).tolist(),
+        }
+        for i in range(80)
+    ]
+    return profiles + others
+
+
+def count_hybrid_scores(monkeypatch, generator):
+    """Wrap generator.calculate_hybrid_score with a call counter"""
+    calls = []
+    score = generator.calculate_hybrid_score
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return score(*args, **kwargs)
+
+    monkeypatch.setattr(generator, "calculate_hybrid_score", counted)
+    return calls
+
+
+def assert_pruned_matches_unpruned(monkeypatch, generator, profiles, top_n=5, min_score=15.0):
+    """Bound pruning must return exactly the unpruned list, filtered and truncated"""
+    calls = count_hybrid_scores(monkeypatch, generator)
+    pruned_calls = unpruned_calls = 0
+    for target in profiles[::7]:
+        del calls[:]
+        pruned = generator.generate_matches_for_profile(
+            target, profiles, top_n=top_n, min_score=min_score
+        )
+        pruned_calls += len(calls)
+
+        del calls[:]
+        everything = generator.generate_matches_for_profile(
+            target, profiles, top_n=len(profiles), min_score=-1.0
+        )
+        unpruned_calls += len(calls)
+        expected = [m for m in everything if m["score"] >= min_score][:top_n]
+
+        assert [(m["profile"]["id"], m["score"]) for m in pruned] == \
+            [(m["profile"]["id"], m["score"]) for m in expected]
+
+    # The bound has to have skipped candidates for this to test anything
+    assert pruned_calls < unpruned_calls
+
+
+class TestHybridBoundPruning:
+    """Skipping candidates by score bound must not change the top matches"""
+
+    def test_hybrid_pruned_top_n(self, monkeypatch, generator, mixed_profiles):
+        """HybridMatchGenerator, top 5 above 15"""
+        assert_pruned_matches_unpruned(monkeypatch, generator, mixed_profiles)
+
+    def test_hybrid_pruned_high_cutoff(self, monkeypatch, generator, mixed_profiles):
+        """A cutoff most candidates miss"""
+        assert_pruned_matches_unpruned(monkeypatch, generator, mixed_profiles, top_n=10, min_score=40.0)
+
+    def test_conversation_aware_pruned_top_n(self, monkeypatch, mixed_profiles):
+        """ConversationAwareMatchGenerator's weights and conversation scores"""
+        generator = offline_generator(ConversationAwareMatchGenerator, monkeypatch)
+        # Every seventh profile asked to meet every target; others share a conversation
+        generator._signals_by_target = {
+            target["id"]: [
+                {"profile_id": p["id"], "signal_type": "connection"} for p in mixed_profiles[::7]
+            ]
+            for target in mixed_profiles
+        }
+        generator._transcripts_by_profile = {p["id"]: {"t1"} for p in mixed_profiles[::3]}
+        generator._conversation_data_loaded = True
+
+        assert_pruned_matches_unpruned(monkeypatch, generator, mixed_profiles)
+
+
+class StubDirectoryService:
+    """DirectoryService stand-in serving fixed profiles and recording saved matches"""
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.saved = []
+
+    def get_profiles(self, limit=100, **kwargs):
+        return {"success": True, "data": self.profiles[:limit], "count": len(self.profiles)}
+
+    def create_match_suggestions(self, rows):
+        self.saved.extend(rows)
+        return {"success": True, "created": len(rows)}
+
+    def get_dismissed_profile_ids_bulk(self, profile_ids):
+        return {}
+
+
+def run_keyword_matches(generator, profiles):
+    """generator.generate_all_matches over profiles; the saved rows as tuples"""
+    generator.directory_service = StubDirectoryService(profiles)
+    generator.generate_all_matches(top_n=5, min_score=10.0)
+    return [
+        (row["profile_id"], row["suggested_profile_id"], row["match_score"], row["match_reason"])
+        for row in generator.directory_service.saved
+    ]
+
+
+def keyword_generator(monkeypatch, cache_path, profiles):
+    """
+    MatchGenerator with its own keyword signal cache, warmed by one run over
+    profiles (reason wording follows keyword order, which differs between
+    freshly tokenized and cached signals)
+    """
+    generator = offline_generator(MatchGenerator, monkeypatch)
+    generator.SIGNAL_CACHE_PATH = str(cache_path)
+    run_keyword_matches(generator, profiles)
+    return generator
+
+
+def count_in_process_chunks(monkeypatch, name):
+    """Count calls to match_generator.<name> made in this process"""
+    calls = []
+    score = getattr(match_generator, name)
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return score(*args, **kwargs)
+
+    monkeypatch.setattr(match_generator, name, counted)
+    return calls
+
+
+class TestKeywordProcessPool:
+    """The forked pool path must save exactly what in-process scoring saves"""
+
+    def test_pool_matches_in_process(self, monkeypatch, tmp_path, profiles):
+        """Chunks scored by pool workers give the in-process matches, in order"""
+        generator = keyword_generator(monkeypatch, tmp_path / "signals.json", profiles)
+        expected = run_keyword_matches(generator, profiles)
+        assert expected
+
+        monkeypatch.setattr(MatchGenerator, "PARALLEL_MIN_TARGETS", 1)
+        monkeypatch.setattr(MatchGenerator, "PARALLEL_CHUNK_SIZE", 7)
+        monkeypatch.setattr(os, "cpu_count", lambda: 3)
+        in_process = count_in_process_chunks(monkeypatch, "_score_keyword_targets")
+
+        assert run_keyword_matches(generator, profiles) == expected
+        # Workers did the scoring, and the run state never reached this process
+        assert not in_process
+        assert not match_generator._KEYWORD_POOL_STATE
+
+    def test_concurrent_runs_keep_their_own_profiles(self, monkeypatch, tmp_path, profiles):
+        """Two generators scoring at once don't see each other's run"""
+        halves = [profiles[:60], profiles[60:]]
+        generators = [
+            keyword_generator(monkeypatch, tmp_path / f"signals{i}.json", half)
+            for i, half in enumerate(halves)
+        ]
+        expected = [run_keyword_matches(g, half) for g, half in zip(generators, halves)]
+
+        # Both runs start scoring before either moves past its first chunk
+        monkeypatch.setattr(MatchGenerator, "PARALLEL_CHUNK_SIZE", 7)
+        barrier = threading.Barrier(2, timeout=10)
+        for generator in generators:
+            generate = generator._generate_matches_from_signals
+            started = threading.Event()
+
+            def wait_then_generate(*args, generate=generate, started=started, **kwargs):
+                if not started.is_set():
+                    started.set()
+                    barrier.wait()
+                return generate(*args, **kwargs)
+
+            monkeypatch.setattr(generator, "_generate_matches_from_signals", wait_then_generate)
+
+        results = [None, None]
+
+        def run(i):
+            results[i] = run_keyword_matches(generators[i], halves[i])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == expected
+        for half, matches in zip(halves, expected):
+            ids = {p["id"] for p in half}
+            assert matches and all(row[0] in ids and row[1] in ids for row in matches)
+
+
+class TestHybridProcessPool:
+    """Both forked pool paths must yield exactly the in-process matches"""
+
+    def hybrid_run(self, generator, targets, profiles):
+        """generate_all_matches' run tuple, top 5 above 15"""
+        matrix = generator._build_embedding_matrix(profiles)
+        return (generator, targets, profiles, matrix, {}, 5, 15.0)
+
+    def assert_pool_matches_in_process(self, monkeypatch, generator, run):
+        expected = list(generator._iter_target_results(run, allow_processes=False))
+        assert any(expected)
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 3)
+        in_process = count_in_process_chunks(monkeypatch, "_score_hybrid_targets")
+
+        assert list(generator._iter_target_results(run)) == expected
+        # Workers did the scoring, and the run state never reached this process
+        assert not in_process
+        assert not match_generator._HYBRID_POOL_STATE
+
+    def test_target_chunks(self, monkeypatch, generator, mixed_profiles):
+        """Targets split into chunks across workers"""
+        monkeypatch.setattr(HybridMatchGenerator, "PARALLEL_MIN_TARGETS", 1)
+        monkeypatch.setattr(HybridMatchGenerator, "PARALLEL_CHUNK_SIZE", 9)
+        run = self.hybrid_run(generator, mixed_profiles[:40], mixed_profiles)
+        self.assert_pool_matches_in_process(monkeypatch, generator, run)
+
+    def test_candidate_slices(self, monkeypatch, generator, mixed_profiles):
+        """Fewer targets than cores: candidates split into slices across workers"""
+        monkeypatch.setattr(HybridMatchGenerator, "PARALLEL_MIN_CANDIDATES", 1)
+        run = self.hybrid_run(generator, mixed_profiles[:2], mixed_profiles)
+        self.assert_pool_matches_in_process(monkeypatch, generator, run)
@@ -0,0 +1,118 @@
+"""
+Tests for matching extracted profiles to existing ones
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import profile_extractor
+from profile_extractor import AIProfileExtractor
+
+
+class StubDirectoryService:
+    """DirectoryService stand-in serving a fixed profile list"""
+
+    def __init__(self, profiles, lookup_available=True):
+        self.profiles = profiles
+        self.lookup_available = lookup_available
+        self.get_profiles_calls = 0
+
+    def get_profiles(self, limit=100, **kwargs):
+        self.get_profiles_calls += 1
+        profiles = sorted(self.profiles, key=lambda p: p["name"])[:limit]
+        return {"success": True, "data": profiles, "count": len(profiles)}
+
+    def find_profiles_for_matching(self, normalized_name, email=""):
+        if not self.lookup_available:
+            return {"success": False, "error": "function missing", "data": []}
+        rows = [
+            p for p in self.profiles
+            if (email and (p.get("email") or "").lower() == email.lower())
+            or " ".join(p["name"].lower().split()) == normalized_name
+        ]
+        return {"success": True, "data": sorted(rows, key=lambda p: p["name"])}
+
+    def match_profiles_by_name(self, normalized_name, min_similarity=0.2, limit=50):
+        return {"success": False, "error": "function missing", "data": []}
+
+
+def make_profiles(count):
+    """count profiles with distinct names and emails"""
+    return [
+        {
+            "id": f"id-{i:04d}",
+            "name": f"Member {i:04d}",
+            "company": f"Company {i}",
+            "email": f"member{i}@example.com",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def make_extractor(monkeypatch):
+    """Build an AIProfileExtractor backed by a StubDirectoryService"""
+    monkeypatch.setattr(profile_extractor, "get_admin_client", lambda: None)
+
+    def build(directory_service):
+        monkeypatch.setattr(profile_extractor, "DirectoryService", lambda use_admin=False: directory_service)
+        return AIProfileExtractor(api_key="test-key")
+
+    return build
+
+
+class TestFindMatchingProfile:
+    """Test confidence-based profile matching"""
+
+    @pytest.mark.parametrize("lookup_available", [True, False])
+    def test_email_match_among_many_profiles(self, make_extractor, lookup_available):
+        """An email match is found wherever the profile sits in the directory"""
+        profiles = make_profiles(600)
+        directory = StubDirectoryService(profiles, lookup_available=lookup_available)
+        extractor = make_extractor(directory)
+
+        result = extractor.find_matching_profile({
+            "name": "Someone Else",
+            "email": "MEMBER457@Example.com",
+        })
+
+        assert result["action"] == "update"
+        assert result["profile_id"] == "id-0457"
+        assert result["confidence"] == 100.0
+        assert result["match_details"]["strategy"] == "email_match"
+
+    def test_email_match_skips_directory_scan(self, make_extractor):
+        """With the indexed lookup, exact matches don't fetch the directory"""
+        directory = StubDirectoryService(make_profiles(600))
+        extractor = make_extractor(directory)
+
+        result = extractor.find_matching_profile({"name": "X", "email": "member12@example.com"})
+
+        assert result["profile_id"] == "id-0012"
+        assert directory.get_profiles_calls == 0
+
+    def test_name_and_company_match(self, make_extractor):
+        """Same name plus a matching company beats a name-only match"""
+        profiles = make_profiles(50) + [
+            {"id": "dup-a", "name": "Jane  Doe", "company": "Acme", "email": None},
+            {"id": "dup-b", "name": "jane doe", "company": "Other Co", "email": None},
+        ]
+        extractor = make_extractor(StubDirectoryService(profiles))
+
+        result = extractor.find_matching_profile({"name": "Jane Doe", "company": "other"})
+
+        assert result["profile_id"] == "dup-b"
+        assert result["confidence"] == 90.0
+
+    def test_no_match_suggests_create(self, make_extractor):
+        """A name nothing resembles leads to a new profile"""
+        extractor = make_extractor(StubDirectoryService(make_profiles(20)))
+
+        result = extractor.find_matching_profile({"name": "Quentin Zebulon"})
+
+        assert result["action"] == "create"
+        assert result["profile_id"] is None